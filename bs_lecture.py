@@ -8,7 +8,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import os
 import json
-import re
+from region_index import category_from_address
+from csv_encoding import read_csv
 
 class BusanEducationCrawler:
     def __init__(self, headless=True, checkpoint_file="busan_education_checkpoint.json"):
@@ -106,18 +107,9 @@ class BusanEducationCrawler:
         }
     
     def extract_category_from_address(self, address):
-        """Extract district (구) from address"""
+        """Extract district (구/군) from address using the shared region index"""
         try:
-            # Find pattern like "XX구" in the address
-            match = re.search(r'(\w+구)', address)
-            if match:
-                return match.group(1)
-            else:
-                # If no district found, return second word
-                parts = address.split()
-                if len(parts) >= 2:
-                    return parts[1]
-                return "Not found"
+            return category_from_address(address, default_sido='부산광역시')
         except:
             return "Not found"
     
@@ -341,7 +333,7 @@ class BusanEducationCrawler:
         if file_exists:
             try:
                 # Read existing CSV
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 
                 # Append new data
                 df_combined = pd.concat([df_existing, df_new], ignore_index=True)
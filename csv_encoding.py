@@ -0,0 +1,101 @@
+import codecs
+import os
+
+import pandas as pd
+
+# 판별 순서 - cp949 는 euc-kr 의 상위 집합이라 euc-kr 은 마지막 대안
+ENCODINGS = ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr']
+# 모든 CSV 를 이 인코딩으로 맞춤 (엑셀에서도 한글이 깨지지 않음)
+CANONICAL_ENCODING = 'utf-8-sig'
+# 인코딩 판별에 읽는 앞부분 크기
+SNIFF_BYTES = 64 * 1024
+
+# 경로 → (mtime, size, encoding)
+_encoding_cache = {}
+
+
+def sniff_bytes(data, final=True):
+    """바이트 샘플의 인코딩 추정 (final=False 면 끝이 잘린 멀티바이트 문자를 허용)"""
+    if data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in ENCODINGS[1:]:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(data, final=final)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("Could not detect CSV encoding")
+
+
+def detect_encoding(path):
+    """파일 앞부분만 읽어 인코딩을 판별하고 경로+mtime 기준으로 캐시"""
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    cached = _encoding_cache.get(key)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        return cached[2]
+
+    with open(path, 'rb') as f:
+        sample = f.read(SNIFF_BYTES)
+    encoding = sniff_bytes(sample, final=len(sample) < SNIFF_BYTES)
+    _encoding_cache[key] = (stat.st_mtime, stat.st_size, encoding)
+    return encoding
+
+
+def _sniff_whole_file(path):
+    """앞부분만 보고 잘못 판별한 경우 파일 전체로 다시 판별"""
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        encoding = sniff_bytes(f.read())
+    _encoding_cache[os.path.abspath(path)] = (stat.st_mtime, stat.st_size, encoding)
+    return encoding
+
+
+def _transcode(path, encoding):
+    temp_file = path + ".tmp"
+    try:
+        with open(path, 'r', encoding=encoding, newline='') as source, \
+                open(temp_file, 'w', encoding=CANONICAL_ENCODING, newline='') as target:
+            for chunk in iter(lambda: source.read(1024 * 1024), ''):
+                target.write(chunk)
+    except UnicodeDecodeError:
+        os.remove(temp_file)
+        raise
+    os.replace(temp_file, path)
+
+
+def ensure_canonical(path):
+    """
+    Transcode a CSV to the canonical encoding in place
+
+    Later readers then never need to guess again. Returns the encoding the
+    file had before. The file is replaced, so only use this on files no
+    crawler is appending to (e.g. from a one-off cleanup); live crawler
+    output is read in its own encoding instead.
+    """
+    encoding = detect_encoding(path)
+    if encoding == CANONICAL_ENCODING:
+        return encoding
+
+    try:
+        _transcode(path, encoding)
+    except UnicodeDecodeError:
+        encoding = _sniff_whole_file(path)
+        if encoding == CANONICAL_ENCODING:
+            return encoding
+        _transcode(path, encoding)
+
+    stat = os.stat(path)
+    _encoding_cache[os.path.abspath(path)] = (stat.st_mtime, stat.st_size, CANONICAL_ENCODING)
+    print(f"Converted {path} from {encoding} to {CANONICAL_ENCODING}")
+    return encoding
+
+
+def read_csv(path, canonicalize=False, **kwargs):
+    """pd.read_csv with the detected (cached) encoding"""
+    if canonicalize:
+        ensure_canonical(path)
+    try:
+        return pd.read_csv(path, encoding=detect_encoding(path), **kwargs)
+    except UnicodeDecodeError:
+        return pd.read_csv(path, encoding=_sniff_whole_file(path), **kwargs)
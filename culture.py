@@ -9,6 +9,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import os
 import json
+from csv_encoding import read_csv
 
 class CulturalLecturesCrawler:
     def __init__(self, headless=True, checkpoint_file="cultural_lectures_checkpoint.json"):
@@ -321,7 +322,7 @@ class CulturalLecturesCrawler:
         if file_exists:
             try:
                 # Read existing CSV
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 
                 # Check if Tel column exists in existing data
                 if 'Tel' not in df_existing.columns:
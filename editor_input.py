@@ -0,0 +1,130 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+
+# 스마트에디터 ONE 제목/본문 문단 (앞에서부터 시도)
+TITLE_SELECTORS = [
+    ".se-documentTitle .se-text-paragraph",
+    ".se-title-text .se-text-paragraph",
+    ".se-documentTitle [contenteditable='true']",
+]
+BODY_SELECTORS = [
+    ".se-component.se-text .se-text-paragraph",
+    ".se-main-container .se-text-paragraph",
+]
+TITLE_PLACEHOLDER_XPATH = "//span[contains(@class, 'se-placeholder') and contains(text(), '제목')]"
+BODY_PLACEHOLDER_XPATH = "//span[contains(@class, 'se-placeholder') and contains(text(), '나만의 일상을')]"
+
+# 문단 끝에 커서를 두고 에디터에 포커스 (클릭/키 입력 없이)
+FOCUS_SCRIPT = """
+var node = arguments[0];
+var paragraph = node.closest('.se-text-paragraph') || node.querySelector('.se-text-paragraph') || node;
+var editable = paragraph.closest('[contenteditable="true"]') || paragraph;
+editable.focus();
+var range = document.createRange();
+range.selectNodeContents(paragraph);
+range.collapse(false);
+var selection = window.getSelection();
+selection.removeAllRanges();
+selection.addRange(range);
+return true;
+"""
+
+# 클립보드 없이 붙여넣기 이벤트를 보냄 - 에디터가 처리하면 preventDefault 되므로
+# 처리되지 않았을 때만 execCommand('insertHTML') 로 직접 넣음
+PASTE_HTML_SCRIPT = """
+var target = document.activeElement || arguments[0];
+var data = new DataTransfer();
+data.setData('text/html', arguments[1]);
+data.setData('text/plain', arguments[2]);
+var event = new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true});
+if (!target.dispatchEvent(event)) {
+    return 'paste-event';
+}
+document.execCommand('insertHTML', false, arguments[1]);
+return 'insertHTML';
+"""
+
+TEXT_CONTENT_SCRIPT = "return (arguments[0].closest('[contenteditable=\"true\"]') || arguments[0]).textContent;"
+HTML_TO_TEXT_SCRIPT = "var div = document.createElement('div'); div.innerHTML = arguments[0]; return div.textContent;"
+
+
+class EditorInput:
+    """
+    Type into the Naver editor without the system clipboard
+
+    Plain text goes through the CDP Input.insertText command and HTML through
+    a synthetic paste event, so posting works headless and in several browser
+    contexts at once. Fixed sleeps are replaced by waiting until the text
+    actually shows up in the editor.
+    """
+
+    def __init__(self, driver, timeout=5):
+        self.driver = driver
+        self.timeout = timeout
+
+    def find(self, selectors, placeholder_xpath=None):
+        """First visible element for the selectors (or the placeholder span)"""
+        for selector in selectors:
+            for element in self.driver.find_elements(By.CSS_SELECTOR, selector):
+                if element.is_displayed():
+                    return element
+        if placeholder_xpath:
+            elements = self.driver.find_elements(By.XPATH, placeholder_xpath)
+            if elements:
+                return elements[0]
+        return None
+
+    def focus(self, element):
+        self.driver.execute_script(FOCUS_SCRIPT, element)
+
+    def insert_text(self, text, element=None):
+        """Insert text at the cursor via CDP (falls back to WebDriver key events)"""
+        try:
+            self.driver.execute_cdp_cmd('Input.insertText', {'text': text})
+        except (AttributeError, WebDriverException):
+            # CDP 를 지원하지 않는 드라이버
+            (element or self.driver.switch_to.active_element).send_keys(text)
+
+    def insert_html(self, element, html):
+        text = self.driver.execute_script(HTML_TO_TEXT_SCRIPT, html)
+        return self.driver.execute_script(PASTE_HTML_SCRIPT, element, html, text)
+
+    def wait_for_text(self, element, text):
+        """Wait until the editable area around element contains text"""
+        probe = text.strip()[:20]
+        if not probe:
+            return True
+        try:
+            WebDriverWait(self.driver, self.timeout).until(
+                lambda d: probe in (d.execute_script(TEXT_CONTENT_SCRIPT, element) or '')
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def fill_title(self, title):
+        element = self.find(TITLE_SELECTORS, TITLE_PLACEHOLDER_XPATH)
+        if element is None:
+            return False
+        self.focus(element)
+        self.insert_text(title, element)
+        return self.wait_for_text(element, title)
+
+    def fill_body(self, html):
+        element = self.find(BODY_SELECTORS, BODY_PLACEHOLDER_XPATH)
+        if element is None:
+            return False
+        self.focus(element)
+        method = self.insert_html(element, html)
+        print(f"Body inserted ({method})")
+        text = self.driver.execute_script(HTML_TO_TEXT_SCRIPT, html)
+        return self.wait_for_text(element, text)
+
+    def add_tags(self, tag_input, tags):
+        """Type each tag into the tag input and confirm it with Enter"""
+        for tag in tags:
+            self.driver.execute_script("arguments[0].focus();", tag_input)
+            self.insert_text(tag, tag_input)
+            tag_input.send_keys(Keys.ENTER)
@@ -0,0 +1,258 @@
+import argparse
+import json
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+# 로컬 스텁 - 네이버 로그인 페이지와 스마트에디터 ONE 글쓰기 화면의 DOM 구조만 흉내냄
+# (posting2.py 의 선택자가 그대로 동작하도록 같은 클래스명/중첩 구조를 사용)
+LOGIN_PATH = "/nidlogin.login"
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>로그인</title></head>
+<body>
+<form id="frmNIDLogin" onsubmit="return false;">
+  <input type="text" id="id" name="id">
+  <input type="password" id="pw" name="pw">
+  <button type="button" id="log.login">로그인</button>
+</form>
+<script>
+document.getElementById('log.login').addEventListener('click', function () {
+  if (!document.getElementById('id').value) { return; }
+  document.cookie = 'NID_AUT=stub; path=/';
+  document.cookie = 'NID_SES=stub; path=/';
+  setTimeout(function () { location.href = '/'; }, %(login_delay)d);
+});
+</script>
+</body></html>
+"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>NAVER</title></head><body><h1>stub home</h1></body></html>
+"""
+
+EDITOR_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>글쓰기</title>
+<style>
+.hidden { display: none; }
+.se-text-paragraph { min-height: 1em; }
+</style></head>
+<body>
+<div id="root">
+ <div>
+  <div class="header__Ceaap">
+   <div>
+    <div class="publish_btn_area__KjA2i">
+     <div></div>
+     <div>
+      <button class="publish_btn__m9KHH" type="button">발행</button>
+      <div id="publish-layer" class="hidden">
+       <div>
+        <div>
+         <div class="option_category___kpJc">
+          <div>
+           <div>
+            <button id="category-button" type="button">카테고리</button>
+            <div></div>
+            <div id="category-list" class="hidden">
+             <div>
+              <ul>
+               <li><span><label data-category="1">게시판</label></span></li>
+               <li><span><label data-category="2">일상</label></span></li>
+               <li><span><label data-category="3">일자리</label></span></li>
+               <li><span><label data-category="4">복지시설</label></span></li>
+               <li><span><label data-category="5">문화프로그램</label></span></li>
+              </ul>
+             </div>
+            </div>
+           </div>
+          </div>
+         </div>
+         <div class="tag_area"><input id="tag-input" type="text"><div id="tag-list"></div></div>
+         <div class="layer_btn_area__UzyKH"><div><button id="final-publish" type="button">발행</button></div></div>
+        </div>
+       </div>
+      </div>
+     </div>
+    </div>
+   </div>
+  </div>
+ </div>
+</div>
+<div id="SE-stub-editor">
+ <div class="se-wrap se-dnd-wrap">
+  <div contenteditable="true" class="se-content">
+   <div class="se-component se-documentTitle"><p class="se-text-paragraph"></p></div>
+   <div class="se-main-container">
+    <div class="se-component se-text"><p class="se-text-paragraph"></p></div>
+   </div>
+  </div>
+ </div>
+</div>
+<script>
+var category = null;
+var tags = [];
+var body = document.querySelector('.se-main-container .se-text-paragraph');
+
+// 스마트에디터처럼 붙여넣기 이벤트의 HTML 을 직접 처리
+document.querySelector('.se-content').addEventListener('paste', function (event) {
+  var html = event.clipboardData && event.clipboardData.getData('text/html');
+  if (!html) { return; }
+  event.preventDefault();
+  body.innerHTML += html;
+});
+window.onbeforeunload = function () { return '작성 중인 글이 있습니다.'; };
+
+document.querySelector('.publish_btn__m9KHH').addEventListener('click', function () {
+  setTimeout(function () { document.getElementById('publish-layer').classList.remove('hidden'); }, %(layer_delay)d);
+});
+document.getElementById('category-button').addEventListener('click', function () {
+  document.getElementById('category-list').classList.remove('hidden');
+});
+document.querySelectorAll('#category-list label').forEach(function (label) {
+  label.addEventListener('click', function () {
+    category = label.getAttribute('data-category');
+    document.getElementById('category-list').classList.add('hidden');
+  });
+});
+document.getElementById('tag-input').addEventListener('keydown', function (event) {
+  if (event.key !== 'Enter') { return; }
+  var input = event.target;
+  if (input.value.trim()) {
+    tags.push(input.value.trim());
+    var chip = document.createElement('span');
+    chip.textContent = '#' + input.value.trim();
+    document.getElementById('tag-list').appendChild(chip);
+  }
+  input.value = '';
+});
+document.getElementById('final-publish').addEventListener('click', function () {
+  var request = new XMLHttpRequest();
+  request.open('POST', '/api/publish');
+  request.setRequestHeader('Content-Type', 'application/json');
+  request.onload = function () {
+    window.onbeforeunload = null;
+    location.href = location.pathname.replace('postwrite', 'postview');
+  };
+  request.send(JSON.stringify({
+    title: document.querySelector('.se-documentTitle .se-text-paragraph').textContent,
+    body: body.innerHTML,
+    category: category,
+    tags: tags
+  }));
+});
+</script>
+</body></html>
+"""
+
+POSTVIEW_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>발행 완료</title></head><body><p>published</p></body></html>
+"""
+
+
+class StubEditorServer:
+    """
+    Local HTTP server standing in for the Naver login page and blog editor
+
+    Published posts are kept in self.posts so a benchmark can check that
+    every post actually arrived. layer_delay/login_delay add artificial
+    latency (in ms) to the publish layer and the login redirect.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, layer_delay=0, login_delay=0):
+        self.posts = []
+        self.lock = threading.Lock()
+        self.pages = {
+            'login': LOGIN_PAGE % {'login_delay': login_delay},
+            'editor': EDITOR_PAGE % {'layer_delay': layer_delay},
+        }
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self):
+        return self.base_url + LOGIN_PATH
+
+    def editor_url(self, blog_id='{blog_id}'):
+        return f"{self.base_url}/{blog_id}/postwrite"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body, content_type='text/html; charset=utf-8', headers=None):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _logged_in(self):
+                cookie = SimpleCookie(self.headers.get('Cookie', ''))
+                return 'NID_AUT' in cookie and 'NID_SES' in cookie
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path == LOGIN_PATH:
+                    self._send(200, server.pages['login'])
+                elif path == '/':
+                    self._send(200, HOME_PAGE)
+                elif path.endswith('/postwrite'):
+                    if not self._logged_in():
+                        self._send(302, '', headers={'Location': LOGIN_PATH})
+                    else:
+                        self._send(200, server.pages['editor'])
+                elif path.endswith('/postview'):
+                    self._send(200, POSTVIEW_PAGE)
+                else:
+                    self._send(404, 'not found', 'text/plain; charset=utf-8')
+
+            def do_POST(self):
+                if urlparse(self.path).path != '/api/publish':
+                    self._send(404, 'not found', 'text/plain; charset=utf-8')
+                    return
+                length = int(self.headers.get('Content-Length', 0))
+                post = json.loads(self.rfile.read(length).decode('utf-8'))
+                post['received_at'] = time.time()
+                with server.lock:
+                    server.posts.append(post)
+                self._send(200, json.dumps({'ok': True}), 'application/json')
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the Naver login page and blog editor")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--layer-delay', type=int, default=0, help='ms before the publish layer opens')
+    args = parser.parse_args()
+
+    stub = StubEditorServer(port=args.port, layer_delay=args.layer_delay)
+    print(f"Login page: {stub.login_url}")
+    print(f"Editor:     {stub.editor_url('myblog')}")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
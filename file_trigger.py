@@ -0,0 +1,136 @@
+import fnmatch
+import os
+import threading
+import time
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # watchdog 이 없으면 디렉터리 stat 폴링으로 대체
+    FileSystemEventHandler = object
+    Observer = None
+
+# 크롤러가 마지막으로 쓴 뒤 이 시간(초) 동안 변화가 없으면 쓰기가 끝난 것으로 봄
+DEFAULT_DEBOUNCE = 10
+# watchdog 이 없을 때 디렉터리를 훑는 간격 (파일 내용은 읽지 않고 stat 만 비교)
+DEFAULT_SCAN_INTERVAL = 5
+
+
+class _CsvEventHandler(FileSystemEventHandler):
+    def __init__(self, trigger):
+        self.trigger = trigger
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        # 임시 파일을 os.replace 로 바꾸는 경우 dest_path 가 CSV
+        for path in (getattr(event, 'dest_path', None), event.src_path):
+            if path and self.trigger.matches(path):
+                self.trigger.notify(path)
+
+
+class ChangeTrigger:
+    """
+    Wake up when CSV files in the watched directories change
+
+    Uses inotify (through watchdog) when it is installed, otherwise a cheap
+    os.stat scan of the directories. wait() returns once the changed files
+    have been quiet for `debounce` seconds, so a crawler that writes a file
+    several times in a row only causes one wake-up, or after `timeout`
+    seconds as a fallback poll.
+    """
+
+    def __init__(self, directories, patterns=('*.csv',), debounce=DEFAULT_DEBOUNCE,
+                 scan_interval=DEFAULT_SCAN_INTERVAL):
+        self.directories = [d for d in dict.fromkeys(os.path.abspath(d) for d in directories)
+                            if os.path.isdir(d)]
+        self.patterns = patterns
+        self.debounce = debounce
+        self.scan_interval = scan_interval
+
+        self.condition = threading.Condition()
+        self.changed = set()
+        self.last_event = 0.0
+
+        self.observer = None
+        self.snapshot = {}
+        if Observer is not None:
+            self.observer = Observer()
+            handler = _CsvEventHandler(self)
+            for directory in self.directories:
+                self.observer.schedule(handler, directory, recursive=False)
+            self.observer.start()
+            print(f"Watching {len(self.directories)} directories for CSV changes (inotify)")
+        else:
+            self.snapshot = self._scan()
+            print(f"Watching {len(self.directories)} directories for CSV changes "
+                  f"(polling every {scan_interval}s, install watchdog for inotify)")
+
+    def matches(self, path):
+        name = os.path.basename(path)
+        if name.startswith('~$'):
+            return False
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def notify(self, path):
+        """Record a change (called from the watchdog thread)"""
+        with self.condition:
+            self.changed.add(os.path.relpath(path))
+            self.last_event = time.monotonic()
+            self.condition.notify_all()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file() and self.matches(entry.name):
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_size, stat.st_mtime)
+        return snapshot
+
+    def _poll(self):
+        snapshot = self._scan()
+        for path, signature in snapshot.items():
+            if self.snapshot.get(path) != signature:
+                self.notify(path)
+        self.snapshot = snapshot
+
+    def wait(self, timeout):
+        """
+        Block until watched CSV files changed and settled, or timeout seconds passed
+
+        Returns the set of changed files (empty on a fallback-poll timeout).
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            with self.condition:
+                if self.changed and now - self.last_event >= self.debounce:
+                    changed, self.changed = self.changed, set()
+                    return changed
+                if now >= deadline and not self.changed:
+                    return set()
+
+                if self.changed:
+                    # 마지막 변경 후 debounce 만큼 더 기다림
+                    wait_time = self.debounce - (now - self.last_event)
+                else:
+                    wait_time = deadline - now
+                if self.observer is None:
+                    wait_time = min(wait_time, self.scan_interval)
+                if self.observer is not None:
+                    self.condition.wait(max(wait_time, 0.1))
+
+            if self.observer is None:
+                time.sleep(max(wait_time, 0.1))
+                self._poll()
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
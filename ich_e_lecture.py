@@ -8,6 +8,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import os
 import json
+from csv_encoding import read_csv
 
 class IncheonDongguEducationCrawler:
     def __init__(self, headless=True, checkpoint_file="incheon_donggu_education_checkpoint.json"):
@@ -692,7 +693,7 @@ class IncheonDongguEducationCrawler:
         if file_exists:
             try:
                 # Read existing CSV
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 
                 # Append new data to existing data
                 df_combined = pd.concat([df_existing, df_new], ignore_index=True)
@@ -0,0 +1,211 @@
+import hashlib
+import io
+import os
+from collections import OrderedDict
+
+import pandas as pd
+
+from csv_encoding import detect_encoding, sniff_bytes
+
+# 워터마크 직전 몇 바이트로 파일이 덧붙여졌는지/다시 쓰였는지 판별
+TAIL_BYTES = 256
+
+
+def record_ends(data, start=0, first_only=False):
+    """따옴표 짝이 맞는 줄바꿈 위치 다음 = 완전한 CSV 레코드의 끝
+
+    여러 줄 셀("주5일\\n09:00 ~ 12:00")이 있어도 레코드 단위로 자를 수 있다.
+    '"'와 '\\n'은 utf-8/cp949 멀티바이트 문자 안에 나오지 않으므로 바이트 단위로 센다.
+    크롤러가 쓰는 중이라 끝이 잘린 레코드는 포함하지 않는다.
+    """
+    end = start
+    in_quotes = False
+    position = start
+    while True:
+        newline = data.find(b'\n', position)
+        if newline == -1:
+            break
+        if data.count(b'"', position, newline) % 2:
+            in_quotes = not in_quotes
+        if not in_quotes:
+            end = newline + 1
+            if first_only:
+                break
+        position = newline + 1
+    return end
+
+
+def _tail_hash(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+class IncrementalCsvReader:
+    """
+    Read only the rows appended to a CSV since the last call
+
+    For each file it remembers size, mtime, the byte offset of the last
+    complete record and a hash of the bytes just before that offset (the
+    row-hash watermark). If the watermark still matches, only the bytes after
+    it are parsed; otherwise the file was rewritten and is read in full.
+    """
+
+    def __init__(self, tail_bytes=TAIL_BYTES):
+        self.tail_bytes = tail_bytes
+        self.states = {}
+
+    def _parse(self, header, body, encoding, first_row):
+        """헤더 + 새 레코드 바이트를 DataFrame 으로 (인덱스는 파일 내 행 번호)"""
+        if not body:
+            return pd.DataFrame(columns=pd.read_csv(io.BytesIO(header), encoding=encoding).columns)
+        df = pd.read_csv(io.BytesIO(header + body), encoding=encoding)
+        df.index = range(first_row, first_row + len(df))
+        return df
+
+    def _watermark(self, f, offset):
+        start = max(0, offset - self.tail_bytes)
+        f.seek(start)
+        return _tail_hash(f.read(offset - start))
+
+    def read_new(self, path):
+        """
+        Return (new_rows, reloaded)
+
+        new_rows: DataFrame of rows added since the last call (index = row number)
+        reloaded: True if the whole file was read (first call or file rewritten),
+                  in which case new_rows holds every row
+        """
+        # 크롤러가 덧붙이는 중일 수 있으므로 파일은 다시 쓰지 않고 원래 인코딩 그대로 읽음
+        # ('"'와 '\n'은 cp949 멀티바이트 문자 안에 나오지 않아 레코드 단위로 잘라도 안전)
+        state = self.states.get(path)
+        stat = os.stat(path)
+
+        if state and stat.st_size == state['size'] and stat.st_mtime == state['mtime']:
+            return self._parse(state['header'], b'', state['encoding'], state['rows']), False
+
+        with open(path, 'rb') as f:
+            if state and stat.st_size >= state['offset'] and self._watermark(f, state['offset']) == state['tail_hash']:
+                # 파일 끝에 덧붙여진 부분만 읽음
+                f.seek(state['offset'])
+                appended = f.read()
+                end = record_ends(appended)
+                df = self._parse(state['header'], appended[:end], state['encoding'], state['rows'])
+
+                state['offset'] += end
+                state['rows'] += len(df)
+                state['tail_hash'] = self._watermark(f, state['offset'])
+                state['size'] = stat.st_size
+                state['mtime'] = stat.st_mtime
+                return df, False
+
+            # 처음 읽거나 파일이 다시 쓰인 경우 전체를 읽음
+            data = f.read()
+
+        encoding = detect_encoding(path)
+        header_end = record_ends(data, first_only=True)
+        end = record_ends(data, header_end)
+        header = data[:header_end]
+        try:
+            df = self._parse(header, data[header_end:end], encoding, 0)
+        except UnicodeDecodeError:
+            # 앞부분만 보고 잘못 판별한 경우 읽은 전체 내용으로 다시 판별
+            encoding = sniff_bytes(data[:end])
+            df = self._parse(header, data[header_end:end], encoding, 0)
+
+        self.states[path] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'offset': end,
+            'tail_hash': _tail_hash(data[max(0, end - self.tail_bytes):end]),
+            'rows': len(df),
+            'header': header,
+            'encoding': encoding,
+        }
+        return df, True
+
+    def acknowledge(self, path, total_rows):
+        """
+        Accept our own rewrite of the file (e.g. setting a Post cell)
+
+        If the rewritten file has the same rows we already know about, the
+        watermark is moved to the new end of file so the rewrite does not
+        trigger a full reload. If rows were appended meanwhile, forget the
+        state so the next read_new picks them up with a full read.
+        """
+        state = self.states.get(path)
+        if not state:
+            return
+        if total_rows != state['rows']:
+            del self.states[path]
+            return
+        # 다시 쓰면서 인코딩/헤더가 바뀌었을 수 있으므로 함께 갱신
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        header_end = record_ends(data, first_only=True)
+        end = record_ends(data, header_end)
+        state['encoding'] = detect_encoding(path)
+        state['header'] = data[:header_end]
+        state['offset'] = end
+        state['tail_hash'] = _tail_hash(data[max(0, end - self.tail_bytes):end])
+        state['size'] = stat.st_size
+        state['mtime'] = stat.st_mtime
+
+    def forget(self, path):
+        self.states.pop(path, None)
+
+
+class NewItemDetector:
+    """
+    Keep a queue of unposted rows per CSV file, updated from appended rows only
+
+    make_item(row, path, row_index) -> (item_id, item_dict) builds the queue entry and
+    is_posted(item_id, row) decides whether a row is already posted.
+    """
+
+    def __init__(self, make_item, is_posted):
+        self.make_item = make_item
+        self.is_posted = is_posted
+        self.reader = IncrementalCsvReader()
+        self.pending = {}
+
+    def check(self, path):
+        """Return the unposted (item_id, item_dict) list for a file, oldest row first"""
+        self.check_added(path)
+        return list(self.pending[path].values())
+
+    def check_added(self, path):
+        """
+        Update the queue for a file and return only the entries added by this call
+
+        After a full reload every unposted row counts as added, so callers that
+        keep their own index should ignore item IDs they already know.
+        """
+        new_rows, reloaded = self.reader.read_new(path)
+        queue = self.pending.setdefault(path, OrderedDict())
+        if reloaded:
+            queue.clear()
+            print(f"Read all {len(new_rows)} rows from {path}")
+        elif len(new_rows):
+            print(f"Read {len(new_rows)} appended rows from {path}")
+
+        added = []
+        for row_index, row in new_rows.iterrows():
+            item_id, item_dict = self.make_item(row, path, row_index)
+            if not self.is_posted(item_id, row):
+                queue[row_index] = (item_id, item_dict)
+                added.append((item_id, item_dict))
+        return added
+
+    def is_pending(self, path, row_index, item_id):
+        """True if the row is still queued with the same item ID"""
+        entry = self.pending.get(path, {}).get(row_index)
+        return entry is not None and entry[0] == item_id
+
+    def discard(self, path, row_index):
+        """Remove a row from the queue after it was posted"""
+        queue = self.pending.get(path)
+        if queue is not None:
+            queue.pop(row_index, None)
+
+    def acknowledge_rewrite(self, path, total_rows):
+        self.reader.acknowledge(path, total_rows)
@@ -12,6 +12,10 @@ import os
 import json
 from datetime import datetime
 from urllib.parse import unquote, quote
+from region_index import category_from_address
+from near_dup import NearDuplicateIndex
+from csv_encoding import read_csv
+from overlay_dismisser import OverlayDismisser
 
 class WorkGoKrCrawler:
     def __init__(self, headless=True, checkpoint_file="crawler_checkpoint.json"):
@@ -46,6 +50,7 @@ class WorkGoKrCrawler:
             self.driver = webdriver.Chrome(options=self.chrome_options)
             self.driver.set_page_load_timeout(30)
             self.wait = WebDriverWait(self.driver, 15)
+            self.overlays = OverlayDismisser('work.go.kr')
             print("Chrome WebDriver 초기화 성공!")
         except Exception as e:
             print(f"Chrome 초기화 실패: {e}")
@@ -98,6 +103,10 @@ class WorkGoKrCrawler:
         # 크롤링한 job 개수 카운터
         self.job_count = 0
         
+        # 근접 중복 공고 검사용 MinHash 인덱스 (이전 크롤링 결과 누적)
+        self.near_dup_index_file = "near_dup_index.npz"
+        self.near_dup_index = NearDuplicateIndex.load(self.near_dup_index_file)
+        
         # 카테고리 매핑을 위한 키워드 딕셔너리
         self.keyword_mapping = {
             # 요양보호사 관련
@@ -323,12 +332,8 @@ class WorkGoKrCrawler:
             address_text = address_element.text.strip()
             self.job_data["Address"] = address_text
             
-            # Category (Address의 두번째 텍스트)
-            address_parts = address_text.split()
-            if len(address_parts) >= 2:
-                self.job_data["Category"] = address_parts[1]
-            else:
-                self.job_data["Category"] = address_text
+            # Category (주소의 시/군/구)
+            self.job_data["Category"] = category_from_address(address_text, default=address_text)
                 
         except NoSuchElementException:
             pass
@@ -497,29 +502,9 @@ class WorkGoKrCrawler:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(2)
             
-            # 팝업이나 모달 닫기 시도
-            try:
-                # 일반적인 팝업 닫기 버튼들 시도
-                close_buttons = [
-                    "button.close", 
-                    "button.btn_close",
-                    "a.close",
-                    ".popup_close",
-                    "[class*='close']",
-                    "[title*='닫기']"
-                ]
-                
-                for selector in close_buttons:
-                    try:
-                        close_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if close_btn.is_displayed():
-                            close_btn.click()
-                            time.sleep(1)
-                            break
-                    except:
-                        continue
-            except:
-                pass
+            # 팝업이나 모달 닫기 (스크립트 한 번, 이 사이트에서 나온 적 있는 패턴만)
+            if self.overlays.dismiss(self.driver):
+                time.sleep(1)
             
             if current_page % 10 == 0:
                 # 11페이지로 가는 버튼 (next 버튼)
@@ -673,6 +658,18 @@ class WorkGoKrCrawler:
         
         df_new = pd.DataFrame(self.jobs)
         
+        # 제목만 조금 바꿔 다시 올린 공고 등 근접 중복 표시 (행은 지우지 않음)
+        # 설명 문구가 같은 다른 공고도 높게 나오므로 DuplicateOf/Similarity 로 표시만 함
+        try:
+            checked = self.near_dup_index.check_new(df_new)
+            duplicates = checked[checked['DuplicateOf'] != '']
+            for _, row in duplicates.iterrows():
+                print(f"Possible near-duplicate: {row['Title']} (similarity {row['Similarity']:.2f})")
+            df_new = checked
+            self.near_dup_index.save(self.near_dup_index_file)
+        except Exception as e:
+            print(f"Error checking near-duplicates: {e}")
+        
         # 카테고리별 통계 출력
         print("\n=== Category Statistics ===")
         category_counts = df_new['JobCategory'].value_counts()
@@ -682,7 +679,7 @@ class WorkGoKrCrawler:
         
         if os.path.isfile(filename):
             try:
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 df_combined = pd.concat([df_existing, df_new], ignore_index=True)
                 df_combined = df_combined.drop_duplicates(subset=['Title', 'CompanyName', 'Deadline'], keep='last')
                 df_combined.to_csv(filename, index=False, encoding='utf-8-sig', lineterminator='\n')
@@ -12,6 +12,9 @@ import os
 import json
 from datetime import datetime
 from urllib.parse import unquote, quote
+from region_index import category_from_address
+from csv_encoding import read_csv
+from overlay_dismisser import OverlayDismisser
 
 class WorkGoKrCrawler:
     def __init__(self, headless=True, checkpoint_file="crawler_checkpoint.json"):
@@ -46,6 +49,7 @@ class WorkGoKrCrawler:
             self.driver = webdriver.Chrome(options=self.chrome_options)
             self.driver.set_page_load_timeout(30)
             self.wait = WebDriverWait(self.driver, 15)
+            self.overlays = OverlayDismisser('work.go.kr')
             print("Chrome WebDriver 초기화 성공!")
         except Exception as e:
             print(f"Chrome 초기화 실패: {e}")
@@ -278,12 +282,8 @@ class WorkGoKrCrawler:
             address_text = address_element.text.strip()
             self.job_data["Address"] = address_text
             
-            # Category (Address의 두번째 텍스트)
-            address_parts = address_text.split()
-            if len(address_parts) >= 2:
-                self.job_data["Category"] = address_parts[1]
-            else:
-                self.job_data["Category"] = address_text
+            # Category (주소의 시/군/구)
+            self.job_data["Category"] = category_from_address(address_text, default=address_text)
                 
         except NoSuchElementException:
             pass
@@ -452,29 +452,9 @@ class WorkGoKrCrawler:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(2)
             
-            # 팝업이나 모달 닫기 시도
-            try:
-                # 일반적인 팝업 닫기 버튼들 시도
-                close_buttons = [
-                    "button.close", 
-                    "button.btn_close",
-                    "a.close",
-                    ".popup_close",
-                    "[class*='close']",
-                    "[title*='닫기']"
-                ]
-                
-                for selector in close_buttons:
-                    try:
-                        close_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if close_btn.is_displayed():
-                            close_btn.click()
-                            time.sleep(1)
-                            break
-                    except:
-                        continue
-            except:
-                pass
+            # 팝업이나 모달 닫기 (스크립트 한 번, 이 사이트에서 나온 적 있는 패턴만)
+            if self.overlays.dismiss(self.driver):
+                time.sleep(1)
             
             if current_page % 10 == 0:
                 # 11페이지로 가는 버튼 (next 버튼)
@@ -645,7 +625,7 @@ class WorkGoKrCrawler:
         
         if os.path.isfile(filename):
             try:
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 df_combined = pd.concat([df_existing, df_new], ignore_index=True)
                 df_combined = df_combined.drop_duplicates(subset=['JobTitle', 'CompanyName', 'Deadline'], keep='last')
                 df_combined.to_csv(filename, index=False, encoding='utf-8-sig', lineterminator='\n')
@@ -0,0 +1,185 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# 급여 문자열 패턴
+# 예) "월급 143만원 이상", "시급 10,030원 ~ 10,030원", "연봉 2,520 만원 ~ 3,000 만원"
+SALARY_PATTERN = re.compile(
+    r'(?P<pay_type>시급|일급|주급|월급|연봉)\s*'
+    r'(?P<min>[\d,]+)\s*(?P<min_unit>만)?\s*원'
+    r'(?:\s*~\s*(?P<max>[\d,]+)\s*(?P<max_unit>만)?\s*원)?'
+)
+
+# 월 환산 계수 (월 소정근로 209시간, 월 평균 21.75일, 월 평균 4.345주 기준)
+MONTHLY_FACTORS = {
+    '시급': 209,
+    '일급': 21.75,
+    '주급': 4.345,
+    '월급': 1,
+    '연봉': 1 / 12,
+}
+
+# 급여 정규화 결과 컬럼
+SALARY_COLUMNS = ['PayType', 'MinWage', 'MaxWage', 'MonthlyWage']
+
+
+def _to_won(amounts, units):
+    """'1,234' 형태의 문자열과 '만' 단위를 원 단위 숫자로 변환"""
+    values = pd.to_numeric(amounts.str.replace(',', '', regex=False), errors='coerce')
+    return values * np.where(units.fillna('') == '만', 10000, 1)
+
+
+def normalize_salary(salary):
+    """Salary 컬럼 전체를 한 번에 파싱해 PayType/MinWage/MaxWage/MonthlyWage 반환
+
+    파싱할 수 없는 값은 PayType 빈 문자열, 금액 NaN 으로 남긴다.
+    '이상'처럼 상한이 없는 경우 MaxWage 는 NaN 이다.
+    """
+    parts = salary.fillna('').astype(str).str.extract(SALARY_PATTERN)
+
+    result = pd.DataFrame(index=salary.index)
+    result['PayType'] = parts['pay_type'].fillna('')
+    result['MinWage'] = _to_won(parts['min'], parts['min_unit'])
+    result['MaxWage'] = _to_won(parts['max'], parts['max_unit'])
+    result['MonthlyWage'] = (result['MinWage'] * result['PayType'].map(MONTHLY_FACTORS)).round()
+    return result
+
+
+def add_salary_columns(df, column='Salary'):
+    """원본 Salary 텍스트는 그대로 두고 숫자 급여 컬럼을 추가"""
+    if column not in df.columns:
+        return df
+    df = df.copy()
+    normalized = normalize_salary(df[column])
+    for name in SALARY_COLUMNS:
+        df[name] = normalized[name]
+    return df
+
+
+# 날짜 패턴 - "2025-07-04", "25/05/28", "2025.07.04" 모두 허용
+DATE_PATTERN = r'(?P<year>\d{4}|\d{2})[-/.](?P<month>\d{1,2})[-/.](?P<day>\d{1,2})'
+# new/ 파일처럼 한 셀에 "25/05/28 등록\n25/06/11 마감"이 같이 들어간 경우의 마감일
+DEADLINE_IN_CELL_PATTERN = DATE_PATTERN + r'\s*마감'
+OPEN_UNTIL_FILLED_PATTERN = re.compile(r'채용시까지|상시')
+# 강좌 접수기간의 "2025년 06월 13일" 형식
+KOREAN_DATE_PATTERN = r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일'
+
+# 날짜 정규화 결과 컬럼
+DATE_COLUMNS = ['RegistrationDate', 'DeadlineDate', 'OpenUntilFilled']
+
+
+def _extract_dates(values, pattern):
+    """문자열 Series에서 첫 번째 날짜를 찾아 datetime64 Series로 변환"""
+    parts = values.str.extract(pattern)
+    year = pd.to_numeric(parts['year'], errors='coerce')
+    year = year.where(year >= 100, year + 2000)
+    return pd.to_datetime(
+        pd.DataFrame({
+            'year': year,
+            'month': pd.to_numeric(parts['month'], errors='coerce'),
+            'day': pd.to_numeric(parts['day'], errors='coerce'),
+        }),
+        errors='coerce',
+    )
+
+
+def parse_job_dates(registration, deadline):
+    """DateOfRegistration / Deadline 컬럼을 한 번에 파싱
+
+    Deadline 셀에 날짜가 없으면 DateOfRegistration 셀의 '마감' 날짜를 사용한다.
+    '채용시까지' 공고는 DeadlineDate 가 NaT 이고 OpenUntilFilled 가 True 이다.
+    """
+    registration = registration.fillna('').astype(str)
+    deadline = deadline.fillna('').astype(str)
+
+    result = pd.DataFrame(index=registration.index)
+    result['RegistrationDate'] = _extract_dates(registration, DATE_PATTERN)
+
+    deadline_date = _extract_dates(deadline, DATE_PATTERN)
+    in_cell = _extract_dates(registration, DEADLINE_IN_CELL_PATTERN)
+    result['DeadlineDate'] = deadline_date.fillna(in_cell)
+
+    result['OpenUntilFilled'] = (
+        deadline.str.contains(OPEN_UNTIL_FILLED_PATTERN) & result['DeadlineDate'].isna()
+    )
+    return result
+
+
+def parse_period_end(values):
+    """'2025-04-28 ~ 2025-05-17' 같은 기간 문자열에서 마지막 날짜 (강좌 접수 마감일)
+
+    '2025년 06월 10일 10시 00분 ~ 2025년 06월 13일' 형식도 허용한다.
+    """
+    values = values.fillna('').astype(str).str.replace(KOREAN_DATE_PATTERN, r'\1-\2-\3', regex=True)
+    # 앞의 .* 가 탐욕적으로 매칭되므로 마지막 날짜가 잡힘
+    return _extract_dates(values, r'(?s:.*)' + DATE_PATTERN)
+
+
+def parse_period_start(values):
+    """기간 문자열의 첫 날짜 (강좌 접수 시작일, 교육 시작일)"""
+    values = values.fillna('').astype(str).str.replace(KOREAN_DATE_PATTERN, r'\1-\2-\3', regex=True)
+    return _extract_dates(values, DATE_PATTERN)
+
+
+def add_date_columns(df, registration_column='DateOfRegistration', deadline_column='Deadline'):
+    """원본 날짜 텍스트는 그대로 두고 datetime64 날짜 컬럼을 추가"""
+    if registration_column not in df.columns or deadline_column not in df.columns:
+        return df
+    df = df.copy()
+    parsed = parse_job_dates(df[registration_column], df[deadline_column])
+    for name in DATE_COLUMNS:
+        df[name] = parsed[name]
+    return df
+
+
+class DeadlineIndex:
+    """마감일 기준으로 정렬된 인덱스
+
+    마감일을 정렬된 배열로 한 번 만들어 두고 '앞으로 N일 내 마감',
+    '마감 지남' 조회를 np.searchsorted 이진 탐색으로 처리한다.
+    """
+
+    def __init__(self, df, deadline_column='DeadlineDate', open_column='OpenUntilFilled'):
+        deadlines = pd.to_datetime(df[deadline_column], errors='coerce')
+        has_deadline = deadlines.notna().to_numpy()
+
+        values = deadlines.to_numpy(dtype='datetime64[ns]')[has_deadline]
+        labels = df.index.to_numpy()[has_deadline]
+        order = np.argsort(values, kind='stable')
+        self.deadlines = values[order]
+        self.labels = labels[order]
+
+        if open_column in df.columns:
+            self.open_labels = df.index[df[open_column].fillna(False).astype(bool)].to_numpy()
+        else:
+            self.open_labels = np.array([], dtype=df.index.dtype)
+
+    def __len__(self):
+        return len(self.deadlines)
+
+    @staticmethod
+    def _day(value=None):
+        """비교 기준일 (시각은 버리고 날짜만 사용)"""
+        return np.datetime64(pd.Timestamp(value or pd.Timestamp.now()).normalize(), 'ns')
+
+    def between(self, start, end):
+        """start <= 마감일 <= end 인 행의 인덱스 라벨 (마감일 순)"""
+        lo = np.searchsorted(self.deadlines, self._day(start), side='left')
+        hi = np.searchsorted(self.deadlines, self._day(end), side='right')
+        return self.labels[lo:hi]
+
+    def expiring_within(self, days, now=None):
+        """오늘부터 N일 안에 마감되는 행 (오늘 마감 포함)"""
+        today = self._day(now)
+        return self.between(today, today + np.timedelta64(days, 'D'))
+
+    def expired(self, now=None):
+        """이미 마감된 행 (마감일 < 오늘)"""
+        hi = np.searchsorted(self.deadlines, self._day(now), side='left')
+        return self.labels[:hi]
+
+    def active(self, now=None):
+        """마감되지 않은 행 (마감일 >= 오늘) - 채용시까지 공고는 제외"""
+        lo = np.searchsorted(self.deadlines, self._day(now), side='left')
+        return self.labels[lo:]
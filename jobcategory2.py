@@ -1,9 +1,6 @@
 import pandas as pd
 import re
 
-# CSV 파일 읽기
-df = pd.read_csv(r"C:\crawler\job_data.csv")
-
 # jobCategories 기반 키워드 매핑 딕셔너리
 keyword_mapping = {
     # 돌봄·간병 종사자
@@ -116,62 +113,106 @@ def update_job_category(row):
     # 기존 값 유지
     return current_category
 
-# 업데이트 전 상태 확인
-print("업데이트 전:")
-print(f"JobCategory가 비어있거나 'Not found'인 행 수: {df[df['JobCategory'].isna() | (df['JobCategory'] == 'Not found') | (df['JobCategory'] == '')].shape[0]}")
-
-# DateOfRegistration과 Deadline 정리
-df['DateOfRegistration'] = df['DateOfRegistration'].apply(clean_date_field)
-df['Deadline'] = df['Deadline'].apply(clean_date_field)
-
-# 모든 "Not found" 값을 공백으로 처리
-for column in df.columns:
-    df[column] = df[column].apply(clean_not_found)
-
-# JobCategory 업데이트
-df['JobCategory'] = df.apply(update_job_category, axis=1)
-
-# 업데이트 후 상태 확인
-print("\n업데이트 후:")
-print(f"JobCategory가 비어있거나 'Not found'인 행 수: {df[df['JobCategory'].isna() | (df['JobCategory'] == 'Not found') | (df['JobCategory'] == '')].shape[0]}")
-
-# 날짜 필드 확인 (처음 10개)
-print("\n날짜 필드 정리 확인:")
-print("DateOfRegistration 샘플:")
-print(df['DateOfRegistration'].head(10))
-print("\nDeadline 샘플:")
-print(df['Deadline'].head(10))
-
-# 업데이트된 예시 확인
-print("\n업데이트된 예시 (처음 20개):")
-updated_rows = df[df['JobCategory'].notna() & (df['JobCategory'] != 'Not found') & (df['JobCategory'] != '')]
-print(updated_rows[['EmploymentType', 'JobCategory', 'DateOfRegistration', 'Deadline']].head(20))
-
-# 카테고리별 개수 확인
-print("\nJobCategory 값별 개수:")
-category_counts = df['JobCategory'].value_counts()
-print(category_counts.head(20))
-
-# jobCategories에 있는 카테고리만 필터링해서 확인
-print("\njobCategories 카테고리별 개수:")
-job_categories_list = list(keyword_mapping.keys())
-for category in job_categories_list:
-    count = category_counts.get(category, 0)
-    print(f"{category}: {count}")
-
-# CSV 파일로 저장
-df.to_csv('job_data_with_updated_category.csv', index=False, encoding='utf-8-sig')
-print("\n'job_data_with_updated_category.csv' 파일로 저장되었습니다.")
-
-# 여전히 카테고리가 없는 EmploymentType 확인 (디버깅용)
-no_category = df[(df['JobCategory'].isna()) | (df['JobCategory'] == 'Not found') | (df['JobCategory'] == '')]
-if not no_category.empty:
-    print("\n카테고리가 할당되지 않은 EmploymentType 예시:")
-    print(no_category['EmploymentType'].value_counts().head(10))
-
-# "Not found" 값이 남아있는지 확인
-print("\n'Not found' 값 확인:")
-for column in df.columns:
-    not_found_count = (df[column] == "Not found").sum()
-    if not_found_count > 0:
-        print(f"{column}: {not_found_count}개의 'Not found' 값이 있습니다.")
\ No newline at end of file
+def compile_keyword_rules(mapping=None):
+    """키워드 매핑을 카테고리별 정규식으로 컴파일하는 함수 (매핑 순서 유지)"""
+    if mapping is None:
+        mapping = all_keyword_mapping
+    return [(category, re.compile('|'.join(re.escape(k) for k in keywords)))
+            for category, keywords in mapping.items()]
+
+def recategorize_frame(df, rules=None):
+    """DataFrame 전체를 한 번에 정리하고 JobCategory를 채우는 함수
+
+    clean_date_field / clean_not_found / update_job_category 를 행 단위로
+    apply 하는 것과 같은 결과를 컬럼 단위 연산으로 만든다.
+    """
+    if rules is None:
+        rules = compile_keyword_rules()
+    df = df.copy()
+
+    # DateOfRegistration과 Deadline 정리
+    for column in ['DateOfRegistration', 'Deadline']:
+        if column in df.columns:
+            df[column] = (df[column].fillna('').astype(str)
+                          .str.replace(r'(?:등록일|마감일) ?: ?', '', regex=True)
+                          .str.strip())
+
+    # 모든 "Not found" 값을 공백으로 처리
+    df = df.astype(object).where(df.notna(), '').replace('Not found', '')
+
+    # JobCategory가 비어있는 행만 EmploymentType 키워드로 채움
+    if 'JobCategory' in df.columns and 'EmploymentType' in df.columns:
+        employment_type = df['EmploymentType'].astype(str).str.lower()
+        unassigned = df['JobCategory'].astype(str) == ''
+        for category, pattern in rules:
+            if not unassigned.any():
+                break
+            matched = unassigned & employment_type.str.contains(pattern)
+            df.loc[matched, 'JobCategory'] = category
+            unassigned &= ~matched
+
+    return df
+
+if __name__ == "__main__":
+    # CSV 파일 읽기
+    df = pd.read_csv(r"C:\crawler\job_data.csv")
+
+    # 업데이트 전 상태 확인
+    print("업데이트 전:")
+    print(f"JobCategory가 비어있거나 'Not found'인 행 수: {df[df['JobCategory'].isna() | (df['JobCategory'] == 'Not found') | (df['JobCategory'] == '')].shape[0]}")
+
+    # DateOfRegistration과 Deadline 정리
+    df['DateOfRegistration'] = df['DateOfRegistration'].apply(clean_date_field)
+    df['Deadline'] = df['Deadline'].apply(clean_date_field)
+
+    # 모든 "Not found" 값을 공백으로 처리
+    for column in df.columns:
+        df[column] = df[column].apply(clean_not_found)
+
+    # JobCategory 업데이트
+    df['JobCategory'] = df.apply(update_job_category, axis=1)
+
+    # 업데이트 후 상태 확인
+    print("\n업데이트 후:")
+    print(f"JobCategory가 비어있거나 'Not found'인 행 수: {df[df['JobCategory'].isna() | (df['JobCategory'] == 'Not found') | (df['JobCategory'] == '')].shape[0]}")
+
+    # 날짜 필드 확인 (처음 10개)
+    print("\n날짜 필드 정리 확인:")
+    print("DateOfRegistration 샘플:")
+    print(df['DateOfRegistration'].head(10))
+    print("\nDeadline 샘플:")
+    print(df['Deadline'].head(10))
+
+    # 업데이트된 예시 확인
+    print("\n업데이트된 예시 (처음 20개):")
+    updated_rows = df[df['JobCategory'].notna() & (df['JobCategory'] != 'Not found') & (df['JobCategory'] != '')]
+    print(updated_rows[['EmploymentType', 'JobCategory', 'DateOfRegistration', 'Deadline']].head(20))
+
+    # 카테고리별 개수 확인
+    print("\nJobCategory 값별 개수:")
+    category_counts = df['JobCategory'].value_counts()
+    print(category_counts.head(20))
+
+    # jobCategories에 있는 카테고리만 필터링해서 확인
+    print("\njobCategories 카테고리별 개수:")
+    job_categories_list = list(keyword_mapping.keys())
+    for category in job_categories_list:
+        count = category_counts.get(category, 0)
+        print(f"{category}: {count}")
+
+    # CSV 파일로 저장
+    df.to_csv('job_data_with_updated_category.csv', index=False, encoding='utf-8-sig')
+    print("\n'job_data_with_updated_category.csv' 파일로 저장되었습니다.")
+
+    # 여전히 카테고리가 없는 EmploymentType 확인 (디버깅용)
+    no_category = df[(df['JobCategory'].isna()) | (df['JobCategory'] == 'Not found') | (df['JobCategory'] == '')]
+    if not no_category.empty:
+        print("\n카테고리가 할당되지 않은 EmploymentType 예시:")
+        print(no_category['EmploymentType'].value_counts().head(10))
+
+    # "Not found" 값이 남아있는지 확인
+    print("\n'Not found' 값 확인:")
+    for column in df.columns:
+        not_found_count = (df[column] == "Not found").sum()
+        if not_found_count > 0:
+            print(f"{column}: {not_found_count}개의 'Not found' 값이 있습니다.")
\ No newline at end of file
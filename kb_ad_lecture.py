@@ -9,6 +9,10 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import os
 import json
 import re
+from csv_encoding import read_csv
+from overlay_dismisser import OverlayDismisser
+
+ANDONG_POPUP_CLOSE = "#layerpopup_mycode > div > div.pop-con > div.btn-box.taC > a.button.icon.del.close.pop-close"
 
 class AndongEducationCrawler:
     def __init__(self, headless=True, checkpoint_file="andong_education_checkpoint.json"):
@@ -35,6 +39,8 @@ class AndongEducationCrawler:
             self.driver = webdriver.Chrome(options=self.chrome_options)
             self.driver.set_page_load_timeout(60)
             self.wait = WebDriverWait(self.driver, 30)
+            # 강좌 팝업의 닫기 버튼을 먼저, 없으면 일반 닫기 버튼
+            self.overlays = OverlayDismisser('andong', patterns=[('andong-layer-close', ANDONG_POPUP_CLOSE, 'click')])
             
             # Structure for lecture data
             self.lecture_data = {
@@ -118,28 +124,12 @@ class AndongEducationCrawler:
     
     def close_popup(self):
         """Close the popup window"""
-        try:
-            close_selector = "#layerpopup_mycode > div > div.pop-con > div.btn-box.taC > a.button.icon.del.close.pop-close"
-            close_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, close_selector))
-            )
-            close_button.click()
+        if self.overlays.dismiss(self.driver):
             time.sleep(1)
             print("Popup closed successfully")
             return True
-        except Exception as e:
-            print(f"Error closing popup: {e}")
-            # Try alternative close methods
-            try:
-                # Try to find any element with class 'close' or 'pop-close'
-                close_elements = self.driver.find_elements(By.CSS_SELECTOR, ".pop-close, .close")
-                if close_elements:
-                    close_elements[0].click()
-                    time.sleep(1)
-                    return True
-            except:
-                pass
-            return False
+        print("No popup to close")
+        return False
     
     def extract_lecture_from_popup(self, item_index):
         """Extract lecture data from popup after clicking item"""
@@ -348,7 +338,7 @@ class AndongEducationCrawler:
         if file_exists:
             try:
                 # Read existing CSV
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 
                 # Append new data
                 df_combined = pd.concat([df_existing, df_new], ignore_index=True)
@@ -9,6 +9,40 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import os
 import json
 import re
+from urllib.parse import parse_qsl, urljoin, urlsplit
+from region_index import category_from_address
+from csv_encoding import read_csv
+from lecture_engine import set_query_param
+
+# 목록의 모든 섹션 - 제목, 상세 링크 속성, 예약 버튼, 각 칸의 HTML 을 한 번에 읽음
+SECTIONS_SCRIPT = """
+const list = document.querySelector('#reserveList');
+if (!list) return [];
+const html = (section, selector) => {
+    const element = section.querySelector(selector);
+    return element ? element.innerHTML : null;
+};
+return Array.from(list.children).map((section, i) => [section, i + 1])
+    .filter(([section]) => section.tagName === 'SECTION')
+    .map(([section, index]) => {
+        const link = section.querySelector(':scope > div > div.right > a');
+        const title = section.querySelector(':scope > div > div.right > h1 > a');
+        const button = section.querySelector(':scope > ul > li > a');
+        return {
+            index: index,
+            button: button ? button.innerText.trim() : '',
+            title: title ? title.innerText.trim() : '',
+            href: link ? link.getAttribute('href') : null,
+            onclick: link ? link.getAttribute('onclick') : null,
+            data: Object.assign({}, list.dataset, section.dataset, link ? link.dataset : {}),
+            recruitment: html(section, ':scope > ul > li > ul > li:nth-child(1)'),
+            education: html(section, ':scope > div > div.right > ul > li:nth-child(3)'),
+            quota: html(section, ':scope > ul > li > ul > li:nth-child(2) > p'),
+            institution: html(section, ':scope > div > div.right > ul > li:nth-child(2)'),
+            address: html(section, ':scope > div > div.right > ul > li:nth-child(4)'),
+        };
+    });
+"""
 
 class SangjuEducationCrawler:
     def __init__(self, headless=True, checkpoint_file="sangju_education_checkpoint.json"):
@@ -52,6 +86,9 @@ class SangjuEducationCrawler:
             # Storage for collected lectures
             self.lectures = []
             self.current_id = 1
+            # javascript: 상세 링크 → 상세 주소 (두 번 클릭해서 알아냄)
+            self.detail_template = None
+            self.detail_sample = None
             
             # Checkpoint configuration
             self.checkpoint_file = checkpoint_file
@@ -100,22 +137,11 @@ class SangjuEducationCrawler:
         }
     
     def extract_category_from_address(self, address):
-        """Extract district (구) or city/county from address"""
+        """Extract city/county (시/군/구) from address using the shared region index"""
         try:
             # Remove span tags if present
             clean_address = self.remove_span_tags(address)
-            
-            # Split address and get second part
-            parts = clean_address.split()
-            if len(parts) >= 2:
-                return parts[1]
-            
-            # If no second part, try to find pattern like "XX시" or "XX구"
-            match = re.search(r'(\w+[시구군])', clean_address)
-            if match:
-                return match.group(1)
-            
-            return "Not found"
+            return category_from_address(clean_address, default_sido='경상북도')
         except:
             return "Not found"
     
@@ -140,175 +166,139 @@ class SangjuEducationCrawler:
             print(f"Error in remove_span_tags: {e}")
             return str(text).strip()
     
-    def check_reservation_button(self, section_index):
-        """Check if the section has a '예약' button"""
+    def read_sections(self):
+        """Read every section of the list page in one script call"""
         try:
-            button_selector = f"#reserveList > section:nth-child({section_index}) > ul > li > a"
-            button_element = self.driver.find_element(By.CSS_SELECTOR, button_selector)
-            button_text = button_element.text.strip()
-            
-            print(f"Section {section_index} button text: '{button_text}'")
-            return button_text == "예약"
+            return self.driver.execute_script(SECTIONS_SCRIPT) or []
         except Exception as e:
-            print(f"Error checking reservation button for section {section_index}: {e}")
-            return False
+            print(f"Error reading sections: {e}")
+            return []
+    
+    def call_arguments(self, script):
+        """Quoted or numeric arguments of the first call in an onclick/javascript: link"""
+        match = re.search(r'\((.*)\)', script or "")
+        if not match:
+            return []
+        return [next(part for part in parts if part) if any(parts) else ""
+                for parts in re.findall(r"'([^']*)'|\"([^\"]*)\"|(-?\d+)", match.group(1))]
     
-    def extract_lecture_from_section(self, section_index):
-        """Extract lecture data from a specific section"""
+    def link_values(self, section):
+        """Everything the detail link can carry: onclick/href call arguments and data-* attributes"""
+        values = {}
+        for source in ("onclick", "href"):
+            for i, value in enumerate(self.call_arguments(section.get(source))):
+                values[f"{source}{i}"] = value
+        for name, value in (section.get("data") or {}).items():
+            values[f"data-{name}"] = value
+        return values
+    
+    def learn_detail_template(self, section, new_url):
+        """
+        Learn how link values map to detail URL parameters from two clicked links
+        
+        The first clicked link is only kept. Once a second one is clicked, every
+        query parameter with the same value in both detail URLs is taken as a
+        constant of the template; every parameter that differs has to equal the
+        same link value in both links, so the URLs of all other sections are
+        built without clicking. A differing parameter that cannot be traced to
+        a link value could come from anywhere, so then nothing is learned and
+        links keep being clicked.
+        """
+        values = self.link_values(section)
+        if self.detail_sample is None:
+            self.detail_sample = (values, new_url)
+            return
+        first_values, first_url = self.detail_sample
+        first_params = dict(parse_qsl(urlsplit(first_url).query, keep_blank_values=True))
+        mapping = {}
+        for name, value in parse_qsl(urlsplit(new_url).query, keep_blank_values=True):
+            first_value = first_params.get(name)
+            # 두 링크에서 값이 같으면 고정 파라미터
+            if first_value == value:
+                continue
+            key = next((key for key, link_value in values.items()
+                        if link_value == value and first_values.get(key) == first_value), None)
+            if not key:
+                print(f"Detail URL parameter {name}={value} not found in the link, cannot build URLs")
+                self.detail_sample = (values, new_url)
+                return
+            mapping[name] = key
+        if mapping:
+            self.detail_template = (new_url, mapping)
+            print(f"Learned detail URL parameters: {mapping}")
+    
+    def click_detail_link(self, section):
+        """Old way - click the javascript: link and read where the browser went"""
+        current_url = self.driver.current_url
         try:
-            print(f"\n>>> Extracting data from section {section_index}")
-            
-            # Check if this section has '예약' button
-            if not self.check_reservation_button(section_index):
-                print(f"Section {section_index} does not have '예약' button, skipping...")
-                return False
-            
-            # Reset lecture data
-            self.reset_lecture_data()
-            
-            # Extract Title
-            try:
-                title_selector = f"#reserveList > section:nth-child({section_index}) > div > div.right > h1 > a"
-                title_element = self.driver.find_element(By.CSS_SELECTOR, title_selector)
-                self.lecture_data["Title"] = title_element.text.strip()
-                print(f"Title: {self.lecture_data['Title']}")
-            except Exception as e:
-                print(f"Error extracting title: {e}")
-            
-            # Extract Detail (href)
-            try:
-                detail_selector = f"#reserveList > section:nth-child({section_index}) > div > div.right > a"
-                detail_element = self.driver.find_element(By.CSS_SELECTOR, detail_selector)
-                href = detail_element.get_attribute('href')
-                
-                # Check if href is javascript:; or similar
-                if href and 'javascript:' not in href:
-                    self.lecture_data["Detail"] = href
-                    print(f"Detail URL: {href}")
-                else:
-                    # If it's a javascript link, try to click and get the actual URL
-                    print("Found javascript link, attempting to get actual URL...")
-                    
-                    # Save current URL
-                    current_url = self.driver.current_url
-                    
-                    try:
-                        # Click the detail link
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", detail_element)
-                        time.sleep(1)
-                        self.driver.execute_script("arguments[0].click();", detail_element)
-                        time.sleep(2)
-                        
-                        # Get the new URL
-                        new_url = self.driver.current_url
-                        
-                        if new_url != current_url:
-                            self.lecture_data["Detail"] = new_url
-                            print(f"Detail URL (from navigation): {new_url}")
-                            
-                            # Go back to list page
-                            self.driver.back()
-                            time.sleep(2)
-                        else:
-                            # If URL didn't change, try to extract from onclick or other attributes
-                            onclick = detail_element.get_attribute('onclick')
-                            if onclick:
-                                # Try to extract any URL or ID from onclick
-                                import re
-                                url_match = re.search(r'(https?://[^\s\'\"]+)', onclick)
-                                if url_match:
-                                    self.lecture_data["Detail"] = url_match.group(1)
-                                else:
-                                    # If no URL found, use the current page URL with section info
-                                    self.lecture_data["Detail"] = f"{current_url}#section{section_index}"
-                            else:
-                                self.lecture_data["Detail"] = f"{current_url}#section{section_index}"
-                            print(f"Detail URL (constructed): {self.lecture_data['Detail']}")
-                    except Exception as e:
-                        print(f"Error navigating to detail page: {e}")
-                        self.lecture_data["Detail"] = f"{current_url}#section{section_index}"
-                        
-            except Exception as e:
-                print(f"Error extracting detail URL: {e}")
-            
-            # Extract Recruitment Period
-            try:
-                recruitment_selector = f"#reserveList > section:nth-child({section_index}) > ul > li > ul > li:nth-child(1)"
-                recruitment_element = self.driver.find_element(By.CSS_SELECTOR, recruitment_selector)
-                # Get the full HTML content
-                recruitment_html = recruitment_element.get_attribute('innerHTML')
-                # Remove span tags and their content
-                recruitment_text = self.remove_span_tags(recruitment_html)
-                self.lecture_data["Recruitment_period"] = recruitment_text
-                print(f"Recruitment period: {recruitment_text}")
-            except Exception as e:
-                print(f"Error extracting recruitment period: {e}")
-            
-            # Extract Education Period
-            try:
-                education_selector = f"#reserveList > section:nth-child({section_index}) > div > div.right > ul > li:nth-child(3)"
-                education_element = self.driver.find_element(By.CSS_SELECTOR, education_selector)
-                # Get the full HTML content
-                education_html = education_element.get_attribute('innerHTML')
-                # Remove span tags and their content
-                education_text = self.remove_span_tags(education_html)
-                self.lecture_data["Education_period"] = education_text
-                print(f"Education period: {education_text}")
-            except Exception as e:
-                print(f"Error extracting education period: {e}")
-            
-            # Extract Quota
-            try:
-                quota_selector = f"#reserveList > section:nth-child({section_index}) > ul > li > ul > li:nth-child(2) > p"
-                quota_element = self.driver.find_element(By.CSS_SELECTOR, quota_selector)
-                # Get the full HTML content
-                quota_html = quota_element.get_attribute('innerHTML')
-                # Remove span tags and their content
-                quota_text = self.remove_span_tags(quota_html)
-                self.lecture_data["Quota"] = quota_text
-                print(f"Quota: {quota_text}")
-            except Exception as e:
-                print(f"Error extracting quota: {e}")
-            
-            # Extract Institution
-            try:
-                institution_selector = f"#reserveList > section:nth-child({section_index}) > div > div.right > ul > li:nth-child(2)"
-                institution_element = self.driver.find_element(By.CSS_SELECTOR, institution_selector)
-                # Get the full HTML content
-                institution_html = institution_element.get_attribute('innerHTML')
-                # Remove span tags and their content
-                institution_text = self.remove_span_tags(institution_html)
-                self.lecture_data["Institution"] = institution_text
-                print(f"Institution: {institution_text}")
-            except Exception as e:
-                print(f"Error extracting institution: {e}")
-            
-            # Extract Address
-            try:
-                address_selector = f"#reserveList > section:nth-child({section_index}) > div > div.right > ul > li:nth-child(4)"
-                address_element = self.driver.find_element(By.CSS_SELECTOR, address_selector)
-                # Get the full HTML content
-                address_html = address_element.get_attribute('innerHTML')
-                # Remove span tags and their content
-                address_text = self.remove_span_tags(address_html)
-                self.lecture_data["Address"] = address_text
-                print(f"Address: {address_text}")
-                
-                # Extract category from address
-                self.lecture_data["Category"] = self.extract_category_from_address(address_text)
-                print(f"Category: {self.lecture_data['Category']}")
-                
-            except Exception as e:
-                print(f"Error extracting address: {e}")
-            
-            # Increment ID for next lecture
-            self.current_id += 1
-            
-            return True
-            
+            detail_selector = f"#reserveList > section:nth-child({section['index']}) > div > div.right > a"
+            detail_element = self.driver.find_element(By.CSS_SELECTOR, detail_selector)
+            self.driver.execute_script("arguments[0].click();", detail_element)
+            time.sleep(2)
+            new_url = self.driver.current_url
+            if new_url != current_url:
+                self.driver.back()
+                time.sleep(2)
+                return new_url
         except Exception as e:
-            print(f"Error extracting lecture from section {section_index}: {e}")
-            return False
+            print(f"Error navigating to detail page: {e}")
+        return None
+    
+    def resolve_detail_url(self, section):
+        """Detail URL of a section without a page navigation whenever possible"""
+        current_url = self.driver.current_url
+        href = section.get("href") or ""
+        
+        # 일반 링크면 그대로 사용
+        if href and not href.lower().startswith('javascript:'):
+            return urljoin(current_url, href)
+        
+        # onclick/href 안에 주소가 직접 들어 있는 경우
+        for script in (section.get("onclick"), href):
+            url_match = re.search(r'(https?://[^\s\'"]+)', script or "")
+            if url_match:
+                return url_match.group(1)
+            path_match = re.search(r"""['"]([^'"\s]*\.(?:tc|do|jsp|asp|php)(?:\?[^'"\s]*)?)['"]""", script or "")
+            if path_match:
+                return urljoin(current_url, path_match.group(1))
+        
+        # 클릭해서 알아낸 파라미터 대응으로 주소 조립
+        values = self.link_values(section)
+        if self.detail_template and values:
+            url, mapping = self.detail_template
+            if all(key in values for key in mapping.values()):
+                for name, key in mapping.items():
+                    url = set_query_param(url, name, values[key])
+                return url
+        
+        # 아직 대응을 모르면 이 섹션만 클릭해서 배움
+        new_url = self.click_detail_link(section)
+        if new_url:
+            self.learn_detail_template(section, new_url)
+            return new_url
+        return f"{current_url}#section{section['index']}"
+    
+    def lecture_from_section(self, section):
+        """Lecture data from one section read by read_sections"""
+        self.reset_lecture_data()
+        
+        if section.get("title"):
+            self.lecture_data["Title"] = section["title"]
+        self.lecture_data["Detail"] = self.resolve_detail_url(section)
+        
+        for key, column in (("recruitment", "Recruitment_period"), ("education", "Education_period"),
+                            ("quota", "Quota"), ("institution", "Institution"), ("address", "Address")):
+            if section.get(key) is not None:
+                self.lecture_data[column] = self.remove_span_tags(section[key])
+        
+        if self.lecture_data["Address"] != "Not found":
+            self.lecture_data["Category"] = self.extract_category_from_address(self.lecture_data["Address"])
+        
+        print(f"Section {section['index']}: {self.lecture_data['Title']} -> {self.lecture_data['Detail']}")
+        
+        # Increment ID for next lecture
+        self.current_id += 1
+        return self.lecture_data.copy()
     
     def go_to_next_page(self, current_page):
         """Navigate to next page based on the pattern"""
@@ -377,7 +367,7 @@ class SangjuEducationCrawler:
         if file_exists:
             try:
                 # Read existing CSV
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 
                 # Append new data
                 df_combined = pd.concat([df_existing, df_new], ignore_index=True)
@@ -465,28 +455,27 @@ class SangjuEducationCrawler:
                 self.checkpoint["current_page"] = current_page
                 self.save_checkpoint()
                 
-                # Count sections on current page
-                total_sections = self.count_sections_on_page()
-                print(f"Found {total_sections} sections on page {current_page}")
+                # 섹션 전체를 스크립트 한 번으로 읽고 '예약' 버튼 확인도 같이 함
+                sections = self.read_sections()
+                print(f"Found {len(sections)} sections on page {current_page}")
                 
-                if total_sections == 0:
+                if not sections:
                     print("No sections found on this page")
                     break
                 
                 # Process each section
                 sections_processed = 0
-                for section_index in range(1, total_sections + 1):
+                for section in sections:
+                    section_index = section["index"]
                     # Skip if already processed
                     if current_page == self.checkpoint["current_page"] and section_index <= last_processed_section:
                         print(f"Skipping already processed section {section_index}")
                         continue
                     
-                    # Extract lecture details
-                    success = self.extract_lecture_from_section(section_index)
-                    
-                    if success:
-                        # Add to lectures collection
-                        self.lectures.append(self.lecture_data.copy())
+                    if section.get("button") != "예약":
+                        print(f"Section {section_index} does not have '예약' button, skipping...")
+                    else:
+                        self.lectures.append(self.lecture_from_section(section))
                         sections_processed += 1
                         
                         # Save to CSV periodically
@@ -496,9 +485,6 @@ class SangjuEducationCrawler:
                     # Update checkpoint
                     self.checkpoint["last_processed_section"] = section_index
                     self.save_checkpoint()
-                    
-                    # Delay between sections
-                    time.sleep(1)
                 
                 print(f"Processed {sections_processed} sections with '예약' button on page {current_page}")
                 
@@ -1,3 +1,4 @@
+import argparse
 import time
 import pandas as pd
 from selenium import webdriver
@@ -8,6 +9,86 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import os
 import json
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from csv_encoding import read_csv
+
+# XHR 모드 - 목록을 그리는 요청을 잡아서 큰 페이지 크기로 직접 다시 보냄
+XHR_PAGE_SIZE = 100
+# 요청 파라미터 중 페이지 번호/페이지 크기로 보는 이름 (소문자)
+PAGE_PARAM_NAMES = ['pageindex', 'currentpage', 'currentpageno', 'pageno', 'page', 'cpage', 'nowpage', 'curpage']
+SIZE_PARAM_NAMES = ['pageunit', 'recordcountperpage', 'pagesize', 'rows', 'listsize', 'perpage', 'rowcount']
+# 목록 첫 행의 칸과 링크 (XHR 응답의 키를 찾는 기준)
+FIRST_ROW_SCRIPT = """
+const row = Array.from(document.querySelectorAll('#bbsList > tbody > tr'))
+    .find(tr => tr.querySelector('td.subject.tal.mobile'));
+if (!row) return null;
+const text = selector => {
+    const element = row.querySelector(selector);
+    return element ? element.innerText.trim() : '';
+};
+const link = row.querySelector('td.subject.tal.mobile a');
+return {
+    Title: text('td.subject.tal.mobile'),
+    Education_period: text(':scope > td:nth-child(4)'),
+    Institution: text('td.subject.tac.mobile'),
+    Quota: text(':scope > td:nth-child(6)'),
+    State: text(':scope > td:nth-child(7) > span'),
+    Detail: link ? link.href : '',
+};
+"""
+# 브라우저 세션(쿠키) 그대로 잡은 요청을 다시 보냄
+REPLAY_SCRIPT = """
+const [url, method, body, contentType, done] = arguments;
+const headers = {'X-Requested-With': 'XMLHttpRequest'};
+if (contentType) headers['Content-Type'] = contentType;
+fetch(url, {method: method, body: method === 'GET' ? undefined : body, headers: headers, credentials: 'include'})
+    .then(response => response.text())
+    .then(text => done({text: text}))
+    .catch(error => done({error: String(error)}));
+"""
+
+
+def find_row_list(payload, path=()):
+    """Path to and contents of the largest list of objects in a JSON payload"""
+    best = (None, [])
+    if isinstance(payload, list) and payload and all(isinstance(item, dict) for item in payload):
+        best = (path, payload)
+    children = payload.items() if isinstance(payload, dict) else enumerate(payload) if isinstance(payload, list) else []
+    for key, value in children:
+        if isinstance(value, (dict, list)):
+            found = find_row_list(value, path + (key,))
+            if len(found[1]) > len(best[1]):
+                best = found
+    return best
+
+
+def learn_template(text, row):
+    """
+    Cell text → format template over the keys of a JSON row
+    
+    '2024.03.01 ~ 2024.05.31' with begin/end keys becomes
+    '{begin} ~ {end}'. Returns None when no key value is found in the text.
+    """
+    if not text or '{' in text or '}' in text:
+        return None
+    values = [(key, str(value).strip()) for key, value in row.items()
+              if value is not None and not isinstance(value, (dict, list)) and str(value).strip()]
+    for key, value in values:
+        if value == text:
+            return '{' + key + '}'
+    # 긴 값부터 바꿔서 짧은 숫자가 날짜 안에서 잘못 맞지 않게 함
+    parts = [text]
+    for key, value in sorted(values, key=lambda kv: -len(kv[1])):
+        if len(value) < 2:
+            continue
+        for i, part in enumerate(parts):
+            if i % 2 == 0 and value in part:
+                before, after = part.split(value, 1)
+                parts[i:i + 1] = [before, key, after]
+                break
+    if len(parts) == 1:
+        return None
+    return ''.join(part if i % 2 == 0 else '{' + part + '}' for i, part in enumerate(parts))
 
 class SeongnamEducationCrawler:
     def __init__(self, headless=True, checkpoint_file="seongnam_education_checkpoint.json"):
@@ -30,6 +111,9 @@ class SeongnamEducationCrawler:
         self.chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         self.chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # XHR 모드에서 목록 요청을 찾기 위한 네트워크 로그
+        self.chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
         # Initialize the driver with longer page load timeout
         self.driver = webdriver.Chrome(options=self.chrome_options)
         self.driver.set_page_load_timeout(60)  # Increase page load timeout to 60 seconds
@@ -664,7 +748,7 @@ class SeongnamEducationCrawler:
         if file_exists:
             try:
                 # Read existing CSV
-                df_existing = pd.read_csv(filename, encoding='utf-8-sig')
+                df_existing = read_csv(filename)
                 
                 # Append new data to existing data
                 df_combined = pd.concat([df_existing, df_new], ignore_index=True)
@@ -809,6 +893,274 @@ class SeongnamEducationCrawler:
         
         return True, next_page
     
+    def capture_listing_request(self):
+        """
+        Find the XHR behind the search results in the CDP network log
+        
+        Returns the request (url, method, body, content type) and the JSON
+        payload of the last response that holds a list of row objects, or
+        None when the listing is not loaded from JSON.
+        """
+        requests_sent = {}
+        captured = None
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            print(f"Network log not available: {e}")
+            return None
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except Exception:
+                continue
+            params = message.get('params', {})
+            if message.get('method') == 'Network.requestWillBeSent':
+                requests_sent[params.get('requestId')] = params.get('request', {})
+            elif message.get('method') == 'Network.responseReceived':
+                response = params.get('response', {})
+                if params.get('type') not in ('XHR', 'Fetch') and 'json' not in response.get('mimeType', ''):
+                    continue
+                request = requests_sent.get(params.get('requestId'))
+                if not request:
+                    continue
+                try:
+                    body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+                    payload = json.loads(body.get('body', ''))
+                except Exception:
+                    continue
+                path, rows = find_row_list(payload)
+                if rows:
+                    headers = {key.lower(): value for key, value in request.get('headers', {}).items()}
+                    captured = {
+                        'url': request.get('url'),
+                        'method': request.get('method', 'GET'),
+                        'body': request.get('postData') or '',
+                        'content_type': headers.get('content-type', ''),
+                        'path': path,
+                        'rows': rows,
+                    }
+        
+        if captured:
+            print(f"Captured listing request: {captured['method']} {captured['url']} ({len(captured['rows'])} rows)")
+        else:
+            print("No JSON listing response found in the network log")
+        return captured
+    
+    def request_params(self, request):
+        """Parameters of a captured request as (kind, dict) - query, form body or JSON body"""
+        if request['method'] == 'GET' or not request['body']:
+            return 'query', dict(parse_qsl(urlsplit(request['url']).query, keep_blank_values=True))
+        if 'json' in request['content_type']:
+            return 'json', json.loads(request['body'])
+        return 'form', dict(parse_qsl(request['body'], keep_blank_values=True))
+    
+    def find_param(self, params, names):
+        for key in params:
+            if key.lower() in names:
+                return key
+        return None
+    
+    def replay_listing_request(self, request, page):
+        """Rows of one page from the captured request with our page number and size"""
+        kind, params = self.request_params(request)
+        params = dict(params)
+        params[request['page_param']] = page
+        if request['size_param']:
+            params[request['size_param']] = XHR_PAGE_SIZE
+        
+        url, body = request['url'], request['body']
+        if kind == 'query':
+            url = urlunsplit(urlsplit(url)._replace(query=urlencode(params)))
+        elif kind == 'json':
+            body = json.dumps(params)
+        else:
+            body = urlencode(params)
+        
+        result = self.driver.execute_async_script(REPLAY_SCRIPT, url, request['method'], body, request['content_type'])
+        if not result or result.get('error'):
+            raise Exception(f"Replay of page {page} failed: {(result or {}).get('error')}")
+        payload = json.loads(result['text'])
+        
+        # 처음 찾은 위치에 목록이 없으면 다시 찾음
+        rows = payload
+        try:
+            for key in request['path']:
+                rows = rows[key]
+        except (KeyError, IndexError, TypeError):
+            rows = find_row_list(payload)[1]
+        return rows if isinstance(rows, list) else []
+    
+    def learn_row_templates(self, request):
+        """Templates for the list columns and detail URL from the first rendered row"""
+        first_row = self.driver.execute_script(FIRST_ROW_SCRIPT)
+        if not first_row or not first_row.get('Title'):
+            print("No rendered row to match against the XHR payload")
+            return None
+        
+        # 화면 첫 행과 같은 강좌의 JSON 행 찾기
+        title = first_row['Title']
+        row = next((row for row in request['rows']
+                    if any(str(value).strip() == title for value in row.values() if value is not None)), None)
+        if row is None:
+            print(f"Title '{title}' not found in the XHR payload")
+            return None
+        
+        templates = {}
+        for column, text in first_row.items():
+            template = learn_template(text, row)
+            if template:
+                templates[column] = template
+                print(f"{column}: {template}")
+            else:
+                print(f"{column}: no matching key in the XHR payload")
+        return templates
+    
+    def lecture_from_payload(self, row, templates):
+        """List columns of one lecture from a JSON row"""
+        self.reset_lecture_data()
+        values = {key: '' if value is None else str(value).strip() for key, value in row.items()}
+        for column, template in templates.items():
+            try:
+                text = template.format_map(values).strip()
+            except (KeyError, ValueError):
+                continue
+            if text:
+                self.lecture_data[column] = text
+    
+    def detail_url_usable(self, request, templates):
+        """True if the learned Detail template gives an http(s) page URL for the first JSON row"""
+        if 'Detail' not in templates or not request['rows']:
+            return False
+        self.lecture_from_payload(request['rows'][0], {'Detail': templates['Detail']})
+        detail_url = self.lecture_data["Detail"]
+        return detail_url.startswith(('http://', 'https://')) and '#' not in detail_url
+    
+    def fall_back_to_dom(self, start_url, max_pages):
+        """Continue with run(); an XHR checkpoint (100-row pages) cannot be resumed there"""
+        if self.checkpoint.get('page_type') == 'xhr':
+            self.checkpoint = {"current_page": 1, "last_processed_row": 0, "page_type": "normal",
+                               "last_url": "", "timestamp": ""}
+            # run() 이 체크포인트 파일을 다시 읽으므로 초기화한 값을 저장
+            self.save_checkpoint()
+        return self.run(start_url, max_pages)
+    
+    def run_xhr(self, start_url, max_pages=100):
+        """
+        Crawl from the JSON listing instead of the rendered table
+        
+        The search is run once in the browser so the listing request can be
+        captured; after that every page comes from replaying the request with
+        XHR_PAGE_SIZE rows per page and the detail pages are opened directly,
+        without going back to the list and reapplying the filters. Falls back
+        to run() when the listing request or its keys cannot be found, or
+        when the rows carry no detail page URL.
+        """
+        checkpoint_exists = self.load_checkpoint()
+        # DOM 모드 체크포인트는 페이지 크기가 달라서 이어 쓸 수 없음
+        if checkpoint_exists and self.checkpoint.get('page_type') != 'xhr':
+            checkpoint_exists = False
+        
+        self.navigate_to_url(start_url)
+        try:
+            # 필터 적용 전의 로그는 버림
+            self.driver.get_log('performance')
+        except Exception:
+            pass
+        if not self.apply_filters():
+            print("Failed to apply filters. Ending crawl.")
+            self.close()
+            return
+        
+        request = self.capture_listing_request()
+        templates = None
+        if request:
+            kind, params = self.request_params(request)
+            request['page_param'] = self.find_param(params, PAGE_PARAM_NAMES)
+            request['size_param'] = self.find_param(params, SIZE_PARAM_NAMES)
+            if not request['page_param']:
+                print(f"No page parameter among {list(params)}")
+            else:
+                templates = self.learn_row_templates(request)
+        if not templates or 'Title' not in templates:
+            print("XHR mode not possible, falling back to the rendered table")
+            return self.fall_back_to_dom(start_url, max_pages)
+        # 제목 링크가 '#' / javascript: 이면 상세 페이지를 주소로 열 수 없어 상세 항목이 모두 비게 됨
+        if not self.detail_url_usable(request, templates):
+            print("No detail page URL in the XHR payload, falling back to the rendered table")
+            return self.fall_back_to_dom(start_url, max_pages)
+        
+        self.driver.set_script_timeout(60)
+        current_page = self.checkpoint["current_page"] if checkpoint_exists else 1
+        start_row = self.checkpoint["last_processed_row"] + 1 if checkpoint_exists else 1
+        self.checkpoint["page_type"] = 'xhr'
+        previous_rows = None
+        
+        try:
+            while current_page <= max_pages:
+                print(f"\n--- Replaying listing page {current_page} ({XHR_PAGE_SIZE} rows per page) ---")
+                rows = self.replay_listing_request(request, current_page)
+                # 페이지 번호를 무시하는 서버면 같은 행이 반복됨
+                fingerprint = [str(row) for row in rows[:3]]
+                if not rows or fingerprint == previous_rows:
+                    print("No more rows. Ending crawl.")
+                    break
+                previous_rows = fingerprint
+                self.checkpoint["current_page"] = current_page
+                
+                for row_num, row in enumerate(rows, 1):
+                    if row_num < start_row:
+                        continue
+                    self.lecture_from_payload(row, templates)
+                    detail_url = self.lecture_data["Detail"]
+                    if detail_url.startswith(('http://', 'https://')) and '#' not in detail_url:
+                        try:
+                            self.driver.get(detail_url)
+                            time.sleep(2)
+                            self.extract_detail_page_data()
+                        except Exception as e:
+                            print(f"Error reading detail page {detail_url}: {e}")
+                    
+                    not_found_count = sum(1 for value in self.lecture_data.values() if value == "Not found")
+                    if not_found_count <= 3:
+                        self.lectures.append(self.lecture_data.copy())
+                    else:
+                        print(f"Too many missing values ({not_found_count}) for {self.lecture_data['Title']}, skipping")
+                    
+                    self.checkpoint["last_processed_row"] = row_num
+                    self.save_checkpoint()
+                    if len(self.lectures) >= 10:
+                        self.save_to_csv("seongnam_education.csv")
+                
+                if self.lectures:
+                    self.save_to_csv("seongnam_education.csv")
+                if len(rows) < XHR_PAGE_SIZE and request['size_param']:
+                    print(f"Page {current_page} has fewer than {XHR_PAGE_SIZE} rows, this is the last page.")
+                    break
+                
+                current_page += 1
+                start_row = 1
+                self.checkpoint["current_page"] = current_page
+                self.checkpoint["last_processed_row"] = 0
+                self.save_checkpoint()
+            
+            print("Crawling completed successfully.")
+            
+        except KeyboardInterrupt:
+            print("\nCrawling interrupted by user. Saving progress...")
+            if self.lectures:
+                self.save_to_csv("seongnam_education.csv")
+            self.save_checkpoint()
+            
+        except Exception as e:
+            print(f"Error during XHR crawl: {e}")
+            if self.lectures:
+                self.save_to_csv("seongnam_education.csv")
+            self.save_checkpoint()
+            
+        finally:
+            self.close()
+    
     def run(self, start_url, max_pages=100):
         """Run the scraping process for the Seongnam education programs"""
         # Load checkpoint if it exists
@@ -984,6 +1336,16 @@ if __name__ == "__main__":
     # URL for Seongnam education listings
     url = 'https://sugang.seongnam.go.kr/ilms/learning/learningList.do#'
     
-    # Create and run the crawler - set headless=False to see the browser in action
-    crawler = SeongnamEducationCrawler(headless=False)
-    crawler.run(url, max_pages=100)  # Crawl up to 100 pages
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Crawl Seongnam lectures")
+    parser.add_argument('--mode', choices=['xhr', 'dom'], default='xhr',
+                        help='xhr replays the listing request, dom clicks through the rendered table')
+    parser.add_argument('--max-pages', type=int, default=100)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args()
+    
+    # Create and run the crawler - without --headless the browser is shown
+    crawler = SeongnamEducationCrawler(headless=args.headless)
+    if args.mode == 'xhr':
+        crawler.run_xhr(url, max_pages=args.max_pages)
+    else:
+        crawler.run(url, max_pages=args.max_pages)  # Crawl up to 100 pages
\ No newline at end of file
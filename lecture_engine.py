@@ -0,0 +1,719 @@
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import pandas as pd
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from csv_encoding import read_csv
+
+# 강좌 크롤러들이 공통으로 쓰던 크롬 옵션
+CHROME_ARGUMENTS = [
+    '--window-size=1920,1080',
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-popup-blocking',
+    '--ignore-certificate-errors',
+    '--disable-web-security',
+    '--allow-running-insecure-content',
+    '--disable-blink-features=AutomationControlled',
+]
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36'
+NOT_FOUND = "Not found"
+BR_PATTERN = re.compile(r'<br\s*/?>', re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# 상세 페이지를 동시에 열어 둘 탭 수
+DETAIL_TABS = 4
+# 페이지 번호가 안 보일 때 누를 '다음 묶음' 링크 - 글자/title/class 에 포함된 문구 또는 글자 전체
+NEXT_GROUP_TEXTS = ['다음', 'next']
+NEXT_GROUP_SYMBOLS = ['>', '›']
+
+# 목록 칸이 그대로인 행의 상세 내용을 다시 쓰는 기간 - 지나면 상세 페이지를 다시 읽음
+LISTING_MAX_AGE = 7 * 24 * 3600
+
+# 같은 CSV 에 여러 스레드(사이트 분할 크롤)가 저장할 때 파일별로 직렬화
+_save_locks = {}
+_save_locks_guard = threading.Lock()
+
+# 한 번의 execute_script 로 페이지의 모든 행(또는 상세 페이지)의 필드를 읽음
+# arguments: 행 선택자(null 이면 문서 전체), [이름, 선택자, 속성] 목록
+EXTRACT_SCRIPT = """
+var rowSelector = arguments[0], fields = arguments[1];
+var rows = rowSelector ? Array.prototype.slice.call(document.querySelectorAll(rowSelector)) : [document];
+return rows.map(function (row) {
+  var record = {};
+  fields.forEach(function (field) {
+    var el = field[1] ? row.querySelector(field[1]) : row;
+    if (!el || el === document) { record[field[0]] = null; return; }
+    if (field[2] === 'text') { record[field[0]] = el.innerText; }
+    else if (field[2] === 'html') { record[field[0]] = el.innerHTML; }
+    else if (field[2] === 'href') { record[field[0]] = el.href || el.getAttribute('href'); }
+    else { record[field[0]] = el.getAttribute(field[2]); }
+  });
+  return record;
+});
+"""
+
+
+def create_driver(headless=True, page_load_timeout=30):
+    """Chrome driver with the shared lecture crawler options and user agent"""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless=new')
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-automation', 'enable-logging'])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(page_load_timeout)
+    driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": USER_AGENT})
+    return driver
+
+
+def split_lines(html):
+    """<br> 로 나뉜 셀 내용을 태그를 뺀 줄 목록으로"""
+    return [TAG_PATTERN.sub('', part).strip() for part in BR_PATTERN.split(html or '')]
+
+
+def set_query_param(url, name, value):
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if any(key == name for key, _ in query):
+        query = [(key, str(value) if key == name else val) for key, val in query]
+    else:
+        query.append((name, str(value)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def is_page_url(url):
+    return bool(url) and url.lower().startswith(('http://', 'https://'))
+
+
+class Field:
+    """
+    How to read one value from a list row (or a detail page)
+
+    selector is relative to the row (None means the row itself). attr is
+    'text', 'html', 'href' or any attribute name. split names the columns a
+    <br>-separated cell is spread over, e.g. ('Recruitment_period',
+    'Education_period'); the first column gets the whole text when there is
+    no <br>. transform is applied to the stripped text.
+    """
+
+    def __init__(self, selector=None, attr='text', split=None, transform=None):
+        self.selector = selector
+        self.attr = 'html' if split else attr
+        self.split = split
+        self.transform = transform
+
+    def apply(self, name, raw, record):
+        if self.split:
+            parts = split_lines(raw) if raw else []
+            for index, column in enumerate(self.split):
+                value = parts[index] if index < len(parts) else ''
+                record[column] = value or NOT_FOUND
+            return
+        value = (raw or '').strip()
+        if self.transform and value:
+            value = self.transform(value)
+        record[name] = value or NOT_FOUND
+
+
+def read_fields(driver, fields, row_selector=None):
+    """Field 사전을 한 번의 스크립트 호출로 읽어 레코드 목록으로 변환"""
+    specs = [[name, field.selector, field.attr] for name, field in fields.items()]
+    raw_rows = driver.execute_script(EXTRACT_SCRIPT, row_selector, specs) or []
+    records = []
+    for raw in raw_rows:
+        record = {}
+        for name, field in fields.items():
+            field.apply(name, raw.get(name), record)
+        records.append(record)
+    return records
+
+
+class UrlPagination:
+    """Pages addressed by a query parameter (q_currPage, pageIndex, curPage, ...)"""
+
+    # 아무 페이지나 바로 열 수 있어 여러 브라우저로 나눠 크롤 가능
+    addressable = True
+
+    def __init__(self, param, first_page=1):
+        self.param = param
+        self.first_page = first_page
+
+    def page_url(self, start_url, page):
+        return set_query_param(start_url, self.param, page - 1 + self.first_page)
+
+    def open(self, crawler, page):
+        """Load the list page (also used to resume from a checkpoint)"""
+        crawler.load(self.page_url(crawler.spec.start_url, page))
+        return True
+
+    def advance(self, crawler, page):
+        return self.open(crawler, page)
+
+
+class ClickPagination:
+    """
+    Numbered page links inside a pagination container
+
+    The link whose text is the page number is clicked; when the number is
+    not shown (end of a group of 10) the next-group link is clicked instead,
+    found by next_group or by its text. Resuming replays the clicks from the
+    first page.
+    """
+
+    addressable = False
+
+    def __init__(self, container, next_group=None):
+        self.container = container
+        self.next_group = next_group
+
+    def open(self, crawler, page):
+        crawler.load(crawler.spec.start_url)
+        for target in range(2, page + 1):
+            if not self.advance(crawler, target):
+                return False
+        return True
+
+    def find_link(self, driver, page):
+        links = driver.find_elements(By.CSS_SELECTOR, f"{self.container} a")
+        for link in links:
+            if link.text.strip() == str(page):
+                return link
+        if self.next_group:
+            return next(iter(driver.find_elements(By.CSS_SELECTOR, self.next_group)), None)
+        for link in links:
+            label = f"{link.text} {link.get_attribute('title') or ''} {link.get_attribute('class') or ''}".lower()
+            if link.text.strip() in NEXT_GROUP_SYMBOLS or any(text in label for text in NEXT_GROUP_TEXTS):
+                return link
+        return None
+
+    def advance(self, crawler, page):
+        link = self.find_link(crawler.driver, page)
+        if link is None:
+            print(f"No link to page {page}. This might be the last page.")
+            return False
+        old_rows = crawler.driver.find_elements(By.CSS_SELECTOR, crawler.spec.row_selector)[:1]
+        crawler.driver.execute_script("arguments[0].click();", link)
+        # 이전 페이지의 행이 사라질 때까지 기다린 뒤 새 행을 기다림
+        for row in old_rows:
+            try:
+                crawler.wait.until(EC.staleness_of(row))
+            except Exception:
+                pass
+        crawler.wait_for_rows()
+        return True
+
+
+class DetailPage:
+    """
+    Extra fields read from each row's detail page
+
+    The detail URLs of a whole list page are collected first and opened
+    `tabs` at a time with window.open, so Chrome loads them in parallel
+    while the list page (and its click pagination state) stays loaded.
+    Each tab is then read and closed. clicks are selectors clicked before
+    reading, e.g. a tab that holds the address.
+    """
+
+    def __init__(self, fields, wait_for=None, clicks=(), tabs=DETAIL_TABS):
+        self.fields = fields
+        self.wait_for = wait_for
+        self.clicks = clicks
+        self.tabs = tabs
+
+    def open_tab(self, driver, url):
+        before = set(driver.window_handles)
+        driver.execute_script("window.open(arguments[0], '_blank');", url)
+        opened = set(driver.window_handles) - before
+        return opened.pop() if opened else None
+
+    def read_tab(self, crawler, record):
+        driver = crawler.driver
+        crawler.wait.until(lambda d: d.execute_script("return document.readyState") == 'complete')
+        if self.wait_for:
+            crawler.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.wait_for)))
+        for selector in self.clicks:
+            for element in driver.find_elements(By.CSS_SELECTOR, selector)[:1]:
+                driver.execute_script("arguments[0].click();", element)
+                time.sleep(0.5)
+        record.update(read_fields(driver, self.fields)[0])
+        record['_detail_read'] = True
+
+    def fetch(self, crawler, records):
+        driver = crawler.driver
+        list_window = driver.current_window_handle
+        targets = [record for record in records if is_page_url(record.get('Detail'))]
+        for start in range(0, len(targets), self.tabs):
+            batch = targets[start:start + self.tabs]
+            # 목록 창에서 한꺼번에 열어 두고 (병렬 로딩) 하나씩 읽고 닫음
+            handles = [self.open_tab(driver, record['Detail']) for record in batch]
+            for record, handle in zip(batch, handles):
+                if handle is None:
+                    print(f"Could not open a tab for {record['Detail']}")
+                    continue
+                try:
+                    driver.switch_to.window(handle)
+                    self.read_tab(crawler, record)
+                except Exception as e:
+                    print(f"Error reading detail page {record['Detail']}: {e}")
+                finally:
+                    driver.close()
+                    driver.switch_to.window(list_window)
+
+
+class PopupDetail:
+    """Extra fields read from a layer popup opened by clicking the row"""
+
+    def __init__(self, fields, click, wait_for, close):
+        self.fields = fields
+        self.click = click
+        self.wait_for = wait_for
+        self.close = close
+
+    def fetch(self, crawler, records):
+        driver = crawler.driver
+        rows = driver.find_elements(By.CSS_SELECTOR, crawler.spec.row_selector)
+        for record in records:
+            row = rows[record['_row'] - 1]
+            try:
+                target = row.find_element(By.CSS_SELECTOR, self.click)
+                driver.execute_script("arguments[0].click();", target)
+                crawler.wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, self.wait_for)))
+                record.update(read_fields(driver, self.fields)[0])
+                record['_detail_read'] = True
+            except Exception as e:
+                print(f"Error reading popup for row {record['_row']}: {e}")
+            for element in driver.find_elements(By.CSS_SELECTOR, self.close)[:1]:
+                driver.execute_script("arguments[0].click();", element)
+                time.sleep(0.3)
+
+
+class Category:
+    """
+    One category list of a site that has a separate URL per category
+
+    label goes into the Category column, key names the category's crawl and
+    checkpoint slot. detail replaces the site's detail reader when the
+    category's detail pages are laid out differently.
+    """
+
+    def __init__(self, key, label, url, detail=None):
+        self.key = key
+        self.label = label
+        self.url = url
+        self.detail = detail
+
+
+class SiteSpec:
+    """
+    Everything that differs between the lecture sites
+
+    columns is the CSV column order (defaults fills constant columns such as
+    City), fields are read from every row matched by row_selector, detail
+    optionally adds fields from a detail page or popup, keep filters rows
+    before any detail page is opened and finalize(lecture, record) adjusts
+    a finished record (e.g. Category from the address). Output and
+    checkpoint files keep the names of the original per-site crawlers so old
+    runs can be resumed. required lists the fields that must be found for
+    the HTTP-only mode to count as working for the site. Sites with a list
+    URL per category give categories (start_url is then unused) and are
+    crawled through split_categories().
+    """
+
+    def __init__(self, name, start_url, row_selector, fields, columns, output,
+                 pagination, dedupe_on, defaults=None, detail=None, keep=None,
+                 finalize=None, checkpoint_file=None, max_pages=100, http=None, required=('Title',),
+                 categories=None):
+        self.name = name
+        # 카테고리별로 나눈 명세도 원래 사이트 이름을 기억 (사이트별 브라우저 수 설정용)
+        self.site = name
+        self.start_url = start_url
+        self.row_selector = row_selector
+        self.fields = fields
+        self.columns = columns
+        self.output = output
+        self.pagination = pagination
+        self.dedupe_on = dedupe_on
+        self.defaults = defaults or {}
+        self.detail = detail
+        self.keep = keep
+        self.finalize = finalize
+        self.checkpoint_file = checkpoint_file or f"{os.path.splitext(output)[0]}_checkpoint.json"
+        self.listing_file = f"{os.path.splitext(output)[0]}_listing.json"
+        self.max_pages = max_pages
+        # None 이면 HTTP 모드를 시험해 보고 결정, False 면 항상 브라우저
+        self.http = http
+        self.required = required
+        self.categories = categories or []
+
+    def split_categories(self):
+        """
+        One spec per category, or [self] for a site without categories
+
+        Each category spec starts from its own URL, fills the Category column
+        with its label and keeps its own checkpoint slot, while all of them
+        still write to the site's output file.
+        """
+        if not self.categories:
+            return [self]
+        root, ext = os.path.splitext(self.checkpoint_file)
+        specs = []
+        for category in self.categories:
+            spec = copy.copy(self)
+            spec.name = f"{self.name}-{category.key}"
+            spec.start_url = category.url
+            spec.defaults = dict(self.defaults, Category=category.label)
+            spec.detail = category.detail or self.detail
+            spec.checkpoint_file = f"{root}_{category.key}{ext}"
+            listing_root, listing_ext = os.path.splitext(self.listing_file)
+            spec.listing_file = f"{listing_root}_{category.key}{listing_ext}"
+            spec.categories = []
+            specs.append(spec)
+        return specs
+
+
+def _save_lock(filename):
+    with _save_locks_guard:
+        return _save_locks.setdefault(os.path.abspath(filename), threading.Lock())
+
+
+def save_lectures(filename, lectures, dedupe_on, on_overwrite=None):
+    """
+    Append lectures to a CSV and drop duplicates (keeping the newest)
+
+    If the existing file cannot be read it is overwritten and on_overwrite()
+    is called, since the rows it held are gone.
+    """
+    if not lectures:
+        return 0
+    with _save_lock(filename):
+        df = pd.DataFrame(lectures)
+        if os.path.isfile(filename):
+            try:
+                df = pd.concat([read_csv(filename), df], ignore_index=True)
+            except Exception as e:
+                print(f"Error reading existing file {filename}, overwriting: {e}")
+                if on_overwrite:
+                    on_overwrite()
+        df = df.drop_duplicates(subset=dedupe_on, keep='last')
+        df.to_csv(filename, index=False, encoding='utf-8-sig', lineterminator='\n')
+    print(f"Saved {len(lectures)} lectures to {filename}. Total: {len(df)} lectures")
+    return len(df)
+
+
+def _digest(values):
+    text = json.dumps(values, ensure_ascii=False)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _normalize(value):
+    return ' '.join(str(value).split()) if value is not None else ''
+
+
+class ListingIndex:
+    """
+    List page and row fingerprints from earlier runs of one site
+
+    A row is identified by its list key fields (the dedupe fields found on
+    the list, plus Detail) and compared by the hash of all its list fields.
+    While both are unchanged and the entry is younger than LISTING_MAX_AGE,
+    the lecture already in the CSV is kept and its detail page is not read
+    again. Shards of a site share the file; save() merges under the same
+    per-file lock as the CSV. reset() forgets every row remembered so far
+    (also those of other shards) when the CSV lost its rows.
+    """
+
+    def __init__(self, filename, spec, reset=False):
+        self.filename = filename
+        self.spec = spec
+        self.pages = {}
+        self.rows = {}
+        self.updated_pages = {}
+        self.updated_rows = {}
+        # 이 시각 이전에 기억한 행은 CSV 에 없을 수 있으므로 무효
+        self.reset_at = time.time() if reset else 0
+        # 목록 필드가 만드는 열 (split 은 나뉜 열 이름)
+        self.list_columns = sorted(column for name, field in spec.fields.items() for column in (field.split or (name,)))
+        if not reset:
+            self.pages, self.rows, self.reset_at = self.read()
+
+    def read(self):
+        if not os.path.exists(self.filename):
+            return {}, {}, 0
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            return saved.get('pages', {}), saved.get('rows', {}), saved.get('reset_at', 0)
+        except Exception as e:
+            print(f"Error loading listing index {self.filename}: {e}")
+            return {}, {}, 0
+
+    def signature(self, record):
+        """(row key, list hash) of a list record - taken before detail pages overwrite any field"""
+        key_columns = [name for name in self.spec.dedupe_on if name in self.list_columns]
+        if 'Detail' in self.list_columns and 'Detail' not in key_columns:
+            key_columns.append('Detail')
+        key = _digest([_normalize(record.get(name)) for name in key_columns or ['Title']])
+        return key, _digest([_normalize(record.get(name)) for name in self.list_columns])
+
+    def page_fingerprint(self, signatures):
+        return _digest([list(signature) for signature in signatures])
+
+    def page_unchanged(self, page, fingerprint):
+        return self.pages.get(str(page)) == fingerprint
+
+    def unchanged(self, signature):
+        """True if the row was completed recently with the same list fields"""
+        key, list_hash = signature
+        entry = self.rows.get(key)
+        return bool(entry) and entry['list'] == list_hash and time.time() - entry['time'] <= LISTING_MAX_AGE
+
+    def remember(self, page, fingerprint, signatures):
+        """Store the page fingerprint and the signatures of the rows completed on it"""
+        self.updated_pages[str(page)] = self.pages[str(page)] = fingerprint
+        now = time.time()
+        for key, list_hash in signatures:
+            self.updated_rows[key] = self.rows[key] = {'list': list_hash, 'time': now}
+
+    def reset(self):
+        """Forget every remembered page and row (the CSV was rewritten without them)"""
+        self.pages, self.rows = {}, {}
+        self.updated_pages, self.updated_rows = {}, {}
+        self.reset_at = time.time()
+        self.save()
+
+    def save(self):
+        with _save_lock(self.filename):
+            # 다른 분할 크롤이 그 사이에 저장한 내용과 합침
+            pages, rows, reset_at = self.read()
+            if reset_at > self.reset_at:
+                # 다른 분할 크롤이 초기화함 - 그 전에 기억한 내용은 버림
+                self.pages, self.updated_pages = {}, {}
+                self.reset_at = reset_at
+            elif self.reset_at > reset_at:
+                pages = {}
+            pages.update(self.updated_pages)
+            rows.update(self.updated_rows)
+            now = time.time()
+            rows = {key: entry for key, entry in rows.items()
+                    if entry['time'] >= self.reset_at and now - entry['time'] <= LISTING_MAX_AGE}
+            self.rows = {key: entry for key, entry in self.rows.items() if entry['time'] >= self.reset_at}
+            self.updated_rows = {key: entry for key, entry in self.updated_rows.items() if key in self.rows}
+            try:
+                with open(self.filename, 'w', encoding='utf-8') as f:
+                    json.dump({'pages': pages, 'rows': rows, 'reset_at': self.reset_at}, f, ensure_ascii=False)
+            except Exception as e:
+                print(f"Error saving listing index {self.filename}: {e}")
+
+
+class LectureCrawler:
+    """
+    Crawl one lecture site described by a SiteSpec
+
+    Each list page is read with a single script call, filtered, completed
+    from detail pages and appended to the output CSV. The checkpoint stores
+    the current page and the last saved row, so an interrupted crawl resumes
+    where it stopped.
+
+    With stride > 1 the crawler reads every stride-th page starting at
+    offset + 1 (one shard of an addressable site); each shard keeps its own
+    checkpoint slot. on_page(crawler, page, rows, kept) is called after
+    every saved page.
+
+    With incremental (the default) rows whose list fields did not change
+    since the last run (see ListingIndex) are neither completed from detail
+    pages nor saved again, so a repeat crawl mostly reads list pages.
+    """
+
+    def __init__(self, spec, headless=True, driver=None, stride=1, offset=0, on_page=None, incremental=True):
+        self.spec = spec
+        self.listing = None
+        if incremental:
+            # CSV 가 없으면 예전 행을 다시 써야 하므로 지난 기록을 무시
+            self.listing = ListingIndex(spec.listing_file, spec, reset=not os.path.exists(spec.output))
+        self.stride = stride
+        self.offset = offset
+        self.on_page = on_page
+        self.checkpoint = {"current_page": offset + 1, "last_processed_row": 0, "last_url": "", "timestamp": ""}
+        self.saved = 0
+        if stride > 1:
+            root, ext = os.path.splitext(spec.checkpoint_file)
+            self.checkpoint_file = f"{root}_{offset + 1}of{stride}{ext}"
+        else:
+            self.checkpoint_file = spec.checkpoint_file
+        self.start_browser(headless, driver)
+
+    def start_browser(self, headless, driver=None):
+        self.driver = driver or create_driver(headless)
+        self.wait = WebDriverWait(self.driver, 15)
+
+    def log(self, message):
+        shard = f" {self.offset + 1}/{self.stride}" if self.stride > 1 else ""
+        print(f"[{self.spec.name}{shard}] {message}")
+
+    def load(self, url):
+        self.driver.get(url)
+        self.checkpoint["last_url"] = url
+        self.wait_for_rows()
+
+    def wait_for_rows(self):
+        try:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.spec.row_selector)))
+        except Exception:
+            pass
+
+    def load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_file):
+            return False
+        try:
+            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            self.checkpoint["current_page"] = saved.get("current_page", 1)
+            self.checkpoint["last_processed_row"] = saved.get("last_processed_row", saved.get("last_processed_item", 0))
+            self.log(f"Loaded checkpoint: page {self.checkpoint['current_page']}, row {self.checkpoint['last_processed_row']}")
+            return True
+        except Exception as e:
+            self.log(f"Error loading checkpoint: {e}")
+            return False
+
+    def save_checkpoint(self):
+        self.checkpoint["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
+                json.dump(self.checkpoint, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            self.log(f"Error saving checkpoint: {e}")
+
+    def extract(self, fields, row_selector=None):
+        return read_fields(self.driver, fields, row_selector)
+
+    def read_page(self, page):
+        """Records of the current list page (with _row = 1-based row position)"""
+        records = self.extract(self.spec.fields, self.spec.row_selector)
+        for index, record in enumerate(records, 1):
+            record['_row'] = index
+            record['_page'] = page
+        return records
+
+    def fetch_details(self, records):
+        self.spec.detail.fetch(self, records)
+
+    def complete(self, record):
+        lecture = {column: self.spec.defaults.get(column, NOT_FOUND) for column in self.spec.columns}
+        lecture.update({key: value for key, value in record.items() if key in lecture and key not in self.spec.defaults})
+        # 실제 주소가 없는 링크(javascript:)는 페이지/행 위치로 고유 식별자를 만듦
+        if 'Detail' in lecture and not is_page_url(lecture['Detail']):
+            lecture['Detail'] = f"{self.checkpoint['last_url']}#item{record['_row']}_page{record['_page']}"
+        if self.spec.finalize:
+            self.spec.finalize(lecture, record)
+        return lecture
+
+    def is_complete(self, record, lecture):
+        """True if the row needs no detail page or its detail page was read"""
+        if not self.spec.detail:
+            return True
+        return bool(record.get('_detail_read'))
+
+    def crawl_page(self, page, start_row):
+        records = self.read_page(page)
+        if not records:
+            return None
+        pending = [record for record in records if record['_row'] >= start_row]
+        if self.spec.keep:
+            pending = [record for record in pending if self.spec.keep(record)]
+        changed, unchanged = pending, False
+        if self.listing is not None:
+            signatures = {id(record): self.listing.signature(record) for record in records}
+            fingerprint = self.listing.page_fingerprint([signatures[id(record)] for record in records])
+            unchanged = self.listing.page_unchanged(page, fingerprint)
+            # 목록 칸이 지난 실행과 같은 행은 CSV 에 이미 있으므로 건너뜀
+            changed = [record for record in pending if not self.listing.unchanged(signatures[id(record)])]
+        if self.spec.detail and changed:
+            self.fetch_details(changed)
+
+        lectures = [self.complete(record) for record in changed]
+        on_overwrite = self.listing.reset if self.listing is not None else None
+        self.saved = save_lectures(self.spec.output, lectures, self.spec.dedupe_on, on_overwrite) or self.saved
+        if self.listing is not None:
+            # 상세 페이지를 못 읽은 행만 다음 실행에서 다시 읽음 (원래 비어 있는 상세 항목은 다시 읽지 않음)
+            completed = [signatures[id(record)] for record, lecture in zip(changed, lectures)
+                         if self.is_complete(record, lecture)]
+            self.listing.remember(page, fingerprint, completed)
+            self.listing.save()
+        self.checkpoint["last_processed_row"] = len(records)
+        self.save_checkpoint()
+        state = " (unchanged)" if unchanged else ""
+        self.log(f"Page {page}{state}: {len(records)} rows, {len(pending)} kept, {len(pending) - len(changed)} reused")
+        if self.on_page:
+            self.on_page(self, page, len(records), len(pending))
+        return records
+
+    def run(self, max_pages=None, resume=True):
+        """Crawl up to max_pages list pages; returns the number of pages read"""
+        max_pages = max_pages or self.spec.max_pages
+        if resume and self.load_checkpoint():
+            page = self.checkpoint["current_page"]
+            start_row = self.checkpoint["last_processed_row"] + 1
+        else:
+            page, start_row = self.offset + 1, 1
+
+        pages_read = 0
+        previous = None
+        try:
+            if not self.spec.pagination.open(self, page):
+                self.log(f"Could not open page {page}")
+                return pages_read
+            while page <= max_pages:
+                self.checkpoint["current_page"] = page
+                records = self.crawl_page(page, start_row)
+                if records is None:
+                    self.log(f"No rows on page {page}. Ending crawl.")
+                    break
+                # 마지막 페이지 이후 같은 목록을 다시 돌려주는 사이트 대비
+                fingerprint = [record.get('Title') for record in records]
+                if fingerprint == previous:
+                    self.log(f"Page {page} repeats the previous page. Ending crawl.")
+                    break
+                previous = fingerprint
+                pages_read += 1
+
+                page += self.stride
+                start_row = 1
+                self.checkpoint.update(current_page=page, last_processed_row=0)
+                self.save_checkpoint()
+                if page > max_pages:
+                    break
+                moved = self.spec.pagination.advance(self, page) if self.stride == 1 else self.spec.pagination.open(self, page)
+                if not moved:
+                    break
+            # 끝까지 돌았으면 다음 실행은 처음부터
+            if os.path.exists(self.checkpoint_file):
+                os.remove(self.checkpoint_file)
+            self.log(f"Crawling completed: {pages_read} pages")
+        except KeyboardInterrupt:
+            self.log("Interrupted. Progress saved to the checkpoint.")
+            self.save_checkpoint()
+            raise
+        except Exception as e:
+            self.log(f"Error during crawl: {e}")
+            self.save_checkpoint()
+        return pages_read
+
+    def close(self):
+        self.driver.quit()
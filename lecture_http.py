@@ -0,0 +1,208 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from lecture_engine import NOT_FOUND, USER_AGENT, DetailPage, LectureCrawler, is_page_url
+
+try:
+    import requests
+    from cssselect import HTMLTranslator
+    from lxml import etree, html
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    # requests/lxml/cssselect 가 없으면 모든 사이트를 브라우저로 크롤
+    requests = None
+
+# 사이트 여러 개와 분할 크롤이 같이 쓰는 연결 풀 크기
+POOL_SIZE = 16
+REQUEST_TIMEOUT = 20
+# 목록 한 페이지의 상세 페이지를 동시에 받는 수
+DETAIL_WORKERS = 8
+SKIPPED_TAGS = ('script', 'style')
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Shared requests session with pooled keep-alive connections and retries"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+            _session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Language': 'ko-KR,ko;q=0.9',
+            })
+        return _session
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector):
+    """
+    CSS selector relative to a row → compiled XPath
+
+    ':scope > td' becomes a child step of the row, any other selector
+    searches the row's descendants (like element.querySelector).
+    """
+    translator = HTMLTranslator()
+    if selector.startswith(':scope'):
+        rest = selector[len(':scope'):].strip()
+        if rest.startswith('>'):
+            rest = rest[1:].strip()
+        return etree.XPath(translator.css_to_xpath(rest, prefix='./'))
+    return etree.XPath(translator.css_to_xpath(selector, prefix='descendant::'))
+
+
+def _text_parts(element, parts):
+    if element.tag == 'br':
+        parts.append('\n')
+    elif isinstance(element.tag, str) and element.tag not in SKIPPED_TAGS and element.text:
+        parts.append(element.text)
+    if element.tag not in SKIPPED_TAGS:
+        for child in element:
+            _text_parts(child, parts)
+            if child.tail:
+                parts.append(child.tail)
+
+
+def element_text(element):
+    """innerText 근사 - <br> 은 줄바꿈, 줄마다 공백 정리"""
+    parts = []
+    _text_parts(element, parts)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def inner_html(element):
+    return (element.text or '') + ''.join(html.tostring(child, encoding='unicode') for child in element)
+
+
+def parse_fields(document, fields, row_selector=None):
+    """read_fields 와 같은 결과를 브라우저 없이 lxml 문서에서 만듦"""
+    rows = compile_selector(row_selector)(document) if row_selector else [document]
+    records = []
+    for row in rows:
+        record = {}
+        for name, field in fields.items():
+            found = compile_selector(field.selector)(row) if field.selector else [row]
+            raw = None
+            if found:
+                element = found[0]
+                if field.attr == 'text':
+                    raw = element_text(element)
+                elif field.attr == 'html':
+                    raw = inner_html(element)
+                else:
+                    raw = element.get(field.attr)
+            field.apply(name, raw, record)
+        records.append(record)
+    return records
+
+
+def http_capable(spec):
+    """
+    목록을 페이지 주소로 열 수 있고 상세가 일반 페이지인 사이트만 HTTP 로 크롤 가능
+
+    상세 페이지에서 탭 등을 눌러야 하는 사이트(DetailPage.clicks)는 그 내용이
+    받은 HTML 에 없을 수 있어 http=True 로 지정하지 않으면 브라우저로 크롤
+    """
+    if requests is None or spec.http is False:
+        return False
+    if isinstance(spec.detail, DetailPage) and spec.detail.clicks and spec.http is not True:
+        return False
+    return spec.pagination.addressable and (spec.detail is None or isinstance(spec.detail, DetailPage))
+
+
+class HttpCrawler(LectureCrawler):
+    """
+    LectureCrawler that fetches list and detail pages over HTTP
+
+    No browser is started: pages come from the shared pooled session and are
+    parsed with lxml using the same site spec selectors. Only works for
+    server-rendered sites, which probe() checks before a crawl.
+    """
+
+    def start_browser(self, headless, driver=None):
+        self.driver = None
+        self.session = get_session()
+        self.document = None
+
+    def fetch(self, url):
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        # 헤더에 charset 이 없으면 requests 가 ISO-8859-1 로 가정하므로 본문으로 판별
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+            response.encoding = response.apparent_encoding
+        document = html.document_fromstring(response.text)
+        document.make_links_absolute(response.url)
+        return document
+
+    def load(self, url):
+        self.document = self.fetch(url)
+        self.checkpoint["last_url"] = url
+
+    def wait_for_rows(self):
+        pass
+
+    def extract(self, fields, row_selector=None):
+        return parse_fields(self.document, fields, row_selector)
+
+    def fetch_detail(self, record):
+        try:
+            document = self.fetch(record['Detail'])
+            record.update(parse_fields(document, self.spec.detail.fields)[0])
+            record['_detail_read'] = True
+        except Exception as e:
+            self.log(f"Error reading detail page {record['Detail']}: {e}")
+
+    def fetch_details(self, records):
+        """목록에서 모은 상세 주소를 풀 세션으로 동시에 받아 파싱"""
+        targets = [record for record in records if is_page_url(record.get('Detail'))]
+        with ThreadPoolExecutor(max_workers=min(DETAIL_WORKERS, len(targets) or 1)) as executor:
+            list(executor.map(self.fetch_detail, targets))
+
+    def probe(self):
+        """True if the first list page has the required fields and its first detail page can be read"""
+        try:
+            self.load(self.spec.pagination.page_url(self.spec.start_url, 1))
+            records = self.extract(self.spec.fields, self.spec.row_selector)
+            if records and self.spec.detail:
+                self.fetch_details(records[:1])
+        except Exception as e:
+            self.log(f"HTTP probe failed: {e}")
+            return False
+        if not records:
+            return False
+        # 상세 페이지를 HTTP 로 읽지 못하면 상세 항목이 모두 'Not found' 가 됨
+        if self.spec.detail and not records[0].get('_detail_read'):
+            return False
+        return all(records[0].get(field, NOT_FOUND) != NOT_FOUND for field in self.spec.required)
+
+    def close(self):
+        self.document = None
+
+
+def detect_mode(spec, mode='auto'):
+    """'http' when the site can be crawled without a browser, otherwise 'browser'"""
+    if mode == 'browser' or not http_capable(spec):
+        return 'browser'
+    if mode == 'http' or spec.http:
+        return 'http'
+    crawler = HttpCrawler(spec, incremental=False)
+    if crawler.probe():
+        crawler.log("Using HTTP-only mode")
+        return 'http'
+    crawler.log("Required content missing over HTTP, falling back to the browser")
+    return 'browser'
+
+
+def create_crawler(spec, mode='auto', headless=True, **kwargs):
+    if detect_mode(spec, mode) == 'http':
+        return HttpCrawler(spec, **kwargs)
+    return LectureCrawler(spec, headless=headless, **kwargs)
@@ -0,0 +1,333 @@
+import argparse
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from datetime import datetime
+
+import pandas as pd
+
+from csv_encoding import read_csv
+from job_normalize import parse_period_end, parse_period_start
+from region_index import get_region_index
+
+DEFAULT_DB_FILE = "lecture_index.db"
+# 강좌 크롤러들이 쓰는 CSV (posting_queue 의 culture 소스와 같음)
+LECTURE_SOURCES = ['*_education.csv', '*_lecture*.csv', 'cultural_lectures.csv', 'suwon_lecutre.csv']
+
+# 통합 스키마 - 사이트 CSV 의 열 이름 그대로
+CANONICAL_COLUMNS = ['City', 'Category', 'Title', 'Institution', 'Address', 'Tel', 'Recruitment_period',
+                     'Education_period', 'Date', 'Quota', 'Fee', 'State', 'Detail']
+# 사이트마다 다른 열 이름 → 통합 이름 (통합 이름의 열이 없을 때만)
+COLUMN_ALIASES = {
+    'Fees': 'Fee',
+    'Lecture_Category': 'Category',
+}
+# City 가 없거나 주소로 지역을 알 수 없는 행의 출처별 지역
+SOURCE_CITIES = {
+    'suwon_education.csv': '경기도 수원시',
+    'suwon_lecutre.csv': '경기도 수원시',
+    'anyang_lectures.csv': '경기도 안양시',
+    'busan_education.csv': '부산광역시',
+    'andong_education.csv': '경상북도 안동시',
+    'sangju_education.csv': '경상북도 상주시',
+    'pyeongtaek_education.csv': '경기도 평택시',
+    'incheon_seogu_education.csv': '인천광역시 서구',
+    'incheon_donggu_education.csv': '인천광역시 동구',
+    'yeonsu_education.csv': '인천광역시 연수구',
+    # 서울시50플러스재단 (센터가 서울 여러 구에 있음)
+    'cultural_lectures.csv': '서울특별시',
+}
+MISSING_VALUES = {'Not found', 'nan', 'NaN', 'None'}
+# 제목 앞뒤의 모집 상태 꼬리표 - [일월수목원], [오전반] 처럼 강좌를 구분하는 머리말은 남김
+STATUS_TAGS = ['모집중', '모집마감', '모집예정', '접수중', '접수마감', '접수예정', '신청중', '신청마감', '마감임박',
+               '마감', '대기접수', '추가모집', '진행중', '종료', '선착순', '신규', '인기', 'new', 'hot']
+TAG_PATTERN = re.compile(r'[\[【(]\s*(?:' + '|'.join(STATUS_TAGS) + r')\s*[\]】)]|</?[a-z][^>]*>',
+                         re.IGNORECASE)
+NON_WORD_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+STORED_COLUMNS = ['LectureKey'] + CANONICAL_COLUMNS + ['Sido', 'Sigungu', 'RecruitStart', 'RecruitEnd', 'Source']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lectures (
+    LectureKey         TEXT PRIMARY KEY,
+    City               TEXT,
+    Category           TEXT,
+    Title              TEXT,
+    Institution        TEXT,
+    Address            TEXT,
+    Tel                TEXT,
+    Recruitment_period TEXT,
+    Education_period   TEXT,
+    Date               TEXT,
+    Quota              TEXT,
+    Fee                TEXT,
+    State              TEXT,
+    Detail             TEXT,
+    Sido               TEXT,
+    Sigungu            TEXT,
+    RecruitStart       TEXT,
+    RecruitEnd         TEXT,
+    Source             TEXT,
+    FirstSeen          TEXT,
+    UpdatedAt          TEXT
+);
+CREATE INDEX IF NOT EXISTS lectures_city ON lectures (City);
+CREATE INDEX IF NOT EXISTS lectures_region ON lectures (Sido, Sigungu);
+CREATE INDEX IF NOT EXISTS lectures_category ON lectures (Category);
+CREATE INDEX IF NOT EXISTS lectures_recruit ON lectures (RecruitEnd, RecruitStart);
+CREATE TABLE IF NOT EXISTS sources (
+    file        TEXT PRIMARY KEY,
+    mtime       REAL,
+    size        INTEGER,
+    rows        INTEGER,
+    ingested_at TEXT
+);
+"""
+
+
+def normalize_key_text(value):
+    """비교용 문자열 - 모집 상태 꼬리표/HTML 태그/공백/기호 제거, 전각 문자와 대소문자 통일"""
+    value = unicodedata.normalize('NFKC', value).lower()
+    return NON_WORD_PATTERN.sub('', TAG_PATTERN.sub(' ', value))
+
+
+def resolve_regions(df, default_city=''):
+    """
+    Canonical (Sido, Sigungu) per row
+
+    The address is tried first, inside the province named by City (so a
+    bare '서구 가정로' resolves in 인천); then the City text itself
+    ('인천 서구', '인천시 연수구'); then the source's default city.
+    """
+    index = get_region_index()
+    default = index.resolve(default_city)
+    sidos, sigungus = [], []
+    for city, address in zip(df['City'], df['Address']):
+        from_city = index.resolve(city)
+        from_address = index.resolve(address, default_sido=(from_city.sido or default.sido) or None)
+        candidates = [from_address, from_city, default]
+        region = next((r for r in candidates if r.sigungu), None) or next((r for r in candidates if r.sido), default)
+        sidos.append(region.sido)
+        sigungus.append(region.sigungu)
+    return pd.Series(sidos, index=df.index), pd.Series(sigungus, index=df.index)
+
+
+def _dates(values):
+    return values.dt.strftime('%Y-%m-%d').fillna('')
+
+
+def normalize_lectures(df, source):
+    """
+    One site's CSV → canonical columns plus region, recruitment window and key
+
+    Missing columns are added empty and 'Not found' becomes ''. City is
+    rewritten to the canonical '시도 시군구' from resolve_regions. The
+    lecture key hashes the normalized title, institution (or region) and
+    education start date, so the same lecture gets the same key on every
+    site that lists it; rows of one file that only differ in their detail
+    page (or address) keep separate keys.
+    """
+    df = df.rename(columns={old: new for old, new in COLUMN_ALIASES.items()
+                            if old in df.columns and new not in df.columns})
+    result = pd.DataFrame(index=df.index)
+    for column in CANONICAL_COLUMNS:
+        values = df[column] if column in df.columns else pd.Series('', index=df.index)
+        values = values.fillna('').astype(str).str.strip()
+        result[column] = values.where(~values.isin(MISSING_VALUES), '')
+
+    default_city = SOURCE_CITIES.get(os.path.basename(source), '')
+    result['Sido'], result['Sigungu'] = resolve_regions(result, default_city)
+    canonical_city = (result['Sido'] + ' ' + result['Sigungu']).str.strip()
+    result['City'] = canonical_city.where(canonical_city != '', result['City'])
+
+    result['RecruitStart'] = _dates(parse_period_start(result['Recruitment_period']))
+    result['RecruitEnd'] = _dates(parse_period_end(result['Recruitment_period']))
+    education_start = _dates(parse_period_start(result['Education_period']))
+
+    titles = result['Title'].map(normalize_key_text)
+    places = result['Institution'].map(normalize_key_text)
+    places = places.where(places != '', (result['Sido'] + result['Sigungu']).map(normalize_key_text))
+    starts = education_start.where(education_start != '', result['Education_period'].map(normalize_key_text))
+    base = [f"{title}|{place}|{start}" for title, place, start in zip(titles, places, starts)]
+    # 같은 파일 안에서 키가 겹치지만 상세 주소(없으면 장소)가 다른 행은 서로 다른 강좌
+    # (장소만 다른 회차 등) - 그 행들만 상세 주소까지 키에 넣음
+    locators = result['Detail'].where(result['Detail'] != '', result['Address'])
+    ambiguous = pd.Series(locators.values, index=base).groupby(level=0).transform('nunique').to_numpy() > 1
+    result['LectureKey'] = [
+        hashlib.sha1((f"{key}|{locator}" if split else key).encode('utf-8')).hexdigest()[:20]
+        for key, locator, split in zip(base, locators, ambiguous)
+    ]
+    result['Source'] = os.path.basename(source)
+    # 제목이 없는 행은 색인하지 않음; 같은 파일 안의 중복은 마지막 행 기준
+    result = result[titles != '']
+    return result.drop_duplicates(subset=['LectureKey'], keep='last')[STORED_COLUMNS]
+
+
+class LectureIndex:
+    """
+    All lecture CSVs in one sqlite store with a canonical schema
+
+    Every source file is normalized with normalize_lectures and upserted by
+    lecture key, so duplicates within and across sites collapse into one
+    row; a value only replaces a stored one when it is not empty. Files are
+    re-read only when their size or mtime changed, so ingesting after each
+    site finishes stays cheap. City, region, Category and the recruitment
+    window are indexed for find().
+    """
+
+    def __init__(self, db_file=DEFAULT_DB_FILE):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+
+        columns = ', '.join(STORED_COLUMNS)
+        placeholders = ', '.join('?' for _ in STORED_COLUMNS)
+        updates = ', '.join(
+            f"{column} = CASE WHEN excluded.{column} != '' THEN excluded.{column} ELSE {column} END"
+            for column in STORED_COLUMNS[1:]
+        )
+        self.upsert_sql = (
+            f"INSERT INTO lectures ({columns}, FirstSeen, UpdatedAt) VALUES ({placeholders}, ?, ?) "
+            f"ON CONFLICT(LectureKey) DO UPDATE SET {updates}, UpdatedAt = excluded.UpdatedAt"
+        )
+
+    def source_files(self, patterns=LECTURE_SOURCES):
+        files = []
+        for pattern in patterns:
+            for path in sorted(glob.glob(pattern)):
+                if path not in files:
+                    files.append(path)
+        return files
+
+    def is_current(self, path):
+        stat = os.stat(path)
+        with self.lock:
+            row = self.conn.execute("SELECT mtime, size FROM sources WHERE file = ?",
+                                    (os.path.abspath(path),)).fetchone()
+        return row is not None and row[0] == stat.st_mtime and row[1] == stat.st_size
+
+    def ingest_file(self, path, force=False):
+        """Normalize and upsert one CSV; returns the rows ingested (0 if unchanged)"""
+        if not os.path.exists(path) or (not force and self.is_current(path)):
+            return 0
+        stat = os.stat(path)
+        try:
+            df = read_csv(path, dtype=str)
+        except Exception as e:
+            print(f"Error reading {path}: {e}")
+            return 0
+        lectures = normalize_lectures(df, path)
+
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock, self.conn:
+            self.conn.executemany(self.upsert_sql, [row + (now, now) for row in lectures.itertuples(index=False)])
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources (file, mtime, size, rows, ingested_at) VALUES (?, ?, ?, ?, ?)",
+                (os.path.abspath(path), stat.st_mtime, stat.st_size, len(lectures), now),
+            )
+        print(f"Indexed {len(lectures)} lectures from {path} ({len(self)} in the index)")
+        return len(lectures)
+
+    def ingest_all(self, patterns=LECTURE_SOURCES, force=False):
+        return sum(self.ingest_file(path, force) for path in self.source_files(patterns))
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM lectures").fetchone()[0]
+
+    def find(self, city=None, category=None, recruiting_on=None, limit=None):
+        """
+        Lectures as a DataFrame, filtered by any of
+
+        city: a 시도 or 시군구 in any common spelling ('인천', '인천 서구', '수원시'),
+              or an exact City, Sido or Sigungu ('서구')
+        category: exact Category
+        recruiting_on: 'YYYY-MM-DD' inside the recruitment window
+        """
+        conditions, params = [], []
+        if city:
+            # '인천 서구', '수원시' 처럼 쓴 지역도 저장된 시도/시군구로 바꿔 찾음
+            region = get_region_index().resolve(city)
+            if region.sigungu:
+                conditions.append("Sido = ? AND Sigungu = ?")
+                params += [region.sido, region.sigungu]
+            elif region.sido:
+                conditions.append("Sido = ?")
+                params.append(region.sido)
+            else:
+                conditions.append("(City = ? OR Sido = ? OR Sigungu = ?)")
+                params += [city, city, city]
+        if category:
+            conditions.append("Category = ?")
+            params.append(category)
+        if recruiting_on:
+            conditions.append("RecruitEnd >= ? AND RecruitStart != '' AND RecruitStart <= ?")
+            params += [recruiting_on, recruiting_on]
+        sql = "SELECT * FROM lectures"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY RecruitEnd, Title"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self.lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def export_csv(self, filename, **filters):
+        df = self.find(**filters)
+        df.to_csv(filename, index=False, encoding='utf-8-sig', lineterminator='\n')
+        return len(df)
+
+    def close(self):
+        self.conn.close()
+
+
+_shared_index = None
+_shared_index_lock = threading.Lock()
+
+
+def index_site_output(filename, db_file=DEFAULT_DB_FILE):
+    """Ingest one site's CSV right after its crawl (one shared store per process)"""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = LectureIndex(db_file)
+    try:
+        return _shared_index.ingest_file(filename)
+    except Exception as e:
+        print(f"Error indexing {filename}: {e}")
+        return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build and query the unified lecture index")
+    parser.add_argument('files', nargs='*', help=f"CSV files to ingest (default: {' '.join(LECTURE_SOURCES)})")
+    parser.add_argument('--db', default=DEFAULT_DB_FILE)
+    parser.add_argument('--force', action='store_true', help='re-read files even if unchanged')
+    parser.add_argument('--city')
+    parser.add_argument('--category')
+    parser.add_argument('--recruiting-on', help='YYYY-MM-DD, or "today"')
+    parser.add_argument('--export', help='write the (filtered) lectures to this CSV')
+    args = parser.parse_args()
+
+    index = LectureIndex(args.db)
+    if args.files:
+        for path in args.files:
+            index.ingest_file(path, force=args.force)
+    else:
+        index.ingest_all(force=args.force)
+
+    recruiting_on = datetime.now().strftime('%Y-%m-%d') if args.recruiting_on == 'today' else args.recruiting_on
+    filters = {'city': args.city, 'category': args.category, 'recruiting_on': recruiting_on}
+    if args.export:
+        print(f"Exported {index.export_csv(args.export, **filters)} lectures to {args.export}")
+    elif any(filters.values()):
+        print(index.find(**filters)[['City', 'Category', 'Title', 'Recruitment_period']].to_string())
+    print(f"Lectures in the index: {len(index)}")
+    index.close()
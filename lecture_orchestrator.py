@@ -0,0 +1,256 @@
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+
+from lecture_http import create_crawler, detect_mode
+from lecture_index import index_site_output
+from lecture_sites import SITES
+
+# 동시에 띄울 크롬 수 (전체)
+DEFAULT_BROWSER_BUDGET = 4
+# 페이지 주소로 바로 열 수 있는 사이트에 쓸 브라우저 수 (클릭 페이지네이션은 항상 1)
+DEFAULT_SITE_LIMIT = 2
+# 사이트별 지난 실행의 마지막 페이지 (ETA 추정용)
+HISTORY_FILE = "lecture_crawl_history.json"
+PROGRESS_INTERVAL = 30
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "?"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class CrawlProgress:
+    """
+    Pages and rows per site plus an ETA from each site's page rate
+
+    The expected page count comes from the last run's history (or the page
+    limit), so the first run only shows a rough ETA. Sites run side by side,
+    so the overall ETA is that of the slowest site.
+    """
+
+    def __init__(self, specs, max_pages=None, history_file=HISTORY_FILE):
+        self.history_file = history_file
+        self.lock = threading.Lock()
+        history = self.load_history()
+        self.sites = {}
+        for spec in specs:
+            limit = max_pages or spec.max_pages
+            self.sites[spec.name] = {
+                'pages': 0, 'rows': 0, 'kept': 0, 'last_page': 0,
+                'expected': min(history.get(spec.name, limit), limit),
+                'shards': 0, 'running': 0, 'started': None, 'finished': None, 'mode': 'browser',
+            }
+
+    def load_history(self):
+        if not os.path.exists(self.history_file):
+            return {}
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading crawl history: {e}")
+            return {}
+
+    def save_history(self):
+        history = self.load_history()
+        with self.lock:
+            for name, site in self.sites.items():
+                if site['finished'] and site['last_page']:
+                    history[name] = site['last_page']
+        with open(self.history_file, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+
+    def add_shard(self, name, mode):
+        with self.lock:
+            self.sites[name]['shards'] += 1
+            self.sites[name]['mode'] = mode
+
+    def shard_started(self, name):
+        with self.lock:
+            site = self.sites[name]
+            site['running'] += 1
+            site['started'] = site['started'] or time.monotonic()
+
+    def shard_finished(self, name):
+        with self.lock:
+            site = self.sites[name]
+            site['running'] -= 1
+            site['shards'] -= 1
+            if site['shards'] == 0:
+                site['finished'] = time.monotonic()
+
+    def page_done(self, crawler, page, rows, kept):
+        with self.lock:
+            site = self.sites[crawler.spec.name]
+            site['pages'] += 1
+            site['rows'] += rows
+            site['kept'] += kept
+            site['last_page'] = max(site['last_page'], page)
+
+    def eta(self, site, now):
+        if site['finished']:
+            return 0
+        if not site['started'] or not site['pages']:
+            return None
+        rate = site['pages'] / (now - site['started'])
+        return max(site['expected'] - site['pages'], 0) / rate
+
+    def report(self):
+        now = time.monotonic()
+        lines = []
+        etas = []
+        with self.lock:
+            for name, site in self.sites.items():
+                if site['finished']:
+                    state = "done"
+                elif site['running']:
+                    state = f"{site['running']} {site['mode']}"
+                else:
+                    state = "waiting"
+                eta = self.eta(site, now)
+                etas.append(eta)
+                lines.append(f"  {name:<24} {site['pages']:>4}/{site['expected']:<4} pages "
+                             f"{site['kept']:>5} lectures  {state:<12} ETA {format_duration(eta)}")
+        overall = None if None in etas else max(etas, default=0)
+        return "\n".join([f"Progress (overall ETA {format_duration(overall)}):"] + lines)
+
+
+class LectureOrchestrator:
+    """
+    Crawl several lecture sites at once within a global browser budget
+
+    Every site is split into shards: sites with addressable pages get up to
+    their site limit of browsers, each reading every n-th page with its own
+    checkpoint slot; other sites get one. browser_budget worker threads take
+    shards from a queue, first shards of all sites before any second shard,
+    so every site starts as early as possible. Sites that work over plain
+    HTTP (see lecture_http) do not count against the browser budget; each of
+    their shards runs in its own thread. Every category of a site with
+    category lists is planned as a site of its own, so the categories are
+    crawled side by side and merge into the site's output file. When a site
+    is done its CSV is ingested into the unified lecture index.
+    """
+
+    def __init__(self, specs, browser_budget=DEFAULT_BROWSER_BUDGET, site_limits=None,
+                 headless=True, max_pages=None, resume=True, mode='auto', incremental=True, index=True):
+        # 카테고리별 목록이 있는 사이트는 카테고리마다 따로 크롤
+        self.specs = [part for spec in specs for part in spec.split_categories()]
+        self.browser_budget = browser_budget
+        self.site_limits = site_limits or {}
+        self.headless = headless
+        self.max_pages = max_pages
+        self.resume = resume
+        self.mode = mode
+        self.incremental = incremental
+        self.index = index
+        self.progress = CrawlProgress(self.specs, max_pages)
+        self.shards = queue.Queue()
+        self.http_shards = []
+
+    def shard_count(self, spec):
+        if not spec.pagination.addressable:
+            return 1
+        return max(1, self.site_limits.get(spec.name, self.site_limits.get(spec.site, DEFAULT_SITE_LIMIT)))
+
+    def plan(self):
+        modes = {spec.name: detect_mode(spec, self.mode) for spec in self.specs}
+        counts = {spec.name: self.shard_count(spec) for spec in self.specs}
+        for offset in range(max(counts.values(), default=0)):
+            for spec in self.specs:
+                if offset < counts[spec.name]:
+                    shard = (spec, modes[spec.name], counts[spec.name], offset)
+                    if modes[spec.name] == 'http':
+                        self.http_shards.append(shard)
+                    else:
+                        self.shards.put(shard)
+                    self.progress.add_shard(spec.name, modes[spec.name])
+
+    def crawl_shard(self, spec, mode, stride, offset):
+        self.progress.shard_started(spec.name)
+        try:
+            crawler = create_crawler(spec, mode, headless=self.headless, stride=stride, offset=offset,
+                                     on_page=self.progress.page_done, incremental=self.incremental)
+            try:
+                crawler.run(max_pages=self.max_pages, resume=self.resume)
+            finally:
+                crawler.close()
+        except Exception as e:
+            print(f"[{spec.name}] Shard {offset + 1}/{stride} failed: {e}")
+        finally:
+            self.progress.shard_finished(spec.name)
+        # 사이트(카테고리)의 마지막 분할이 끝나면 통합 색인에 반영
+        if self.index and self.progress.sites[spec.name]['finished']:
+            index_site_output(spec.output)
+
+    def worker(self):
+        while True:
+            try:
+                shard = self.shards.get_nowait()
+            except queue.Empty:
+                return
+            self.crawl_shard(*shard)
+
+    def run(self, progress_interval=PROGRESS_INTERVAL):
+        self.plan()
+        started = time.monotonic()
+        workers = [threading.Thread(target=self.worker, name=f"lecture-browser-{i + 1}", daemon=True)
+                   for i in range(min(self.browser_budget, self.shards.qsize()))]
+        workers += [threading.Thread(target=self.crawl_shard, args=shard, daemon=True,
+                                     name=f"lecture-http-{shard[0].name}-{shard[3] + 1}")
+                    for shard in self.http_shards]
+        for worker in workers:
+            worker.start()
+        try:
+            while any(worker.is_alive() for worker in workers):
+                for worker in workers:
+                    worker.join(progress_interval / len(workers))
+                print(self.progress.report())
+        finally:
+            self.progress.save_history()
+        print(f"All sites finished in {format_duration(time.monotonic() - started)}")
+
+
+def parse_site_limits(values):
+    """['suwon=3', 'busan=1'] → {'suwon': 3, 'busan': 1}"""
+    limits = {}
+    for value in values:
+        name, _, count = value.partition('=')
+        limits[name] = int(count)
+    return limits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl all lecture sites concurrently")
+    parser.add_argument('sites', nargs='*', default=list(SITES), help=f"site names ({', '.join(SITES)})")
+    parser.add_argument('--browsers', type=int, default=DEFAULT_BROWSER_BUDGET, help='global browser budget')
+    parser.add_argument('--site-limit', action='append', default=[], metavar='SITE=N',
+                        help='browsers for one site (default %d for page-addressable sites)' % DEFAULT_SITE_LIMIT)
+    parser.add_argument('--max-pages', type=int, default=None)
+    parser.add_argument('--mode', choices=['auto', 'http', 'browser'], default='auto',
+                        help='auto tries plain HTTP first and falls back to the browser per site')
+    parser.add_argument('--restart', action='store_true', help='ignore saved checkpoints')
+    parser.add_argument('--full', action='store_true', help='read every detail page even if the list is unchanged')
+    parser.add_argument('--no-index', action='store_true', help='do not update the unified lecture index')
+    parser.add_argument('--show-browser', action='store_true')
+    parser.add_argument('--progress-interval', type=int, default=PROGRESS_INTERVAL)
+    args = parser.parse_args()
+
+    orchestrator = LectureOrchestrator(
+        [SITES[name] for name in args.sites],
+        browser_budget=args.browsers,
+        site_limits=parse_site_limits(args.site_limit),
+        headless=not args.show_browser,
+        max_pages=args.max_pages,
+        resume=not args.restart,
+        mode=args.mode,
+        incremental=not args.full,
+        index=not args.no_index,
+    )
+    orchestrator.run(progress_interval=args.progress_interval)
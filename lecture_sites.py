@@ -0,0 +1,319 @@
+import argparse
+import threading
+
+from lecture_engine import (NOT_FOUND, Category, ClickPagination, DetailPage, Field, PopupDetail, SiteSpec,
+                            UrlPagination)
+from lecture_http import create_crawler
+from lecture_index import index_site_output
+from region_index import category_from_address
+
+TEST_COURSE_KEYWORDS = ['테스트강좌', '테스트 강좌']
+
+
+def busan_category(lecture, record):
+    lecture["Category"] = category_from_address(lecture["Address"], default_sido='부산광역시')
+
+
+def join_date_parts(lecture, record):
+    """요일과 시간이 다른 칸에 있는 사이트 - 'Date' 에 합침"""
+    parts = [record.get(key) for key in ('Date', 'Time') if record.get(key) not in (None, NOT_FOUND)]
+    lecture["Date"] = ' '.join(parts) or NOT_FOUND
+
+
+def not_test_course(record):
+    return not any(keyword in record.get("Title", "") for keyword in TEST_COURSE_KEYWORDS)
+
+
+SUWON = SiteSpec(
+    name="suwon",
+    start_url='https://www.suwon.go.kr/web/reserv/edu/list.do?q_rowPerPage=10&q_currPage=1&q_sortName=&q_sortOrder=&q_orgSeqNo=&q_serviceSeqNo=&q_searchKey=ALL&q_progressStatusCd=72&q_searchVal=',
+    row_selector="#contents_box > table > tbody > tr",
+    fields={
+        "Title": Field(":scope > td.p-subject"),
+        "Detail": Field(":scope > td.p-subject a", attr='href'),
+        "Period": Field(":scope > td:nth-child(3)", split=("Recruitment_period", "Education_period")),
+        "Date": Field(":scope > td:nth-child(4)"),
+        "Quota": Field(":scope > td:nth-child(6)"),
+        "Address": Field(":scope > td:nth-child(7)"),
+        "State": Field(":scope > td.edu"),
+    },
+    columns=["City", "Title", "Recruitment_period", "Education_period", "Date", "Quota",
+             "Institution", "Address", "State", "Detail"],
+    defaults={"City": "경기도 수원시", "Institution": ""},
+    output="suwon_education.csv",
+    pagination=UrlPagination('q_currPage'),
+    dedupe_on=['Title', 'Education_period', 'Address'],
+)
+
+ANYANG = SiteSpec(
+    name="anyang",
+    start_url='https://www.anyang.go.kr/reserve/selectEduLctreWebList.do?key=1376&searchDiv=0&searchInsttNo=&searchRcritSttus=&searchKrwd=',
+    row_selector="#contents > div > table > tbody > tr",
+    fields={
+        "Lecture_Category": Field(":scope > td:nth-child(2)"),
+        "Title": Field(":scope > td.p-subject > a"),
+        "Period": Field(":scope > td:nth-child(4)", split=("Recruitment_period", "Education_period")),
+        "Place": Field(":scope > td:nth-child(5)", split=("Institution", "Address")),
+        "Quota": Field(":scope > td:nth-child(6)"),
+        "State": Field(":scope > td:nth-child(7)"),
+        "Register": Field(":scope > td:nth-child(8)"),
+        "Detail": Field(":scope > td:nth-child(9) > a", attr='href'),
+    },
+    columns=["City", "Lecture_Category", "Title", "Recruitment_period", "Education_period",
+             "Institution", "Address", "Quota", "State", "Register", "Detail"],
+    defaults={"City": "경기도 안양시"},
+    keep=lambda record: record["State"] == "모집중",
+    output="anyang_lectures.csv",
+    pagination=UrlPagination('pageIndex'),
+    dedupe_on=['City', 'Title', 'Institution', 'Education_period'],
+    max_pages=10,
+)
+
+BUSAN_INFO = "#viewForm > div.reserveStateWrap > div > div.reserveStateInfo"
+BUSAN = SiteSpec(
+    name="busan",
+    start_url='https://reserve.busan.go.kr/lctre?curPage=1&resveGroupSn=&progrmSn=&srchGugun=&srchCtgry=&srchBeginDe=&srchEndDe=&srchIngStat=RI&srchResveMth=&srchVal=',
+    row_selector="#contents > div.reserveListType > div.reserveListWrap > ul > li",
+    fields={
+        "Title": Field(":scope > a"),
+        "Detail": Field(":scope > a", attr='href'),
+    },
+    detail=DetailPage(
+        fields={
+            "Title": Field("#viewForm > div.contHeader.titStateHeader > h3"),
+            "Recruitment_period": Field(f"{BUSAN_INFO} > dl:nth-child(2) > dd > span"),
+            "Education_period": Field(f"{BUSAN_INFO} > dl:nth-child(1) > dd > span"),
+            "Date": Field(f"{BUSAN_INFO} > dl:nth-child(6) > dd > span"),
+            "Quota": Field(f"{BUSAN_INFO} > div.tableStateWrap > table > tbody > tr > td:nth-child(2) > span"),
+            "Institution": Field(f"{BUSAN_INFO} > dl:nth-child(8) > dd > span"),
+            "Tel": Field(f"{BUSAN_INFO} > dl:nth-child(7) > dd"),
+            "Fee": Field(f"{BUSAN_INFO} > dl:nth-child(5) > dd"),
+            "Address": Field("#reserveTabCont2 > div > div.h4Section > div:nth-child(2) > ul > li"),
+        },
+        wait_for="#viewForm > div.contHeader.titStateHeader > h3",
+        # 주소는 두 번째 탭에 있음
+        clicks=("#viewForm > div.reserveDetail > div.reserveTabWrap > ul > li:nth-child(2) > a",),
+    ),
+    columns=["Title", "Recruitment_period", "Education_period", "Date", "Quota", "Institution",
+             "Address", "Tel", "Category", "Fee", "Detail"],
+    finalize=busan_category,
+    output="busan_education.csv",
+    pagination=UrlPagination('curPage'),
+    dedupe_on=['Detail'],
+)
+
+ANDONG = SiteSpec(
+    name="andong",
+    start_url='https://www.andong.go.kr/edu/forever/lecture/search.do?mId=0101000000&currentPageNo=1&detailSearchYn=true&_lifelongYn=on&_externalOrgYn=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_typeList=on&_lectureTimeList=on&_lectureTimeList=on&_lectureTimeList=on&_lectureTimeList=on&_lectureTimeList=on&_eduDayList=on&_eduDayList=on&_eduDayList=on&_eduDayList=on&_eduDayList=on&_eduDayList=on&_eduDayList=on&eduGroupList=1&_eduGroupList=on&_eduGroupList=on&_eduGroupList=on&_eduGroupList=on&_eduGroupList=on&eduGroupList=6&_eduGroupList=on&eduGroupList=7&_eduGroupList=on&_costTypeList=on&_costTypeList=on&_recruitmentTypeList=on&_recruitmentTypeList=on&stateList=1&_stateList=on&_stateList=on&_stateList=on&_stateList=on&keyword=&recordCountPerPage=12',
+    row_selector="#listForm > div.list-cont.open > ul > li",
+    fields={
+        "Title": Field(":scope > a > p"),
+        "Detail": Field(":scope > a", attr='href'),
+    },
+    detail=PopupDetail(
+        fields={
+            "Title": Field("#nameText"),
+            "Education_period": Field("#eduPeriodTd"),
+            "Quota": Field("#numTd"),
+            "Fee": Field("#costTd"),
+            "Address": Field("#placeTd"),
+        },
+        click=":scope > a",
+        wait_for="#nameText",
+        close="#layerpopup_mycode > div > div.pop-con > div.btn-box.taC > a.button.icon.del.close.pop-close",
+    ),
+    columns=["Title", "Education_period", "Quota", "Fee", "Address", "Category", "Detail"],
+    defaults={"Category": "안동시"},
+    keep=not_test_course,
+    output="andong_education.csv",
+    pagination=UrlPagination('currentPageNo'),
+    dedupe_on=['Title'],
+)
+
+SEOGU_VIEW = "#detail_con > div.board_view > ul"
+INCHEON_SEOGU = SiteSpec(
+    name="incheon_seogu",
+    start_url='https://www.seo.incheon.kr/open_content/anyedu/education/dong.jsp?acptrun=y',
+    row_selector="#detail_con > div.board_list > ul > li",
+    fields={
+        "Title": Field(":scope > a"),
+        "Detail": Field(":scope > a", attr='href'),
+    },
+    detail=DetailPage(
+        fields={
+            "Title": Field("#detail_con > div.board_view > div.title > p"),
+            "Institution": Field(f"{SEOGU_VIEW} > li:nth-child(1) > dl > dd"),
+            "Recruitment_period": Field(f"{SEOGU_VIEW} > li:nth-child(4) > dl > dd"),
+            "Education_period": Field(f"{SEOGU_VIEW} > li:nth-child(7) > dl:nth-child(1) > dd"),
+            "Date": Field(f"{SEOGU_VIEW} > li:nth-child(7) > dl:nth-child(2) > dd"),
+            "Time": Field(f"{SEOGU_VIEW} > li:nth-child(8) > dl:nth-child(1) > dd"),
+            "Fee": Field(f"{SEOGU_VIEW} > li:nth-child(10) > dl > dd"),
+            "Address": Field(f"{SEOGU_VIEW} > li:nth-child(11) > dl:nth-child(1) > dd"),
+            "Tel": Field(f"{SEOGU_VIEW} > li:nth-child(11) > dl:nth-child(2) > dd"),
+        },
+        wait_for="#detail_con > div.board_view",
+    ),
+    columns=["Title", "Recruitment_period", "Education_period", "Date", "Quota", "Institution",
+             "Address", "Tel", "Detail", "Fee"],
+    finalize=join_date_parts,
+    output="incheon_seogu_education.csv",
+    pagination=ClickPagination("#detail_con > div.paging.dp_pc"),
+    dedupe_on=['Title', 'Education_period', 'Institution'],
+)
+
+DONGGU_VIEW = "#detail_con > div.board_view > ul"
+
+
+def donggu_detail(date, fee, place):
+    """동구 상세 페이지 - 카테고리마다 요일(다음 칸에 시간)/수강료/장소 칸의 위치가 다름"""
+    return DetailPage(
+        fields={
+            "Title": Field("#detail_con > div.board_view > div.title > p"),
+            "Institution": Field(f"{DONGGU_VIEW} > li:nth-child(1) > dl > dd"),
+            "Quota": Field(f"{DONGGU_VIEW} > li:nth-child(3) > dl:nth-child(1) > dd"),
+            "Recruitment_period": Field(f"{DONGGU_VIEW} > li:nth-child(4) > dl > dd"),
+            "Education_period": Field(f"{DONGGU_VIEW} > li:nth-child(7) > dl:nth-child(1) > dd"),
+            "Date": Field(f"{DONGGU_VIEW} > li:nth-child({date}) > dl:nth-child(2) > dd"),
+            "Time": Field(f"{DONGGU_VIEW} > li:nth-child({date + 1}) > dl:nth-child(1) > dd"),
+            "Fee": Field(f"{DONGGU_VIEW} > li:nth-child({fee}) > dl:nth-child(1) > dd"),
+            "Address": Field(f"{DONGGU_VIEW} > li:nth-child({place}) > dl:nth-child(1) > dd"),
+            "Tel": Field(f"{DONGGU_VIEW} > li:nth-child({place}) > dl:nth-child(2) > dd"),
+        },
+        wait_for="#detail_con > div.board_view",
+    )
+
+
+DONGGU_EDUCATE = 'https://www.icdonggu.go.kr/main/community/educate'
+INCHEON_DONGGU = SiteSpec(
+    name="incheon_donggu",
+    start_url=None,
+    row_selector="#detail_con > div.board_list > ul > li",
+    fields={
+        "Title": Field(":scope > a"),
+        "Detail": Field(":scope > a", attr='href'),
+    },
+    detail=donggu_detail(date=7, fee=9, place=10),
+    categories=[
+        Category("sports", "스포츠", f'{DONGGU_EDUCATE}/sports.jsp?acptrun=y'),
+        Category("autonomy", "자치센터", f'{DONGGU_EDUCATE}/autonomy.jsp?acptrun=y',
+                 detail=donggu_detail(date=8, fee=10, place=12)),
+        Category("library", "도서관", f'{DONGGU_EDUCATE}/double.jsp?acptrun=y'),
+    ],
+    columns=["City", "Category", "Title", "Recruitment_period", "Education_period", "Date", "Quota",
+             "Institution", "Address", "Tel", "Detail", "Fee"],
+    defaults={"City": "인천시 동구"},
+    finalize=join_date_parts,
+    output="incheon_donggu_education.csv",
+    # 목록에 따라 페이지 링크가 p 또는 div 안에 있음
+    pagination=ClickPagination("#detail_con > .paging.dp_pc"),
+    dedupe_on=['Title', 'Education_period', 'Institution', 'Category'],
+)
+
+YEONSU_VIEW = "#detail_con > div.board_view"
+YEONSU_EDU = 'https://www.yeonsu.go.kr/lll/edu'
+YEONSU = SiteSpec(
+    name="yeonsu",
+    start_url=None,
+    row_selector="#detail_con > div.board_list > table > tbody > tr",
+    fields={
+        "Title": Field(":scope > td.title > a"),
+        "Detail": Field(":scope > td.title > a", attr='href'),
+        "State": Field(":scope > td:nth-child(5) > span"),
+    },
+    detail=DetailPage(
+        fields={
+            "Title": Field(f"{YEONSU_VIEW} > div"),
+            "Fee": Field(f"{YEONSU_VIEW} > ul:nth-child(3) > li:nth-child(1) > dl > dd"),
+            "Quota": Field(f"{YEONSU_VIEW} > ul:nth-child(3) > li:nth-child(2) > dl > dd"),
+            "Recruitment_period": Field(f"{YEONSU_VIEW} > ul:nth-child(3) > li:nth-child(4) > dl > dd"),
+            "Education_period": Field(f"{YEONSU_VIEW} > ul:nth-child(3) > li:nth-child(5) > dl > dd"),
+            "Institution": Field(f"{YEONSU_VIEW} > ul:nth-child(5) > li:nth-child(1) > dl > dd"),
+            "Address": Field(f"{YEONSU_VIEW} > ul:nth-child(5) > li:nth-child(2) > dl > dd"),
+            "Tel": Field(f"{YEONSU_VIEW} > ul:nth-child(5) > li:nth-child(3) > dl > dd"),
+        },
+        wait_for=f"{YEONSU_VIEW} > div",
+    ),
+    categories=[
+        Category("global", "글로벌", f'{YEONSU_EDU}/global_request.asp'),
+        Category("happylife", "행복생활", f'{YEONSU_EDU}/happylife_request.asp'),
+    ],
+    columns=["City", "Category", "Title", "Recruitment_period", "Education_period", "Quota",
+             "Institution", "Address", "Tel", "Detail", "Fee"],
+    defaults={"City": "인천시 연수구"},
+    keep=lambda record: record["State"] == "신청중",
+    output="yeonsu_education.csv",
+    pagination=ClickPagination("#detail_con > div.paging.dp_pc"),
+    dedupe_on=['Title', 'Education_period', 'Institution', 'Category'],
+)
+
+FIFTY_PLUS_ROW = "body > div:nth-child(6) > div.campus-course-list-table > table > tbody > tr"
+FIFTY_PLUS = SiteSpec(
+    name="50plus",
+    start_url='https://50plus.or.kr/education.do?page=1&cost=ALL&state=JOIN&type=ALL&',
+    row_selector=FIFTY_PLUS_ROW,
+    fields={
+        "Institution": Field(":scope > td.td-normal.td-normal--first"),
+        "Title": Field(":scope > td:nth-child(4)"),
+        "Recruitment_period": Field(":scope > td:nth-child(5)"),
+        "Education_period": Field(":scope > td:nth-child(6)"),
+        "Fees": Field(":scope > td:nth-child(8)"),
+        "Quota": Field(":scope > td:nth-child(9)"),
+        "Detail": Field(":scope > td.td-normal-btn > a", attr='href'),
+    },
+    detail=DetailPage(
+        fields={"Tel": Field("body > div.container > div.course-content.clearfix > div.course-right > div.course-contact > p > a")},
+    ),
+    columns=["Institution", "Title", "Recruitment_period", "Education_period", "Fees", "Quota", "Detail", "Tel"],
+    output="cultural_lectures.csv",
+    pagination=UrlPagination('page'),
+    dedupe_on=['Institution', 'Title', 'Education_period'],
+    max_pages=50,
+)
+
+# 이름 → 사이트 명세 (나머지 사이트는 아직 기존 크롤러 스크립트 사용)
+SITES = {spec.name: spec for spec in [SUWON, ANYANG, BUSAN, ANDONG, INCHEON_SEOGU, INCHEON_DONGGU, YEONSU,
+                                      FIFTY_PLUS]}
+
+
+def crawl_site(spec, mode='auto', headless=True, max_pages=None, resume=True, incremental=True, index=True):
+    """
+    Crawl one site; the lists of a site with categories run at once, one browser each
+
+    With index the site's CSV is ingested into the unified lecture index
+    (lecture_index) when the crawl is done.
+    """
+    def crawl(part):
+        crawler = create_crawler(part, mode, headless=headless, incremental=incremental)
+        try:
+            crawler.run(max_pages=max_pages, resume=resume)
+        finally:
+            crawler.close()
+
+    parts = spec.split_categories()
+    if len(parts) == 1:
+        crawl(parts[0])
+    else:
+        threads = [threading.Thread(target=crawl, args=(part,), name=f"lecture-{part.name}") for part in parts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    if index:
+        index_site_output(spec.output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl lecture sites described by site specs")
+    parser.add_argument('sites', nargs='*', default=list(SITES), help=f"site names ({', '.join(SITES)})")
+    parser.add_argument('--max-pages', type=int, default=None)
+    parser.add_argument('--mode', choices=['auto', 'http', 'browser'], default='auto')
+    parser.add_argument('--restart', action='store_true', help='ignore saved checkpoints')
+    parser.add_argument('--full', action='store_true', help='read every detail page even if the list is unchanged')
+    parser.add_argument('--no-index', action='store_true', help='do not update the unified lecture index')
+    parser.add_argument('--show-browser', action='store_true')
+    args = parser.parse_args()
+
+    for name in args.sites:
+        crawl_site(SITES[name], args.mode, headless=not args.show_browser,
+                   max_pages=args.max_pages, resume=not args.restart, incremental=not args.full,
+                   index=not args.no_index)
@@ -0,0 +1,172 @@
+import json
+import os
+import time
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+# 네이버 로그인 상태를 나타내는 쿠키
+LOGIN_COOKIES = ('NID_AUT', 'NID_SES')
+# 로그인 쿠키가 담긴 크롬 프로필은 저장소 밖에 둠 (상대 경로 프로필은 이 아래에 만듦)
+PROFILE_ROOT = os.path.join(os.path.expanduser('~'), '.naver_blog_poster')
+
+
+class NaverSession:
+    """
+    Keep one logged-in Chrome browser alive across posts
+
+    The browser uses a persistent Chrome profile and the login cookies are
+    also saved to a file, so a restart of the poster usually does not need a
+    new login. login_fn is only called when the session has actually expired.
+    """
+
+    def __init__(self, login_fn, chrome_options, profile_dir="chrome_profile",
+                 cookie_file="naver_cookies.json", home_url="https://www.naver.com",
+                 login_host="nid.naver.com"):
+        """
+        Args:
+            login_fn: callable(driver) -> bool that performs the Naver login
+            chrome_options: selenium Options used to start Chrome
+            profile_dir: Chrome user data directory, relative to PROFILE_ROOT
+                         unless absolute (None to disable)
+            cookie_file: file used to persist login cookies (None to disable)
+            home_url: page used to check and restore cookies
+            login_host: host of the login page (used to detect expired sessions)
+        """
+        self.login_fn = login_fn
+        self.chrome_options = chrome_options
+        self.profile_dir = os.path.join(PROFILE_ROOT, profile_dir) if profile_dir else None
+        self.cookie_file = cookie_file
+        self.home_url = home_url
+        self.login_host = login_host
+        self.driver = None
+        self.logged_in = False
+        self.login_count = 0
+
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            self.chrome_options.add_argument(f'--user-data-dir={self.profile_dir}')
+
+    def is_alive(self):
+        """Check that the browser is still running"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def get_driver(self):
+        """Return the running browser, starting a new one if needed"""
+        if not self.is_alive():
+            if self.driver is not None:
+                print("Browser session lost, starting a new browser")
+                self.quit_driver()
+            self.driver = webdriver.Chrome(options=self.chrome_options)
+            self.driver.implicitly_wait(10)
+            self.logged_in = False
+        return self.driver
+
+    def has_login_cookies(self):
+        """Check login cookies on the current naver.com page"""
+        try:
+            names = {cookie['name'] for cookie in self.driver.get_cookies()}
+            return all(name in names for name in LOGIN_COOKIES)
+        except WebDriverException:
+            return False
+
+    def is_login_page(self, driver=None):
+        """True if the browser was redirected to the Naver login page"""
+        driver = driver or self.driver
+        try:
+            return self.login_host in driver.current_url
+        except WebDriverException:
+            return False
+
+    def save_cookies(self):
+        """Save current cookies so the next process can reuse the login"""
+        if not self.cookie_file:
+            return
+        try:
+            with open(self.cookie_file, 'w', encoding='utf-8') as f:
+                json.dump(self.driver.get_cookies(), f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"Error saving cookies: {e}")
+
+    def restore_cookies(self):
+        """Load saved cookies into the browser (must be on a naver.com page)"""
+        if not self.cookie_file or not os.path.exists(self.cookie_file):
+            return False
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            now = time.time()
+            for cookie in cookies:
+                if cookie.get('expiry') and cookie['expiry'] < now:
+                    continue
+                cookie.pop('sameSite', None)
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
+                    continue
+            self.driver.refresh()
+            return True
+        except Exception as e:
+            print(f"Error restoring cookies: {e}")
+            return False
+
+    def ensure_login(self, force=False):
+        """
+        Return a logged-in driver, logging in only when the session expired
+
+        Args:
+            force: ignore the cached state and check/login again
+        """
+        driver = self.get_driver()
+        if self.logged_in and not force:
+            return driver
+
+        # 프로필이나 저장된 쿠키로 이미 로그인되어 있는지 확인
+        driver.get(self.home_url)
+        if self.has_login_cookies() or (self.restore_cookies() and self.has_login_cookies()):
+            print("Reusing existing Naver login session")
+            self.logged_in = True
+            return driver
+
+        print("Logging in to Naver...")
+        if not self.login_fn(driver):
+            self.logged_in = False
+            return None
+
+        self.login_count += 1
+        self.logged_in = True
+        self.save_cookies()
+        return driver
+
+    def invalidate(self):
+        """Mark the session as expired so the next ensure_login re-checks it"""
+        self.logged_in = False
+
+    def leave_page(self):
+        """Allow navigating away from the editor without the unload prompt"""
+        if self.is_alive():
+            try:
+                self.driver.execute_script("window.onbeforeunload = null;")
+            except WebDriverException:
+                pass
+
+    def quit_driver(self):
+        try:
+            if self.driver:
+                self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+        self.logged_in = False
+
+    def close(self):
+        """Save cookies and close the browser"""
+        if self.is_alive() and self.logged_in:
+            self.save_cookies()
+        self.quit_driver()
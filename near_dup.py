@@ -0,0 +1,266 @@
+import argparse
+import os
+import re
+import zlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+import pandas as pd
+
+from csv_encoding import read_csv
+
+# MinHash 설정 - 128개 해시를 16개 밴드 x 8행으로 나눔
+# (유사도 약 0.7 이상이면 같은 버킷에 들어갈 확률이 높음)
+NUM_PERM = 128
+NUM_BANDS = 16
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_INDEX_FILE = "near_dup_index.npz"
+
+# 유사도 계산에 쓰는 컬럼
+TEXT_COLUMNS = ['Title', 'JobDescription', 'CompanyName']
+
+# 고용24 공고 번호 - 상세 URL 에 있으면 이것만으로 공고를 식별
+POSTING_ID_PARAM = 'wantedAuthNo'
+# 목록에서의 위치 등 크롤링마다 바뀌는 상세 URL 파라미터
+VOLATILE_PARAMS = {'rtnTarget'}
+
+# 공백/기호는 무시하고 한글·영문·숫자만 비교
+NORMALIZE_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def _make_permutations(num_perm, seed=1):
+    """multiply-shift 해시 계수 (a는 홀수) - 같은 seed면 항상 같은 값"""
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, 2 ** 62, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+    b = rng.randint(0, 2 ** 62, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return a, b
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """정규화한 문자열의 문자 n-gram 집합"""
+    text = NORMALIZE_PATTERN.sub('', str(text).lower())
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def item_text(row, columns=TEXT_COLUMNS):
+    """Title + JobDescription + CompanyName 을 하나의 문자열로"""
+    parts = []
+    for column in columns:
+        value = row.get(column, '')
+        if pd.notna(value) and value != "Not found":
+            parts.append(str(value))
+    return ' '.join(parts)
+
+
+def detail_key(url):
+    """상세 URL → 공고 키 (공고 번호, 없으면 위치 파라미터를 뺀 URL)"""
+    parts = urlsplit(url)
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    for name, value in params:
+        if name == POSTING_ID_PARAM and value:
+            return f"{POSTING_ID_PARAM}={value}"
+    query = urlencode([(name, value) for name, value in params if name not in VOLATILE_PARAMS])
+    return urlunsplit(parts._replace(query=query))
+
+
+def item_key(row):
+    """공고의 고정 키 - 상세 URL이 있으면 URL의 공고 번호, 없으면 제목/회사/마감일"""
+    detail = row.get('Detail', '')
+    if isinstance(detail, str) and detail.startswith('http'):
+        return detail_key(detail)
+    return '_'.join(str(row.get(c, '')) for c in ['Title', 'CompanyName', 'Deadline'])
+
+
+class NearDuplicateIndex:
+    """MinHash 시그니처와 LSH 버킷을 보관하는 증분 인덱스
+
+    새 공고는 query 로 기존 인덱스와 비교한 뒤 add 로 추가한다.
+    인덱스는 설정값·키·시그니처 배열만 npz 파일로 저장하고, 불러올 때 버킷을 다시 만든다.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, num_bands=NUM_BANDS, threshold=DEFAULT_THRESHOLD):
+        if num_perm % num_bands != 0:
+            raise ValueError("num_perm must be divisible by num_bands")
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows_per_band = num_perm // num_bands
+        self.threshold = threshold
+        self.a, self.b = _make_permutations(num_perm)
+        self.signatures = {}
+        self.buckets = [dict() for _ in range(num_bands)]
+
+    def signature(self, text):
+        """문자열의 MinHash 시그니처 (uint32 배열)"""
+        grams = shingles(text)
+        if not grams:
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        values = np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams),
+                             dtype=np.uint64, count=len(grams))
+        # (a * x + b) mod 2^64 의 상위 32비트 - 모든 해시를 한 번에 계산
+        hashed = np.outer(self.a, values) + self.b[:, None]
+        return (hashed >> np.uint64(32)).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        r = self.rows_per_band
+        return [signature[i * r:(i + 1) * r].tobytes() for i in range(self.num_bands)]
+
+    @staticmethod
+    def similarity(sig1, sig2):
+        """두 시그니처의 추정 Jaccard 유사도"""
+        return float(np.mean(sig1 == sig2))
+
+    def query(self, signature, exclude=None):
+        """같은 버킷에 있는 후보 중 유사도가 threshold 이상인 (키, 유사도) 목록"""
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self.buckets[band].get(key, ()))
+        candidates.discard(exclude)
+
+        matches = []
+        for candidate in candidates:
+            score = self.similarity(signature, self.signatures[candidate])
+            if score >= self.threshold:
+                matches.append((candidate, score))
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return matches
+
+    def add(self, key, signature):
+        """시그니처를 인덱스에 추가 (같은 키가 있으면 교체)"""
+        if key in self.signatures:
+            self.remove(key)
+        self.signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self.buckets[band].setdefault(band_key, []).append(key)
+
+    def remove(self, key):
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self.buckets[band].get(band_key)
+            if bucket and key in bucket:
+                bucket.remove(key)
+                if not bucket:
+                    del self.buckets[band][band_key]
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def check_new(self, df, add=True):
+        """새로 크롤링한 공고를 기존 인덱스와 비교
+
+        DuplicateOf(가장 비슷한 기존 공고 키)와 Similarity 컬럼을 붙여 반환한다.
+        같은 배치 안의 중복도 앞의 행 기준으로 잡힌다.
+        add=True 이면 확인한 공고를 모두 인덱스에 추가한다 (clusters 계산용).
+        """
+        duplicate_of = []
+        scores = []
+        for _, row in df.iterrows():
+            key = item_key(row)
+            signature = self.signature(item_text(row))
+            matches = self.query(signature, exclude=key)
+            if matches:
+                duplicate_of.append(matches[0][0])
+                scores.append(matches[0][1])
+            else:
+                duplicate_of.append('')
+                scores.append(np.nan)
+            if add:
+                self.add(key, signature)
+
+        result = df.copy()
+        result['DuplicateOf'] = duplicate_of
+        result['Similarity'] = scores
+        return result
+
+    def clusters(self):
+        """인덱스 전체의 근접 중복 묶음 (2개 이상인 묶음만, union-find)"""
+        parent = {key: key for key in self.signatures}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for band_buckets in self.buckets:
+            for keys in band_buckets.values():
+                for other in keys[1:]:
+                    if self.similarity(self.signatures[keys[0]], self.signatures[other]) >= self.threshold:
+                        root_a, root_b = find(keys[0]), find(other)
+                        if root_a != root_b:
+                            parent[root_b] = root_a
+
+        groups = {}
+        for key in self.signatures:
+            groups.setdefault(find(key), []).append(key)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def save(self, filename=DEFAULT_INDEX_FILE):
+        """인덱스를 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        클래스 인스턴스가 아닌 설정값과 키/시그니처 배열만 저장하므로
+        어느 모듈에서 실행했는지와 관계없이 불러올 수 있다.
+        """
+        keys = list(self.signatures)
+        if keys:
+            signatures = np.stack([self.signatures[key] for key in keys])
+        else:
+            signatures = np.empty((0, self.num_perm), dtype=np.uint32)
+        temp_file = filename + ".tmp"
+        # 파일 객체로 넘겨야 np.savez 가 .npz 를 덧붙이지 않음
+        with open(temp_file, 'wb') as f:
+            np.savez(f, params=np.array([self.num_perm, self.num_bands]), threshold=np.array(self.threshold),
+                     keys=np.array(keys, dtype=str), signatures=signatures)
+        os.replace(temp_file, filename)
+
+    @classmethod
+    def load(cls, filename=DEFAULT_INDEX_FILE, **kwargs):
+        """저장된 인덱스를 불러오고, 없으면 새로 만듦"""
+        if os.path.exists(filename):
+            try:
+                with np.load(filename, allow_pickle=False) as data:
+                    num_perm, num_bands = (int(value) for value in data['params'])
+                    options = {'num_perm': num_perm, 'num_bands': num_bands, 'threshold': float(data['threshold'])}
+                    options.update(kwargs)
+                    index = cls(**options)
+                    if index.num_perm != num_perm or index.num_bands != num_bands:
+                        raise ValueError("saved index uses different MinHash settings")
+                    for key, signature in zip(data['keys'], data['signatures']):
+                        key = str(key)
+                        # 예전에 전체 상세 URL 로 저장한 키도 공고 번호 키로 맞춤 (같은 공고는 하나로 합쳐짐)
+                        if key.startswith('http'):
+                            key = detail_key(key)
+                        index.add(key, signature.astype(np.uint32))
+                print(f"Loaded near-duplicate index with {len(index)} signatures")
+                return index
+            except Exception as e:
+                print(f"Error loading near-duplicate index: {e}")
+        return cls(**kwargs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find near-duplicate job postings with MinHash/LSH")
+    parser.add_argument('files', nargs='+', help='job CSV files, checked in order')
+    parser.add_argument('--index', default=DEFAULT_INDEX_FILE, help='signature index file')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--dry-run', action='store_true', help='do not save the index')
+    args = parser.parse_args()
+
+    index = NearDuplicateIndex.load(args.index, threshold=args.threshold)
+    index.threshold = args.threshold
+
+    for csv_file in args.files:
+        df = read_csv(csv_file)
+        checked = index.check_new(df)
+        duplicates = checked[checked['DuplicateOf'] != '']
+        print(f"\n=== {csv_file}: {len(duplicates)} near-duplicates out of {len(df)} rows ===")
+        for _, row in duplicates.head(20).iterrows():
+            print(f"  {row.get('Title', '')} ~ {row['DuplicateOf']} ({row['Similarity']:.2f})")
+
+    print(f"\nIndex size: {len(index)}, clusters: {len(index.clusters())}")
+    if not args.dry_run:
+        index.save(args.index)
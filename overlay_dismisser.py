@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+
+DEFAULT_MEMORY_FILE = "overlay_patterns.json"
+# 처음 본 사이트는 모든 패턴을 찾아보고, 이후에는 이 횟수마다 한 번씩만 전체를 다시 찾음
+RESCAN_EVERY = 20
+
+# (이름, 선택자, 동작) - click 은 닫기 버튼을 누르고 remove 는 요소를 지움
+# click 패턴은 크롤러들이 쓰던 순서대로 시도하고 처음 누른 것에서 멈춤
+DEFAULT_PATTERNS = [
+    ('button-close', "button.close", 'click'),
+    ('button-btn-close', "button.btn_close", 'click'),
+    ('link-close', "a.close", 'click'),
+    ('popup-close', ".popup_close", 'click'),
+    ('pop-close', ".pop-close", 'click'),
+    ('class-close', "[class*='close']", 'click'),
+    ('title-close', "[title*='닫기']", 'click'),
+    ('modal-backdrop', ".modal-backdrop", 'remove'),
+]
+
+# arguments: [이름, 선택자, 동작] 목록 → 처리한 패턴 이름 목록
+DISMISS_SCRIPT = """
+var patterns = arguments[0], done = [], clicked = false, removed = false;
+function visible(el) {
+  if (!el.getClientRects().length) return false;
+  var style = window.getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none';
+}
+patterns.forEach(function (pattern) {
+  var elements = Array.prototype.slice.call(document.querySelectorAll(pattern[1])).filter(visible);
+  if (!elements.length) return;
+  if (pattern[2] === 'remove') {
+    elements.forEach(function (el) { el.remove(); });
+    removed = true;
+    done.push(pattern[0]);
+  } else if (!clicked) {
+    elements[0].click();
+    clicked = true;
+    done.push(pattern[0]);
+  }
+});
+// 지운 오버레이가 걸어 둔 스크롤 잠금 해제
+if (removed && document.body) { document.body.style.overflow = ''; }
+return done;
+"""
+
+_memory_lock = threading.Lock()
+
+
+class OverlayDismisser:
+    """
+    Close popups and remove overlays of one site with a single script call
+
+    The first call on a site tries every pattern; afterwards only the
+    patterns that ever matched on the site (remembered in memory_file) are
+    sent, so a site without popups costs nothing. Every rescan_every calls
+    all patterns are tried again to pick up new popups. Site specific
+    patterns go first and win over the generic close buttons.
+    """
+
+    def __init__(self, site, patterns=(), memory_file=DEFAULT_MEMORY_FILE, rescan_every=RESCAN_EVERY):
+        self.site = site
+        self.patterns = list(patterns) + [pattern for pattern in DEFAULT_PATTERNS
+                                          if pattern[0] not in {name for name, _, _ in patterns}]
+        self.memory_file = memory_file
+        self.rescan_every = rescan_every
+        self.calls = 0
+        self.matched = set(self.load_memory().get(site, []))
+
+    def load_memory(self):
+        if not os.path.exists(self.memory_file):
+            return {}
+        try:
+            with open(self.memory_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading overlay patterns: {e}")
+            return {}
+
+    def remember(self, names):
+        new = set(names) - self.matched
+        if not new:
+            return
+        self.matched |= new
+        with _memory_lock:
+            memory = self.load_memory()
+            memory[self.site] = sorted(set(memory.get(self.site, [])) | self.matched)
+            try:
+                with open(self.memory_file, 'w', encoding='utf-8') as f:
+                    json.dump(memory, f, ensure_ascii=False, indent=2)
+            except Exception as e:
+                print(f"Error saving overlay patterns: {e}")
+
+    def dismiss(self, driver):
+        """Close or remove the overlays on the current page; returns the pattern names acted on"""
+        full_scan = self.calls % self.rescan_every == 0
+        self.calls += 1
+        patterns = self.patterns if full_scan else [pattern for pattern in self.patterns if pattern[0] in self.matched]
+        if not patterns:
+            return []
+        try:
+            done = driver.execute_script(DISMISS_SCRIPT, [list(pattern) for pattern in patterns]) or []
+        except Exception as e:
+            print(f"Error dismissing overlays: {e}")
+            return []
+        if done:
+            print(f"Closed overlays: {', '.join(done)}")
+            self.remember(done)
+        return done
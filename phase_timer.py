@@ -0,0 +1,36 @@
+import time
+
+
+class PhaseTimer:
+    """
+    Per-post phase timings (open_editor, title, body, publish, ...)
+
+    start() begins a post, mark(phase) adds the time since the previous mark
+    to that phase and finish() stores the post in self.records. Marks outside
+    start/finish are ignored, so the timer costs nothing when unused.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.current = None
+        self._last = 0.0
+        self._started = 0.0
+
+    def start(self):
+        self.current = {}
+        self._started = self._last = time.perf_counter()
+
+    def mark(self, phase):
+        if self.current is None:
+            return
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def finish(self):
+        if self.current is None:
+            return None
+        self.current['total'] = time.perf_counter() - self._started
+        record, self.current = self.current, None
+        self.records.append(record)
+        return record
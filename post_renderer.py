@@ -0,0 +1,132 @@
+import hashlib
+import json
+from collections import OrderedDict
+from string import Template
+
+import pandas as pd
+
+# 블로그 본문 레이아웃 - 모듈을 불러올 때 한 번만 컴파일
+PAGE = Template(
+    "<div style='font-family: \"Noto Sans KR\", sans-serif; line-height: 1.8; padding: 20px;'>"
+    "<h2 style='color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;$heading_style'>"
+    "$icon $heading</h2>"
+    "$body"
+    "</div>"
+)
+TABLE = Template(
+    "<table style='width: 100%; border-collapse: collapse; background-color: #f8f9fa; border-radius: 10px;'>"
+    "$rows"
+    "</table>"
+)
+TABLE_ROW = Template("""
+                <tr style='border-bottom: 1px solid #ddd;'>
+                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>$key</td>
+                    <td style='padding: 12px;'>$value</td>
+                </tr>
+                """)
+INFO_BOX = Template(
+    "<div style='background-color: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0;'>"
+    "$subheading<p>$text</p>"
+    "</div>"
+)
+SUBHEADING = Template("<h3 style='color: #333; margin-bottom: 15px;'>$text</h3>")
+NOTICE = Template(
+    "<div style='margin-top: 20px; padding: 15px; background-color: #e8f4fd; border-left: 4px solid #2E86AB;'>"
+    "<p style='margin: 0;'>💡 <strong>$text</strong></p>"
+    "</div>"
+)
+
+# 본문 표에 넣지 않는 내부 필드
+INTERNAL_FIELDS = ('ContentType', 'FileName', 'RowIndex', 'Post')
+# 렌더링 결과에 영향을 주지 않는 필드 (캐시 키에서 제외)
+CACHE_IGNORED_FIELDS = ('Post',)
+DEFAULT_CACHE_SIZE = 2000
+
+
+def display_value(value, missing='정보 없음'):
+    return str(value) if pd.notna(value) else missing
+
+
+def render_table(data, display_key=None, value_fn=display_value, skip=INTERNAL_FIELDS):
+    """데이터 필드를 표 행으로 (문자열 += 대신 한 번에 join)"""
+    rows = ''.join(
+        TABLE_ROW.substitute(key=display_key(key) if display_key else key, value=value_fn(value))
+        for key, value in data.items()
+        if key not in skip
+    )
+    return TABLE.substitute(rows=rows)
+
+
+def render_info_box(text, subheading=''):
+    return INFO_BOX.substitute(
+        subheading=SUBHEADING.substitute(text=subheading) if subheading else '',
+        text=text,
+    )
+
+
+def render_notice(text):
+    return NOTICE.substitute(text=text)
+
+
+def render_page(icon, heading, body, heading_margin=False):
+    return PAGE.substitute(
+        icon=icon,
+        heading=heading,
+        body=body,
+        heading_style=' margin-bottom: 20px;' if heading_margin else '',
+    )
+
+
+def content_hash(item_data):
+    """항목 내용의 해시 - 값이 바뀐 항목만 다시 렌더링하기 위한 캐시 키"""
+    fields = sorted(
+        (str(key), display_value(value, ''))
+        for key, value in item_data.items()
+        if key not in CACHE_IGNORED_FIELDS
+    )
+    return hashlib.sha1(json.dumps(fields, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class PostRenderer:
+    """
+    Cache of rendered posts keyed by the item content hash
+
+    format_fn(item_data) -> (title, content, tags) does the actual rendering.
+    Unchanged items are served from the cache, so the whole pending queue can
+    be pre-rendered and only new or edited rows are rendered again.
+    """
+
+    def __init__(self, format_fn, cache_size=DEFAULT_CACHE_SIZE):
+        self.format_fn = format_fn
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, item_data):
+        key = content_hash(item_data)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+
+        self.misses += 1
+        result = self.format_fn(item_data)
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    def render_batch(self, items):
+        """Render a list of (item_id, item_data); returns {item_id: (title, content, tags)}"""
+        misses = self.misses
+        rendered = {}
+        for item_id, item_data in items:
+            try:
+                rendered[item_id] = self.render(item_data)
+            except Exception as e:
+                # 실패한 항목은 게시할 때 다시 렌더링하면서 오류를 보여줌
+                print(f"Error rendering {item_id}: {e}")
+        if self.misses > misses:
+            print(f"Pre-rendered {self.misses - misses} of {len(rendered)} posts (rest cached)")
+        return rendered
@@ -0,0 +1,174 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from csv_encoding import read_csv
+
+DEFAULT_DB_FILE = "posted_items.db"
+# 예전 버전이 쓰던 게시 ID 목록 (처음 열 때 한 번 가져옴)
+LEGACY_JSON_FILE = "posted_items.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posted (
+    item_id   TEXT PRIMARY KEY,
+    file_name TEXT,
+    row_index INTEGER,
+    title     TEXT,
+    posted_at TEXT
+);
+CREATE INDEX IF NOT EXISTS posted_file ON posted (file_name, row_index);
+"""
+
+
+class PostedStore:
+    """
+    Posted state kept in a sqlite sidecar file instead of the source CSVs
+
+    Marking an item is a single indexed INSERT committed atomically, so the
+    crawled CSV files are never rewritten while crawlers may be appending to
+    them. The CSV Post column is only filled in by export_post_column.
+    One store can be shared by several posting worker threads.
+    """
+
+    def __init__(self, db_file=DEFAULT_DB_FILE, legacy_json=LEGACY_JSON_FILE):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self.strip_id_directories()
+        if legacy_json:
+            self.import_legacy_json(legacy_json)
+
+    def import_legacy_json(self, json_file):
+        """Fold the old posted_items.json ID list into the store (once)"""
+        if not os.path.exists(json_file):
+            return 0
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                item_ids = json.load(f)
+        except Exception as e:
+            print(f"Error reading {json_file}: {e}")
+            return 0
+
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO posted (item_id) VALUES (?)",
+                [(str(item_id),) for item_id in item_ids],
+            )
+            imported = self.conn.total_changes - before
+        if imported:
+            print(f"Imported {imported} posted IDs from {json_file}")
+        return imported
+
+    def strip_id_directories(self):
+        """
+        Drop the directory from IDs recorded as 'new/seoul_job.csv_...'
+
+        Item IDs start with the CSV file name only (as in posted_items.json);
+        for a while they were built from the source path instead.
+        """
+        with self.lock, self.conn:
+            rows = self.conn.execute(
+                "SELECT item_id, file_name FROM posted WHERE file_name LIKE '%/%' OR file_name LIKE '%\\%'"
+            ).fetchall()
+            renamed = 0
+            for item_id, file_name in rows:
+                if not item_id.startswith(file_name + '_'):
+                    continue
+                new_id = os.path.basename(file_name) + item_id[len(file_name):]
+                renamed += self.conn.execute("UPDATE OR IGNORE posted SET item_id = ? WHERE item_id = ?",
+                                             (new_id, item_id)).rowcount
+        if renamed:
+            print(f"Renamed {renamed} posted IDs to start with the file name only")
+        return renamed
+
+    def is_posted(self, item_id):
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM posted WHERE item_id = ?", (item_id,)).fetchone()
+        return row is not None
+
+    def __contains__(self, item_id):
+        return self.is_posted(item_id)
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM posted").fetchone()[0]
+
+    def mark_posted(self, item_id, file_name=None, row_index=None, title=None):
+        """Record one posted item (committed immediately)"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO posted (item_id, file_name, row_index, title, posted_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (item_id, file_name, None if row_index is None else int(row_index), title,
+                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+            )
+
+    def posted_ids(self, file_name=None):
+        """Set of posted item IDs (optionally only those from one CSV file)"""
+        with self.lock:
+            if file_name is None:
+                rows = self.conn.execute("SELECT item_id FROM posted").fetchall()
+            else:
+                rows = self.conn.execute("SELECT item_id FROM posted WHERE file_name = ?", (file_name,)).fetchall()
+        return {item_id for item_id, in rows}
+
+    def posted_rows(self, file_name):
+        """Set of row indexes recorded for a CSV file"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT row_index FROM posted WHERE file_name = ? AND row_index IS NOT NULL", (file_name,)
+            ).fetchall()
+        return {row_index for row_index, in rows}
+
+    def export_post_column(self, csv_file, make_id=None, output=None):
+        """
+        Write the Post column ('Y' for posted rows) into a CSV file
+
+        Args:
+            csv_file: source CSV
+            make_id: callable(row, csv_file) -> item_id; rows are matched by ID
+                     when given, otherwise by the recorded row index
+            output: destination file (defaults to rewriting csv_file)
+
+        Returns (rows marked 'Y', total rows written).
+        """
+        df = read_csv(csv_file)
+        if 'Post' not in df.columns:
+            df['Post'] = ''
+
+        if make_id is not None:
+            posted = self.posted_ids()
+            mask = [make_id(row, csv_file) in posted for _, row in df.iterrows()]
+        else:
+            mask = df.index.isin(list(self.posted_rows(csv_file)))
+        df.loc[mask, 'Post'] = 'Y'
+
+        output = output or csv_file
+        temp_file = output + ".tmp"
+        df.to_csv(temp_file, index=False, encoding='utf-8-sig')
+        os.replace(temp_file, output)
+        return int((df['Post'].astype(str).str.strip().str.upper() == 'Y').sum()), len(df)
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect the posted-state store or export the Post column")
+    parser.add_argument('files', nargs='*', help='CSV files to fill the Post column for')
+    parser.add_argument('--db', default=DEFAULT_DB_FILE, help='posted-state database')
+    args = parser.parse_args()
+
+    store = PostedStore(args.db)
+    print(f"Posted items: {len(store)}")
+    for csv_file in args.files:
+        marked, _ = store.export_post_column(csv_file)
+        print(f"{csv_file}: {marked} rows marked as posted")
+    store.close()
@@ -1,23 +1,36 @@
 import time
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-import json
 import os
 from datetime import datetime
 import requests
 from dotenv import load_dotenv
-import pyperclip, pyautogui
+from naver_session import NaverSession
+from editor_input import EditorInput
+from phase_timer import PhaseTimer
+from incremental_csv import NewItemDetector
+from posting_queue import PostingQueue
+from file_trigger import ChangeTrigger, DEFAULT_DEBOUNCE
+from posted_store import PostedStore
+from post_renderer import PostRenderer, render_page, render_table, render_info_box, display_value
 
 # Load environment variables from .env file
 load_dotenv()
 
 class NaverBlogPoster:
-    def __init__(self, naver_id=None, naver_pw=None, blog_id=None):
+    # Naver endpoints and local state files (overridden by the editor stub benchmark)
+    LOGIN_URL = "https://nid.naver.com/nidlogin.login?mode=form&url=https%3A%2F%2Fwww.naver.com&locale=ko_KR&svctype=1"
+    LOGIN_HOST = "nid.naver.com"
+    HOME_URL = "https://www.naver.com"
+    EDITOR_URL = "https://blog.naver.com/{blog_id}/postwrite"
+    POSTED_DB = "posted_items.db"
+    PROFILE_DIR = "chrome_profile"
+    COOKIE_FILE = "naver_cookies.json"
+    
+    def __init__(self, naver_id=None, naver_pw=None, blog_id=None, headless=False):
         """
         Initialize Naver Blog Poster
         
@@ -25,12 +38,22 @@ class NaverBlogPoster:
             naver_id: Naver ID for login
             naver_pw: Naver password for login
             blog_id: Naver blog ID (e.g., 'myblog' from blog.naver.com/myblog)
+            headless: run Chrome without a window (editor input does not need the clipboard)
         """
         self.naver_id = naver_id
         self.naver_pw = naver_pw
         self.blog_id = blog_id
-        self.posted_jobs_file = "posted_items.json"
-        self.posted_items = self.load_posted_items()
+        # Posted state lives in a sqlite sidecar (posted_items.json is imported once)
+        self.posted_store = PostedStore(self.POSTED_DB, legacy_json="posted_items.json")
+        
+        # Incremental detector: re-reads only rows appended to each CSV
+        self.detector = NewItemDetector(self.make_queue_item, self.is_row_posted)
+        
+        # Unposted items from every source, nearest deadline first
+        self.queue = PostingQueue(self.detector)
+        
+        # Rendered posts cached per item content hash
+        self.renderer = PostRenderer(self.render_post)
         
         # Chrome options for Selenium
         self.chrome_options = Options()
@@ -41,132 +64,66 @@ class NaverBlogPoster:
         self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         self.chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         self.chrome_options.add_experimental_option('useAutomationExtension', False)
+        if headless:
+            self.chrome_options.add_argument('--headless=new')
+        
+        # One logged-in browser kept across posts and run_continuous cycles
+        self.session = NaverSession(
+            self.login_naver, self.chrome_options,
+            profile_dir=self.PROFILE_DIR, cookie_file=self.COOKIE_FILE,
+            home_url=self.HOME_URL, login_host=self.LOGIN_HOST,
+        )
+        
+        # Per-phase timings of each post (see posting_benchmark.py)
+        self.timer = PhaseTimer()
         
-    def load_posted_items(self):
-        """Load already posted item IDs from file"""
-        if os.path.exists(self.posted_jobs_file):
-            try:
-                with open(self.posted_jobs_file, 'r', encoding='utf-8') as f:
-                    return set(json.load(f))
-            except:
-                return set()
-        return set()
-    
-    def save_posted_items(self):
-        """Save posted item IDs to file"""
-        with open(self.posted_jobs_file, 'w', encoding='utf-8') as f:
-            json.dump(list(self.posted_items), f, ensure_ascii=False, indent=2)
-    
     def check_new_items(self):
-        """Check for new items in CSV files that haven't been posted yet"""
+        """Refresh the posting queue from every configured CSV source"""
         print("\n=== Starting check_new_items method ===")
-        new_items = []
-        
-        # Check specific CSV file
-        csv_file = 'seoul_job.csv'
-        print(f"Looking for file: {csv_file}")
-        print(f"Current directory: {os.getcwd()}")
         
-        if os.path.exists(csv_file):
-            print(f"File {csv_file} exists!")
-            try:
-                # Try different encodings
-                encodings = ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr']
-                df = None
-                
-                for encoding in encodings:
-                    try:
-                        df = pd.read_csv(csv_file, encoding=encoding)
-                        print(f"Successfully read CSV with encoding: {encoding}")
-                        break
-                    except Exception as e:
-                        print(f"Failed to read with {encoding}: {e}")
-                        continue
-                
-                if df is None:
-                    raise Exception("Could not read CSV with any encoding")
-                
-                print(f"\n=== Reading CSV file: {csv_file} ===")
-                print(f"Total rows in CSV: {len(df)}")
-                print(f"Columns: {', '.join(df.columns.tolist())}")
-                
-                # Print first row to debug
-                if len(df) > 0:
-                    print("\nFirst row data:")
-                    first_row = df.iloc[0]
-                    for col in df.columns:
-                        print(f"  {col}: {first_row[col]}")
-                
-                # Add 'Post' column if it doesn't exist
-                if 'Post' not in df.columns:
-                    df['Post'] = ''
-                    # Save with the same encoding that worked
-                    df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-                    print("Added 'Post' column to CSV")
-                
-                # Determine content type based on filename
-                content_type = self.get_content_type(csv_file)
-                print(f"Content type: {content_type}")
-                
-                # Count items not yet posted
-                not_posted_count = 0
-                
-                for idx, item in df.iterrows():
-                    # Check if this item has been posted (Post column is not 'Y')
-                    if pd.isna(item.get('Post')) or str(item.get('Post')).strip().upper() != 'Y':
-                        not_posted_count += 1
-                        item_dict = item.to_dict()
-                        item_dict['ContentType'] = content_type
-                        item_dict['FileName'] = csv_file
-                        item_dict['RowIndex'] = idx  # Store row index for updating later
-                        
-                        # Create unique item ID
-                        item_id = self.create_unique_id(item, csv_file)
-                        new_items.append((item_id, item_dict))
-                
-                print(f"\nItems not yet posted: {not_posted_count}")
-                print(f"Items already posted: {len(df) - not_posted_count}")
-                        
-            except Exception as e:
-                print(f"Error reading {csv_file}: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"File {csv_file} not found in current directory: {os.getcwd()}")
+        # Only rows appended since the last check are parsed
+        self.queue.refresh()
         
-        print(f"=== Finished check_new_items, found {len(new_items)} items ===\n")
-        return new_items
+        print(f"=== Finished check_new_items, {len(self.queue)} items in queue ===\n")
+        return len(self.queue)
     
-    def mark_as_posted(self, filename, row_index):
-        """Mark an item as posted by setting Post column to 'Y'"""
+    def mark_as_posted(self, item_id, item_data):
+        """Record an item as posted in the posted-state store"""
         try:
-            # Read with proper encoding
-            encodings = ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(filename, encoding=encoding)
-                    break
-                except:
-                    continue
-            
-            if df is None:
-                raise Exception("Could not read CSV with any encoding")
-            
-            # Add 'Post' column if it doesn't exist
-            if 'Post' not in df.columns:
-                df['Post'] = ''
-            
-            # Mark as posted
-            df.loc[row_index, 'Post'] = 'Y'
-            
-            # Save the updated CSV with UTF-8 BOM encoding
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
-            print(f"Marked row {row_index} as posted in {filename}")
+            self.posted_store.mark_posted(
+                item_id,
+                file_name=item_data['FileName'],
+                row_index=item_data['RowIndex'],
+                title=item_data.get('Title'),
+            )
+            self.detector.discard(item_data['FileName'], item_data['RowIndex'])
+            print(f"Marked row {item_data['RowIndex']} as posted in {item_data['FileName']}")
             
         except Exception as e:
-            print(f"Error updating {filename}: {e}")
+            print(f"Error updating posted state for {item_id}: {e}")
+    
+    def export_post_column(self, filename):
+        """Fill the CSV Post column from the posted-state store (on demand)"""
+        marked, total_rows = self.posted_store.export_post_column(filename, make_id=self.create_unique_id)
+        # Our own rewrite must not force a full re-read on the next check
+        self.detector.acknowledge_rewrite(filename, total_rows)
+        print(f"Exported Post column to {filename}: {marked} rows posted")
+        return marked
+    
+    def make_queue_item(self, item, csv_file, row_index):
+        """Build the (item_id, item_dict) entry for an unposted CSV row"""
+        item_dict = item.to_dict()
+        item_dict['ContentType'] = self.get_content_type(csv_file)
+        item_dict['FileName'] = csv_file
+        item_dict['RowIndex'] = row_index  # Store row index for updating later
+        return self.create_unique_id(item, csv_file), item_dict
+    
+    def is_row_posted(self, item_id, item):
+        """Check if this item has been posted (store entry or legacy Post column 'Y')"""
+        post = item.get('Post')
+        if not pd.isna(post) and str(post).strip().upper() == 'Y':
+            return True
+        return self.posted_store.is_posted(item_id)
     
     def get_content_type(self, filename):
         """Determine content type based on filename"""
@@ -183,7 +140,8 @@ class NaverBlogPoster:
     def create_unique_id(self, item, filename):
         """Create a unique ID for the item"""
         # Use available columns to create a unique identifier
-        id_parts = [filename]
+        # (file name without its directory, so IDs from posted_items.json still match)
+        id_parts = [os.path.basename(filename)]
         
         # Add relevant columns if they exist
         for col in ['Title', 'CompanyName', 'Name', 'ID', 'DateofRegistration', 'Date', 'Deadline']:
@@ -193,7 +151,11 @@ class NaverBlogPoster:
         return "_".join(id_parts)
     
     def format_post(self, item_data):
-        """Format item data into a blog post based on content type"""
+        """Format item data into a blog post (cached per item content hash)"""
+        return self.renderer.render(item_data)
+    
+    def render_post(self, item_data):
+        """Render item data into a blog post based on content type"""
         content_type = item_data.get('ContentType', 'general')
         
         if content_type == 'job':
@@ -207,11 +169,6 @@ class NaverBlogPoster:
     
     def format_job_post(self, job_data):
         """Format job data into a blog post"""
-        # Print CSV data for debugging
-        print("\n=== CSV Data to be posted ===")
-        print(f"File: {job_data.get('FileName', 'Unknown')}")
-        print(f"Row Index: {job_data.get('RowIndex', 'Unknown')}")
-        
         # Title from CSV 'Title' column - handle encoding properly
         title = job_data.get('Title', '제목 없음')
         
@@ -231,58 +188,31 @@ class NaverBlogPoster:
         # Ensure title is properly encoded
         title = str(title).strip()
         
-        print(f"Final Title: {title}")
-        
-        # Create content from all CSV data
-        content = "<div style='font-family: \"Noto Sans KR\", sans-serif; line-height: 1.8; padding: 20px;'>"
-        content += "<h2 style='color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px; margin-bottom: 20px;'>📋 상세 정보</h2>"
-        content += "<table style='width: 100%; border-collapse: collapse; background-color: #f8f9fa; border-radius: 10px;'>"
-        
-        # Add all CSV data as table rows
-        for key, value in job_data.items():
-            # Skip internal fields
-            if key not in ['ContentType', 'FileName', 'RowIndex', 'Post']:
-                # Clean up the key name for display
-                display_key = key.replace('_', ' ').title()
-                
-                # Handle encoding for values too
-                if isinstance(value, str) and ('�' in str(value) or any(ord(c) > 65000 for c in str(value))):
-                    display_value = '정보 확인 필요'
-                else:
-                    display_value = str(value) if pd.notna(value) else '정보 없음'
-                    
-                content += f"""
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>{display_key}</td>
-                    <td style='padding: 12px;'>{display_value}</td>
-                </tr>
-                """
-        
-        content += "</table>"
-        content += "</div>"
+        # Create content from all CSV data (field names cleaned up for display)
+        table = render_table(
+            job_data,
+            display_key=lambda key: key.replace('_', ' ').title(),
+            value_fn=self.clean_display_value,
+        )
+        content = render_page('📋', '상세 정보', table, heading_margin=True)
         
         tags = ['노인일자리', '노인고용', '노인구직', '시니어일자리', '시니어고용', '시니어구직']
         
-        print(f"Tags to be added: {', '.join(tags)}")
-        
         return title, content, tags
     
+    @staticmethod
+    def clean_display_value(value):
+        """Display value for the post table, hiding values with broken encoding"""
+        if isinstance(value, str) and ('�' in value or any(ord(c) > 65000 for c in value)):
+            return '정보 확인 필요'
+        return display_value(value)
+    
     def format_facility_post(self, facility_data):
         """Format facility data into a blog post"""
-        title = f"[복지시설 정보] {facility_data.get('Name', facility_data.get('Title', '시설명 없음'))}"
+        name = facility_data.get('Name', facility_data.get('Title', '시설명 없음'))
+        title = f"[복지시설 정보] {name}"
         
-        content = f"""
-<div style="font-family: 'Noto Sans KR', sans-serif; line-height: 1.8; padding: 20px;">
-    <h2 style="color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;">
-        🏥 {facility_data.get('Name', facility_data.get('Title', '시설명 없음'))}
-    </h2>
-    
-    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0;">
-        <h3 style="color: #333; margin-bottom: 15px;">📋 시설 정보</h3>
-        <p>노인복지시설 정보를 제공합니다.</p>
-    </div>
-</div>
-"""
+        content = render_page('🏥', name, render_info_box('노인복지시설 정보를 제공합니다.', '📋 시설 정보'))
         
         tags = ['노인복지정책', '노인정책', '노인복지정보', '시니어복지정책', '시니어정책', 
                 '시니어복지정보', '장기요양기관추천', '방문요양센터추천', '복지관추천', 
@@ -292,20 +222,10 @@ class NaverBlogPoster:
     
     def format_culture_post(self, culture_data):
         """Format culture data into a blog post"""
-        title = f"[문화프로그램] {culture_data.get('Title', culture_data.get('Name', '프로그램명 없음'))}"
+        name = culture_data.get('Title', culture_data.get('Name', '프로그램명 없음'))
+        title = f"[문화프로그램] {name}"
         
-        content = f"""
-<div style="font-family: 'Noto Sans KR', sans-serif; line-height: 1.8; padding: 20px;">
-    <h2 style="color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;">
-        🎭 {culture_data.get('Title', culture_data.get('Name', '프로그램명 없음'))}
-    </h2>
-    
-    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0;">
-        <h3 style="color: #333; margin-bottom: 15px;">📋 프로그램 정보</h3>
-        <p>노인 문화프로그램 정보를 제공합니다.</p>
-    </div>
-</div>
-"""
+        content = render_page('🎭', name, render_info_box('노인 문화프로그램 정보를 제공합니다.', '📋 프로그램 정보'))
         
         tags = ['문화프로그램', '노인여가', '시니어여가']
         
@@ -313,19 +233,10 @@ class NaverBlogPoster:
     
     def format_general_post(self, data):
         """Format general data into a blog post"""
-        title = f"[정보] {data.get('Title', data.get('Name', '제목 없음'))}"
+        name = data.get('Title', data.get('Name', '제목 없음'))
+        title = f"[정보] {name}"
         
-        content = f"""
-<div style="font-family: 'Noto Sans KR', sans-serif; line-height: 1.8; padding: 20px;">
-    <h2 style="color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;">
-        📌 {data.get('Title', data.get('Name', '제목 없음'))}
-    </h2>
-    
-    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 10px; margin: 20px 0;">
-        <p>상세 정보를 제공합니다.</p>
-    </div>
-</div>
-"""
+        content = render_page('📌', name, render_info_box('상세 정보를 제공합니다.'))
         
         tags = ['정보', '노인', '시니어']
         
@@ -335,7 +246,7 @@ class NaverBlogPoster:
         """Login to Naver"""
         try:
             # Navigate to Naver login page
-            driver.get("https://nid.naver.com/nidlogin.login?mode=form&url=https%3A%2F%2Fwww.naver.com&locale=ko_KR&svctype=1")
+            driver.get(self.LOGIN_URL)
             
             time.sleep(2)
             
@@ -367,22 +278,45 @@ class NaverBlogPoster:
             print(f"Error during login: {e}")
             return False
     
+    def open_editor(self):
+        """Open the blog editor in the persistent logged-in browser session"""
+        driver = self.session.ensure_login()
+        if driver is None:
+            return None
+        
+        blog_url = self.EDITOR_URL.format(blog_id=self.blog_id)
+        driver.get(blog_url)
+        
+        # Login again only when the session has actually expired
+        if self.session.is_login_page(driver):
+            print("Naver session expired, logging in again")
+            self.session.invalidate()
+            driver = self.session.ensure_login(force=True)
+            if driver is None:
+                return None
+            driver.get(blog_url)
+        
+        # Wait for the editor body instead of a fixed sleep
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[id^='SE-'] [contenteditable='true']"))
+            )
+        except Exception as e:
+            print(f"Editor did not finish loading in time: {e}")
+        
+        return driver
+    
     def post_to_naver_blog(self, title, content, tags, content_type):
         """Post to Naver blog using the new editor workflow"""
         driver = None
+        self.timer.start()
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            driver.implicitly_wait(10)
-            
-            # Login to Naver
-            if not self.login_naver(driver):
+            # Reuse the logged-in browser and open the editor
+            driver = self.open_editor()
+            self.timer.mark('open_editor')
+            if driver is None:
                 return False
             
-            # Navigate to blog editor
-            blog_url = f"https://blog.naver.com/{self.blog_id}/postwrite"
-            driver.get(blog_url)
-            time.sleep(5)  # Wait longer for editor to fully load
-            
             # Close help dialog
             try:
                 # Try multiple possible close button selectors
@@ -407,179 +341,44 @@ class NaverBlogPoster:
             except:
                 pass
             
-            # Input title - find by placeholder text "제목"
+            # Title and body are inserted through the editor DOM / CDP (no clipboard)
+            editor = EditorInput(driver)
+            
+            self.timer.mark('help_dialog')
+            
+            # Input title
             try:
                 print("Attempting to input title...")
+                print(f'Title to input: {repr(title)}')
                 
-                # Title is already cleaned in format_job_post method
-                title_to_use = title
-                
-                print(f'Title to input: {repr(title_to_use)}')
-                
-                # Wait for page to be fully loaded
-                time.sleep(3)
-                
-                try:
-                    # Method 1: Find element containing "제목" text using XPath
-                    title_element = driver.find_element(By.CSS_SELECTOR, "#SE-1a46ef9f-4595-4548-9376-0819dca2428f")
-                    
-                    # Get the parent element that's clickable
-                    # parent = title_element.find_element(By.XPATH, "./ancestor::*[@contenteditable='true' or contains(@class, 'se-')]")
-                    
-                    # # Click on the element
-                    # action = ActionChains(driver)
-                    # action.move_to_element(parent).pause(1).click().perform()
-                    # time.sleep(0.5)
-                    
-                    # Copy and paste title
-                    pyperclip.copy(title_element)
-                    time.sleep(0.3)
-                    pyautogui.hotkey('ctrl', 'v')
-                    time.sleep(0.5)
-                    
-                    print("제목 작성 완료 (found by text)")
-                    
-                except Exception as e:
-                    print(f"Finding title by text failed: {e}")
-                    
-                    # Method 2: Find by placeholder span containing "제목"
-                    try:
-                        title_placeholder = driver.find_element(By.XPATH, "//span[contains(@class, 'se-placeholder') and contains(text(), '제목')]")
-                        title_placeholder.click()
-                        time.sleep(0.5)
-                        
-                        pyperclip.copy(title_to_use)
-                        time.sleep(0.3)
-                        pyautogui.hotkey('ctrl', 'v')
-                        
-                        print("제목 작성 완료 (placeholder method)")
-                        
-                    except Exception as e2:
-                        print(f"Placeholder method failed: {e2}")
-                        
-                        # Method 3: Find first contenteditable
-                        try:
-                            first_editable = driver.find_element(By.CSS_SELECTOR, "div[contenteditable='true']")
-                            first_editable.click()
-                            time.sleep(0.5)
-                            
-                            pyperclip.copy(title_to_use)
-                            pyautogui.hotkey('ctrl', 'v')
-                            
-                            print("제목 작성 완료 (first contenteditable)")
-                        except:
-                            print("All title input methods failed")
-                
-                time.sleep(1)
+                if editor.fill_title(title):
+                    print("제목 작성 완료")
+                else:
+                    print("Title input could not be confirmed")
                 
             except Exception as e:
                 print(f"Error with title input: {e}")
                 import traceback
                 traceback.print_exc()
             
-            # Input content - find by placeholder text "나만의 일상을"
+            self.timer.mark('title')
+            
+            # Input content
             try:
                 print("Attempting to input content...")
                 print(f"Content preview: {content[:50]}...")
-                time.sleep(1)
-                
-                try:
-                    # Method 1: Find element containing "나만의 일상을" text using XPath
-                    content_element = driver.find_element(By.XPATH, "//*[contains(text(), '나만의 일상을')]")
-                    
-                    # Get the parent element that's clickable
-                    parent = content_element.find_element(By.XPATH, "./ancestor::*[@contenteditable='true' or contains(@class, 'se-')]")
-                    
-                    # Click on the element
-                    action = ActionChains(driver)
-                    action.move_to_element(parent).pause(1).click().perform()
-                    time.sleep(0.5)
-                    
-                    # Copy content to clipboard
-                    pyperclip.copy(content)
-                    time.sleep(0.5)
-                    
-                    # Paste content
-                    pyautogui.hotkey('ctrl', 'v')
-                    time.sleep(1)
-                    
-                    print("Content input successful (found by text)")
-                    
-                except Exception as e:
-                    print(f"Finding content by text failed: {e}")
-                    
-                    # Method 2: Find by placeholder span containing "나만의 일상을"
-                    try:
-                        content_placeholder = driver.find_element(By.XPATH, "//span[contains(@class, 'se-placeholder') and contains(text(), '나만의 일상을')]")
-                        content_placeholder.click()
-                        time.sleep(0.5)
-                        
-                        pyperclip.copy(content)
-                        time.sleep(0.3)
-                        pyautogui.hotkey('ctrl', 'v')
-                        
-                        print("Content input successful (placeholder method)")
-                        
-                    except Exception as e2:
-                        print(f"Content placeholder method failed: {e2}")
-                        
-                        # Method 3: Find second contenteditable or use Tab
-                        try:
-                            # Try to find all contenteditable divs
-                            content_editables = driver.find_elements(By.CSS_SELECTOR, "div[contenteditable='true']")
-                            
-                            if len(content_editables) > 1:
-                                # Second one should be content
-                                content_editables[1].click()
-                                time.sleep(0.5)
-                            else:
-                                # Press Tab from title to content
-                                pyautogui.press('tab')
-                                time.sleep(0.5)
-                            
-                            pyperclip.copy(content)
-                            time.sleep(0.3)
-                            pyautogui.hotkey('ctrl', 'v')
-                            
-                            print("Content input successful (contenteditable/tab method)")
-                            
-                        except Exception as e3:
-                            print(f"Alternative content method failed: {e3}")
-                            
-                            # Final fallback - JavaScript
-                            try:
-                                driver.execute_script("""
-                                    // Find element with "나만의 일상을" text
-                                    var elements = document.evaluate("//*[contains(text(), '나만의 일상을')]", 
-                                        document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
-                                    if (elements) {
-                                        var parent = elements.closest('[contenteditable="true"]');
-                                        if (parent) {
-                                            parent.focus();
-                                            parent.innerHTML = arguments[0];
-                                        }
-                                    } else {
-                                        // Fallback to second contenteditable
-                                        var editables = document.querySelectorAll('div[contenteditable="true"]');
-                                        if (editables.length > 1) {
-                                            editables[1].focus();
-                                            editables[1].innerHTML = arguments[0];
-                                        }
-                                    }
-                                """, content)
-                                print("Content input with JavaScript")
-                            except:
-                                print("All content input methods failed")
                 
-                time.sleep(1)
+                if editor.fill_body(content):
+                    print("Content input successful")
+                else:
+                    print("Content input could not be confirmed")
                 
             except Exception as e:
                 print(f"Error with content input: {e}")
                 import traceback
                 traceback.print_exc()
             
-            # Wait a bit before trying to publish
-            time.sleep(2)
+            self.timer.mark('body')
             
             # Step 1: Click publish button to open publish page
             try:
@@ -620,6 +419,8 @@ class NaverBlogPoster:
                 print(f"Error opening publish page: {e}")
                 return False
             
+            self.timer.mark('publish_dialog')
+            
             # Step 2: Click category dropdown
             try:
                 category_dropdown = WebDriverWait(driver, 10).until(
@@ -651,33 +452,22 @@ class NaverBlogPoster:
             except Exception as e:
                 print(f"Error selecting category: {e}")
             
-            # Step 4: Add tags - using pyperclip and pyautogui
+            self.timer.mark('category')
+            
+            # Step 4: Add tags
             try:
                 tag_input = WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "#tag-input"))
                 )
                 
-                # Click on tag input field
-                tag_input.click()
-                time.sleep(0.5)
-                
-                for tag in tags:
-                    # Copy tag to clipboard
-                    pyperclip.copy(tag)
-                    time.sleep(0.3)
-                    
-                    # Paste tag
-                    pyautogui.hotkey('ctrl', 'v')
-                    time.sleep(0.3)
-                    
-                    # Press Enter to add tag
-                    pyautogui.press('enter')
-                    time.sleep(0.5)
+                editor.add_tags(tag_input, tags)
                     
                 print("Tags added successfully")
             except Exception as e:
                 print(f"Error adding tags: {e}")
             
+            self.timer.mark('tags')
+            
             # Step 5: Click final publish button
             try:
                 final_publish_btn = WebDriverWait(driver, 10).until(
@@ -685,6 +475,7 @@ class NaverBlogPoster:
                 )
                 final_publish_btn.click()
                 time.sleep(3)
+                self.timer.mark('publish')
                 print(f"Successfully posted: {title}")
                 return True
             except Exception as e:
@@ -695,26 +486,31 @@ class NaverBlogPoster:
             print(f"Error posting to blog: {e}")
             return False
         finally:
+            self.timer.finish()
+            # Keep the browser open for the next post
             if driver:
-                driver.quit()
+                self.session.leave_page()
     
     def post_new_items(self, max_posts=5):
         """Check for new items and post them to Naver blog"""
         print("\n========== Starting post_new_items ==========")
         
-        new_items = self.check_new_items()
+        pending = self.check_new_items()
         
-        if not new_items:
+        if not pending:
             print("No new items to post")
             return
         
-        print(f"\n=== Found {len(new_items)} new items to post ===")
+        print(f"\n=== {pending} items waiting in the posting queue ===")
         
-        # Post only the first new item (one row at a time)
-        if new_items:
-            item_id, item_data = new_items[0]
+        # Pre-render the pending queue; unchanged items come from the cache
+        self.renderer.render_batch(self.queue.pending_items())
+        
+        # Pull the next items from the queue (nearest deadline first)
+        for item_id, item_data in self.queue.pull(max_posts):
             
             print(f"\n=== Processing item from row {item_data['RowIndex']} ===")
+            print(f"File: {item_data.get('FileName', 'Unknown')}")
             print(f"Item data keys: {item_data.keys()}")
             print(f"Title field value: {item_data.get('Title', 'NO TITLE FIELD')}")
             
@@ -732,37 +528,62 @@ class NaverBlogPoster:
                 success = self.post_to_naver_blog(title, content, tags, content_type)
                 
                 if success:
-                    # Mark as posted in CSV file
-                    self.mark_as_posted(item_data['FileName'], item_data['RowIndex'])
-                    
-                    # Also save to posted items file (optional backup)
-                    self.posted_items.add(item_id)
-                    self.save_posted_items()
+                    # Record as posted (no CSV rewrite)
+                    self.mark_as_posted(item_id, item_data)
                     
                     print(f"\n✅ Successfully posted item: {title}")
                 else:
                     print(f"\n❌ Failed to post item: {title}")
+                    self.queue.requeue(item_id, item_data)
                     
             except Exception as e:
                 print(f"\n❌ Error processing item {item_id}: {e}")
+                self.queue.requeue(item_id, item_data)
                 import traceback
                 traceback.print_exc()
     
-    def run_continuous(self, check_interval=3600):
-        """Run continuously, checking for new items periodically"""
+    def close(self):
+        """Close the browser session and the posted-state store"""
+        self.session.close()
+        self.posted_store.close()
+    
+    def run_continuous(self, check_interval=3600, watch=True, debounce=DEFAULT_DEBOUNCE):
+        """
+        Run continuously, posting when crawl output changes
+        
+        Args:
+            check_interval: fallback poll interval in seconds
+            watch: wake up as soon as a crawler finishes writing a source CSV
+            debounce: seconds without further writes before a change counts as finished
+        """
         print(f"Starting continuous posting service...")
-        print(f"Checking every {check_interval} seconds for new items")
+        
+        trigger = None
+        if watch:
+            trigger = ChangeTrigger(self.queue.watch_dirs(), debounce=debounce)
+            print(f"Posting on CSV changes, fallback check every {check_interval} seconds")
+        else:
+            print(f"Checking every {check_interval} seconds for new items")
         
         while True:
             try:
                 print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking for new items...")
-                self.post_new_items(max_posts=1)  # Post one item at a time
+                self.post_new_items(max_posts=1)
                 
-                print(f"Next check in {check_interval} seconds...")
-                time.sleep(check_interval)
+                if trigger:
+                    print(f"Waiting for new crawl output (at most {check_interval} seconds)...")
+                    changed = trigger.wait(check_interval)
+                    if changed:
+                        print(f"Changed files: {', '.join(sorted(changed))}")
+                else:
+                    print(f"Next check in {check_interval} seconds...")
+                    time.sleep(check_interval)
                 
             except KeyboardInterrupt:
                 print("\nStopping posting service...")
+                if trigger:
+                    trigger.stop()
+                self.close()
                 break
             except Exception as e:
                 print(f"Error in continuous run: {e}")
@@ -795,6 +616,7 @@ if __name__ == "__main__":
     
     # Option 1: Post new items once (one row at a time)
     poster.post_new_items(max_posts=1)
+    poster.close()
     
     # Option 2: Run continuously
     # poster.run_continuous(check_interval=3600)  # Check every hour
\ No newline at end of file
@@ -1,23 +1,40 @@
 import time
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-import json
 import os
 from datetime import datetime
 import requests
 from dotenv import load_dotenv
-import pyperclip, pyautogui
+from naver_session import NaverSession
+from editor_input import EditorInput
+from incremental_csv import NewItemDetector
+from posting_queue import PostingQueue
+from file_trigger import ChangeTrigger, DEFAULT_DEBOUNCE
+from posted_store import PostedStore
+from post_renderer import PostRenderer, render_page, render_table, render_notice
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Display names for common job columns
+JOB_COLUMN_DISPLAY_NAMES = {
+    'Title': '제목',
+    'CompanyName': '회사명',
+    'JobType': '직종',
+    'Salary': '급여',
+    'WorkHours': '근무시간',
+    'Location': '근무지',
+    'Deadline': '마감일',
+    'Contact': '연락처',
+    'Description': '상세내용'
+}
+
 class NaverBlogPoster:
-    def __init__(self, naver_id=None, naver_pw=None, blog_id=None):
+    def __init__(self, naver_id=None, naver_pw=None, blog_id=None, headless=False):
         """
         Initialize Naver Blog Poster
         
@@ -25,12 +42,22 @@ class NaverBlogPoster:
             naver_id: Naver ID for login
             naver_pw: Naver password for login
             blog_id: Naver blog ID (e.g., 'myblog' from blog.naver.com/myblog)
+            headless: run Chrome without a window (editor input does not need the clipboard)
         """
         self.naver_id = naver_id
         self.naver_pw = naver_pw
         self.blog_id = blog_id
-        self.posted_jobs_file = "posted_items.json"
-        self.posted_items = self.load_posted_items()
+        # Posted state lives in a sqlite sidecar (posted_items.json is imported once)
+        self.posted_store = PostedStore("posted_items.db", legacy_json="posted_items.json")
+        
+        # Incremental detector: re-reads only rows appended to each CSV
+        self.detector = NewItemDetector(self.make_queue_item, self.is_row_posted)
+        
+        # Unposted items from every source, nearest deadline first
+        self.queue = PostingQueue(self.detector)
+        
+        # Rendered posts cached per item content hash
+        self.renderer = PostRenderer(self.render_post)
         
         # Chrome options for Selenium
         self.chrome_options = Options()
@@ -41,115 +68,59 @@ class NaverBlogPoster:
         self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         self.chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         self.chrome_options.add_experimental_option('useAutomationExtension', False)
+        if headless:
+            self.chrome_options.add_argument('--headless=new')
+        
+        # One logged-in browser kept across posts and run_continuous cycles
+        self.session = NaverSession(self.login_naver, self.chrome_options)
         
-    def load_posted_items(self):
-        """Load already posted item IDs from file"""
-        if os.path.exists(self.posted_jobs_file):
-            try:
-                with open(self.posted_jobs_file, 'r', encoding='utf-8') as f:
-                    return set(json.load(f))
-            except:
-                return set()
-        return set()
-    
-    def save_posted_items(self):
-        """Save posted item IDs to file"""
-        with open(self.posted_jobs_file, 'w', encoding='utf-8') as f:
-            json.dump(list(self.posted_items), f, ensure_ascii=False, indent=2)
-    
     def check_new_items(self):
-        """Check for new items in CSV files that haven't been posted yet"""
+        """Refresh the posting queue from every configured CSV source"""
         print("\n=== Starting check_new_items method ===")
-        new_items = []
         
-        # Check all CSV files in current directory
-        csv_files = [f for f in os.listdir('.') if f.endswith('.csv')]
-        print(f"Found CSV files: {csv_files}")
-        
-        for csv_file in csv_files:
-            print(f"\nChecking file: {csv_file}")
-            
-            try:
-                # Try different encodings
-                encodings = ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr']
-                df = None
-                
-                for encoding in encodings:
-                    try:
-                        df = pd.read_csv(csv_file, encoding=encoding)
-                        print(f"Successfully read CSV with encoding: {encoding}")
-                        break
-                    except Exception as e:
-                        continue
-                
-                if df is None:
-                    raise Exception("Could not read CSV with any encoding")
-                
-                print(f"Total rows in CSV: {len(df)}")
-                print(f"Columns: {', '.join(df.columns.tolist())}")
-                
-                # Add 'Post' column if it doesn't exist
-                if 'Post' not in df.columns:
-                    df['Post'] = ''
-                    df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-                    print("Added 'Post' column to CSV")
-                
-                # Determine content type based on filename
-                content_type = self.get_content_type(csv_file)
-                print(f"Content type: {content_type}")
-                
-                # Find first item not yet posted
-                for idx, item in df.iterrows():
-                    if pd.isna(item.get('Post')) or str(item.get('Post')).strip().upper() != 'Y':
-                        item_dict = item.to_dict()
-                        item_dict['ContentType'] = content_type
-                        item_dict['FileName'] = csv_file
-                        item_dict['RowIndex'] = idx
-                        
-                        # Create unique item ID
-                        item_id = self.create_unique_id(item, csv_file)
-                        new_items.append((item_id, item_dict))
-                        
-                        # Only get the first unposted item from this file
-                        print(f"Found unposted item at row {idx}")
-                        break
-                        
-            except Exception as e:
-                print(f"Error reading {csv_file}: {e}")
+        # Only rows appended since the last check are parsed
+        self.queue.refresh()
         
-        print(f"\n=== Finished check_new_items, found {len(new_items)} new items ===")
-        return new_items
+        print(f"=== Finished check_new_items, {len(self.queue)} items in queue ===\n")
+        return len(self.queue)
     
-    def mark_as_posted(self, filename, row_index):
-        """Mark an item as posted by setting Post column to 'Y'"""
+    def mark_as_posted(self, item_id, item_data):
+        """Record an item as posted in the posted-state store"""
         try:
-            # Read with proper encoding
-            encodings = ['utf-8-sig', 'utf-8', 'cp949', 'euc-kr']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(filename, encoding=encoding)
-                    break
-                except:
-                    continue
-            
-            if df is None:
-                raise Exception("Could not read CSV with any encoding")
-            
-            # Add 'Post' column if it doesn't exist
-            if 'Post' not in df.columns:
-                df['Post'] = ''
-            
-            # Mark as posted
-            df.loc[row_index, 'Post'] = 'Y'
-            
-            # Save the updated CSV with UTF-8 BOM encoding
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
-            print(f"Marked row {row_index} as posted in {filename}")
+            self.posted_store.mark_posted(
+                item_id,
+                file_name=item_data['FileName'],
+                row_index=item_data['RowIndex'],
+                title=item_data.get('Title'),
+            )
+            self.detector.discard(item_data['FileName'], item_data['RowIndex'])
+            print(f"Marked row {item_data['RowIndex']} as posted in {item_data['FileName']}")
             
         except Exception as e:
-            print(f"Error updating {filename}: {e}")
+            print(f"Error updating posted state for {item_id}: {e}")
+    
+    def export_post_column(self, filename):
+        """Fill the CSV Post column from the posted-state store (on demand)"""
+        marked, total_rows = self.posted_store.export_post_column(filename, make_id=self.create_unique_id)
+        # Our own rewrite must not force a full re-read on the next check
+        self.detector.acknowledge_rewrite(filename, total_rows)
+        print(f"Exported Post column to {filename}: {marked} rows posted")
+        return marked
+    
+    def make_queue_item(self, item, csv_file, row_index):
+        """Build the (item_id, item_dict) entry for an unposted CSV row"""
+        item_dict = item.to_dict()
+        item_dict['ContentType'] = self.get_content_type(csv_file)
+        item_dict['FileName'] = csv_file
+        item_dict['RowIndex'] = row_index  # Store row index for updating later
+        return self.create_unique_id(item, csv_file), item_dict
+    
+    def is_row_posted(self, item_id, item):
+        """Check if this item has been posted (store entry or legacy Post column 'Y')"""
+        post = item.get('Post')
+        if not pd.isna(post) and str(post).strip().upper() == 'Y':
+            return True
+        return self.posted_store.is_posted(item_id)
     
     def get_content_type(self, filename):
         """Determine content type based on filename"""
@@ -165,7 +136,8 @@ class NaverBlogPoster:
     
     def create_unique_id(self, item, filename):
         """Create a unique ID for the item"""
-        id_parts = [filename]
+        # file name without its directory, so IDs from posted_items.json still match
+        id_parts = [os.path.basename(filename)]
         
         # Add relevant columns if they exist
         for col in ['Title', 'CompanyName', 'Name', 'ID', 'DateofRegistration', 'Date', 'Deadline']:
@@ -175,7 +147,11 @@ class NaverBlogPoster:
         return "_".join(id_parts)
     
     def format_post(self, item_data):
-        """Format item data into a blog post based on content type"""
+        """Format item data into a blog post (cached per item content hash)"""
+        return self.renderer.render(item_data)
+    
+    def render_post(self, item_data):
+        """Render item data into a blog post based on content type"""
         content_type = item_data.get('ContentType', 'general')
         
         if content_type == 'job':
@@ -189,51 +165,15 @@ class NaverBlogPoster:
     
     def format_job_post(self, job_data):
         """Format job data into a blog post"""
-        print("\n=== Formatting job post ===")
-        
         # Get title from CSV
         title = str(job_data.get('Title', '채용정보')).strip()
         if not title or title == 'nan':
             title = f"채용정보 #{job_data.get('RowIndex', 0) + 1}"
         
-        print(f"Title: {title}")
-        
-        # Create content from CSV data
-        content = "<div style='font-family: \"Noto Sans KR\", sans-serif; line-height: 1.8; padding: 20px;'>"
-        content += f"<h2 style='color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px; margin-bottom: 20px;'>📋 {title}</h2>"
-        content += "<table style='width: 100%; border-collapse: collapse; background-color: #f8f9fa; border-radius: 10px;'>"
-        
-        # Define display names for common columns
-        column_display_names = {
-            'Title': '제목',
-            'CompanyName': '회사명',
-            'JobType': '직종',
-            'Salary': '급여',
-            'WorkHours': '근무시간',
-            'Location': '근무지',
-            'Deadline': '마감일',
-            'Contact': '연락처',
-            'Description': '상세내용'
-        }
-        
-        # Add all CSV data as table rows
-        for key, value in job_data.items():
-            if key not in ['ContentType', 'FileName', 'RowIndex', 'Post']:
-                display_key = column_display_names.get(key, key)
-                display_value = str(value) if pd.notna(value) else '정보 없음'
-                
-                content += f"""
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>{display_key}</td>
-                    <td style='padding: 12px;'>{display_value}</td>
-                </tr>
-                """
-        
-        content += "</table>"
-        content += "<div style='margin-top: 20px; padding: 15px; background-color: #e8f4fd; border-left: 4px solid #2E86AB;'>"
-        content += "<p style='margin: 0;'>💡 <strong>문의사항이 있으시면 위 연락처로 직접 문의해주세요.</strong></p>"
-        content += "</div>"
-        content += "</div>"
+        # Create content from CSV data with display names for common columns
+        body = render_table(job_data, display_key=lambda key: JOB_COLUMN_DISPLAY_NAMES.get(key, key))
+        body += render_notice('문의사항이 있으시면 위 연락처로 직접 문의해주세요.')
+        content = render_page('📋', title, body, heading_margin=True)
         
         tags = ['노인일자리', '노인고용', '노인구직', '시니어일자리', '시니어고용', '시니어구직']
         
@@ -247,21 +187,7 @@ class NaverBlogPoster:
         
         title = f"[복지시설 정보] {title}"
         
-        content = "<div style='font-family: \"Noto Sans KR\", sans-serif; line-height: 1.8; padding: 20px;'>"
-        content += f"<h2 style='color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;'>🏥 {facility_data.get('Name', '시설명')}</h2>"
-        content += "<table style='width: 100%; border-collapse: collapse; background-color: #f8f9fa; border-radius: 10px;'>"
-        
-        for key, value in facility_data.items():
-            if key not in ['ContentType', 'FileName', 'RowIndex', 'Post']:
-                display_value = str(value) if pd.notna(value) else '정보 없음'
-                content += f"""
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>{key}</td>
-                    <td style='padding: 12px;'>{display_value}</td>
-                </tr>
-                """
-        
-        content += "</table></div>"
+        content = render_page('🏥', facility_data.get('Name', '시설명'), render_table(facility_data))
         
         tags = ['노인복지정책', '노인정책', '노인복지정보', '시니어복지정책', '시니어정책', 
                 '시니어복지정보', '장기요양기관추천', '방문요양센터추천', '복지관추천', 
@@ -277,21 +203,7 @@ class NaverBlogPoster:
             
         title = f"[문화프로그램] {title}"
         
-        content = "<div style='font-family: \"Noto Sans KR\", sans-serif; line-height: 1.8; padding: 20px;'>"
-        content += f"<h2 style='color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;'>🎭 {culture_data.get('Title', '프로그램명')}</h2>"
-        content += "<table style='width: 100%; border-collapse: collapse; background-color: #f8f9fa; border-radius: 10px;'>"
-        
-        for key, value in culture_data.items():
-            if key not in ['ContentType', 'FileName', 'RowIndex', 'Post']:
-                display_value = str(value) if pd.notna(value) else '정보 없음'
-                content += f"""
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>{key}</td>
-                    <td style='padding: 12px;'>{display_value}</td>
-                </tr>
-                """
-        
-        content += "</table></div>"
+        content = render_page('🎭', culture_data.get('Title', '프로그램명'), render_table(culture_data))
         
         tags = ['문화프로그램', '노인여가', '시니어여가']
         
@@ -300,82 +212,12 @@ class NaverBlogPoster:
     def format_general_post(self, data):
         """Format general data into a blog post"""
         title = data.get('Title', data.get('Name', '제목 없음'))
-        if not title or title == 'nan': <div style='font-family: "Noto Sans KR", sans-serif; line-height: 1.8; padding: 20px;'><h2 style='color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;'>📌 [정보] 주민대화방</h2><table style='width: 100%; border-collapse: collapse; background-color: #f8f9fa; border-radius: 10px;'>
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>City</td>
-                    <td style='padding: 12px;'>경기도 안양시</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Lecture_Category</td>
-                    <td style='padding: 12px;'>회의실 개방</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Title</td>
-                    <td style='padding: 12px;'>주민대화방</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Recruitment_period</td>
-                    <td style='padding: 12px;'>수시모집</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Education_period</td>
-                    <td style='padding: 12px;'>추후협의</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Institution</td>
-                    <td style='padding: 12px;'>범계동행정복지센터</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Address</td>
-                    <td style='padding: 12px;'>범계동 행정복지센터 1층</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Quota</td>
-                    <td style='padding: 12px;'>0/8
-(0/0)</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>State</td>
-                    <td style='padding: 12px;'>모집중</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Register</td>
-                    <td style='padding: 12px;'>방문접수</td>
-                </tr>
-                
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>Detail</td>
-                    <td style='padding: 12px;'>https://www.anyang.go.kr/reserve/eduLctreWebView.do?pageUnit=10&pageIndex=1&searchCnd=all&key=1376&searchUseAt=Y&eduLctreNo=923</td>
-                </tr>
-                </table></div>
+        if not title or title == 'nan':
             title = f"정보 #{data.get('RowIndex', 0) + 1}"
             
         title = f"[정보] {title}"
         
-        content = "<div style='font-family: \"Noto Sans KR\", sans-serif; line-height: 1.8; padding: 20px;'>"
-        content += f"<h2 style='color: #2E86AB; border-bottom: 2px solid #2E86AB; padding-bottom: 10px;'>📌 {title}</h2>"
-        content += "<table style='width: 100%; border-collapse: collapse; background-color: #f8f9fa; border-radius: 10px;'>"
-        
-        for key, value in data.items():
-            if key not in ['ContentType', 'FileName', 'RowIndex', 'Post']:
-                display_value = str(value) if pd.notna(value) else '정보 없음'
-                content += f"""
-                <tr style='border-bottom: 1px solid #ddd;'>
-                    <td style='padding: 12px; font-weight: bold; width: 30%; background-color: #e9ecef;'>{key}</td>
-                    <td style='padding: 12px;'>{display_value}</td>
-                </tr>
-                """
-        
-        content += "</table></div>"
+        content = render_page('📌', title, render_table(data))
         
         tags = ['정보', '노인', '시니어']
         
@@ -415,22 +257,43 @@ class NaverBlogPoster:
             print(f"Error during login: {e}")
             return False
     
+    def open_editor(self):
+        """Open the blog editor in the persistent logged-in browser session"""
+        driver = self.session.ensure_login()
+        if driver is None:
+            return None
+        
+        blog_url = f"https://blog.naver.com/{self.blog_id}/postwrite"
+        driver.get(blog_url)
+        
+        # Login again only when the session has actually expired
+        if self.session.is_login_page(driver):
+            print("Naver session expired, logging in again")
+            self.session.invalidate()
+            driver = self.session.ensure_login(force=True)
+            if driver is None:
+                return None
+            driver.get(blog_url)
+        
+        # Wait for the editor body instead of a fixed sleep
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[id^='SE-'] [contenteditable='true']"))
+            )
+        except Exception as e:
+            print(f"Editor did not finish loading in time: {e}")
+        
+        return driver
+    
     def post_to_naver_blog(self, title, content, tags, content_type):
         """Post to Naver blog using the new editor workflow"""
         driver = None
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            driver.implicitly_wait(10)
-            
-            # Login to Naver
-            if not self.login_naver(driver):
+            # Reuse the logged-in browser and open the editor
+            driver = self.open_editor()
+            if driver is None:
                 return False
             
-            # Navigate to blog editor
-            blog_url = f"https://blog.naver.com/{self.blog_id}/postwrite"
-            driver.get(blog_url)
-            time.sleep(5)
-            
             # Close help dialog if exists
             try:
                 close_selectors = [
@@ -453,47 +316,38 @@ class NaverBlogPoster:
             except:
                 pass
             
+            # Title and body are inserted through the editor DOM / CDP (no clipboard)
+            editor = EditorInput(driver)
+            
             # Input title
             try:
-                print("Inputting title...")
+                print("Attempting to input title...")
+                print(f'Title to input: {repr(title)}')
                 
-                # Find first contenteditable div (usually title)
-                title_element = driver.find_element(By.CSS_SELECTOR, "#SE-1a46ef9f-4595-4548-9376-0819dca2428f")
-                title_element.click()
-                time.sleep(0.5)
-                
-                # Use pyperclip to paste title
-                pyperclip.copy(title)
-                time.sleep(0.3)
-                pyautogui.hotkey('ctrl', 'v')
-                time.sleep(0.5)
-                
-                print("Title input complete")
+                if editor.fill_title(title):
+                    print("제목 작성 완료")
+                else:
+                    print("Title input could not be confirmed")
                 
             except Exception as e:
                 print(f"Error with title input: {e}")
+                import traceback
+                traceback.print_exc()
             
             # Input content
             try:
-                print("Inputting content...")
+                print("Attempting to input content...")
+                print(f"Content preview: {content[:50]}...")
                 
-                # Press Tab to move to content area
-                pyautogui.press('tab')
-                time.sleep(0.5)
-                
-                # Paste content
-                pyperclip.copy(content)
-                time.sleep(0.3)
-                pyautogui.hotkey('ctrl', 'v')
-                time.sleep(1)
-                
-                print("Content input complete")
+                if editor.fill_body(content):
+                    print("Content input successful")
+                else:
+                    print("Content input could not be confirmed")
                 
             except Exception as e:
                 print(f"Error with content input: {e}")
-            
-            # Wait before publishing
-            time.sleep(2)
+                import traceback
+                traceback.print_exc()
             
             # Step 1: Click publish button to open publish dialog
             try:
@@ -547,16 +401,7 @@ class NaverBlogPoster:
                     EC.presence_of_element_located((By.CSS_SELECTOR, "#tag-input"))
                 )
                 
-                tag_input.click()
-                time.sleep(0.5)
-                
-                for tag in tags:
-                    pyperclip.copy(tag)
-                    time.sleep(0.3)
-                    pyautogui.hotkey('ctrl', 'v')
-                    time.sleep(0.3)
-                    pyautogui.press('enter')
-                    time.sleep(0.5)
+                editor.add_tags(tag_input, tags)
                     
                 print("Tags added successfully")
             except Exception as e:
@@ -579,27 +424,28 @@ class NaverBlogPoster:
             print(f"Error posting to blog: {e}")
             return False
         finally:
+            # Keep the browser open for the next post
             if driver:
-                driver.quit()
+                self.session.leave_page()
     
     def post_new_items(self, max_posts=1):
         """Check for new items and post them to Naver blog"""
         print("\n========== Starting post_new_items ==========")
         
-        new_items = self.check_new_items()
+        pending = self.check_new_items()
         
-        if not new_items:
+        if not pending:
             print("No new items to post")
             return
         
-        print(f"\n=== Found {len(new_items)} new items to post ===")
+        print(f"\n=== {pending} items waiting in the posting queue ===")
         
-        # Post only the first new item
+        # Pre-render the pending queue; unchanged items come from the cache
+        self.renderer.render_batch(self.queue.pending_items())
+        
+        # Pull the next items from the queue (nearest deadline first)
         posts_made = 0
-        for item_id, item_data in new_items:
-            if posts_made >= max_posts:
-                break
-                
+        for item_id, item_data in self.queue.pull(max_posts):
             print(f"\n=== Processing item from {item_data['FileName']} row {item_data['RowIndex']} ===")
             
             try:
@@ -614,38 +460,63 @@ class NaverBlogPoster:
                 success = self.post_to_naver_blog(title, content, tags, content_type)
                 
                 if success:
-                    # Mark as posted in CSV file
-                    self.mark_as_posted(item_data['FileName'], item_data['RowIndex'])
-                    
-                    # Save to posted items file
-                    self.posted_items.add(item_id)
-                    self.save_posted_items()
+                    # Record as posted (no CSV rewrite)
+                    self.mark_as_posted(item_id, item_data)
                     
                     print(f"\n✅ Successfully posted: {title}")
                     posts_made += 1
                 else:
                     print(f"\n❌ Failed to post: {title}")
+                    self.queue.requeue(item_id, item_data)
                     
             except Exception as e:
                 print(f"\n❌ Error processing item: {e}")
+                self.queue.requeue(item_id, item_data)
                 import traceback
                 traceback.print_exc()
     
-    def run_continuous(self, check_interval=3600):
-        """Run continuously, checking for new items periodically"""
+    def close(self):
+        """Close the browser session and the posted-state store"""
+        self.session.close()
+        self.posted_store.close()
+    
+    def run_continuous(self, check_interval=3600, watch=True, debounce=DEFAULT_DEBOUNCE):
+        """
+        Run continuously, posting when crawl output changes
+        
+        Args:
+            check_interval: fallback poll interval in seconds
+            watch: wake up as soon as a crawler finishes writing a source CSV
+            debounce: seconds without further writes before a change counts as finished
+        """
         print(f"Starting continuous posting service...")
-        print(f"Checking every {check_interval} seconds for new items")
+        
+        trigger = None
+        if watch:
+            trigger = ChangeTrigger(self.queue.watch_dirs(), debounce=debounce)
+            print(f"Posting on CSV changes, fallback check every {check_interval} seconds")
+        else:
+            print(f"Checking every {check_interval} seconds for new items")
         
         while True:
             try:
                 print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking for new items...")
                 self.post_new_items(max_posts=1)
                 
-                print(f"Next check in {check_interval} seconds...")
-                time.sleep(check_interval)
+                if trigger:
+                    print(f"Waiting for new crawl output (at most {check_interval} seconds)...")
+                    changed = trigger.wait(check_interval)
+                    if changed:
+                        print(f"Changed files: {', '.join(sorted(changed))}")
+                else:
+                    print(f"Next check in {check_interval} seconds...")
+                    time.sleep(check_interval)
                 
             except KeyboardInterrupt:
                 print("\nStopping posting service...")
+                if trigger:
+                    trigger.stop()
+                self.close()
                 break
             except Exception as e:
                 print(f"Error in continuous run: {e}")
@@ -678,6 +549,7 @@ if __name__ == "__main__":
     
     # Option 1: Post new items once (one row at a time)
     poster.post_new_items(max_posts=1)
+    poster.close()
     
     # Option 2: Run continuously
     # poster.run_continuous(check_interval=3600)  # Check every hour
\ No newline at end of file
@@ -0,0 +1,87 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from editor_stub import StubEditorServer, LOGIN_PATH
+from posting2 import NaverBlogPoster
+
+PHASES = ['open_editor', 'help_dialog', 'title', 'body', 'publish_dialog', 'category', 'tags', 'publish', 'total']
+
+
+def stub_poster_class(stub, work_dir):
+    """NaverBlogPoster pointed at the local editor stub with throwaway state files"""
+    return type('StubBlogPoster', (NaverBlogPoster,), {
+        'LOGIN_URL': stub.login_url,
+        'LOGIN_HOST': LOGIN_PATH,
+        'HOME_URL': stub.base_url + '/',
+        'EDITOR_URL': stub.editor_url(),
+        'POSTED_DB': os.path.join(work_dir, 'posted_items.db'),
+        'PROFILE_DIR': os.path.join(work_dir, 'chrome_profile'),
+        'COOKIE_FILE': None,
+    })
+
+
+def sample_items(csv_file, count, content_type):
+    """Benchmark items from a crawled CSV (repeated if the file is short)"""
+    df = pd.read_csv(csv_file, encoding='utf-8-sig')
+    items = []
+    for i in range(count):
+        row = df.iloc[i % len(df)]
+        item_data = row.to_dict()
+        item_data['ContentType'] = content_type
+        item_data['FileName'] = csv_file
+        item_data['RowIndex'] = i % len(df)
+        items.append(item_data)
+    return items
+
+
+def print_report(records, elapsed, published):
+    """Per-phase latency table (ms) and overall throughput"""
+    frame = pd.DataFrame(records).reindex(columns=PHASES) * 1000
+    print(f"\n{'phase':<16}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>10}")
+    for phase in PHASES:
+        values = frame[phase].dropna().to_numpy()
+        if not len(values):
+            continue
+        print(f"{phase:<16}{values.mean():>10.0f}{np.percentile(values, 50):>10.0f}"
+              f"{np.percentile(values, 95):>10.0f}{values.max():>10.0f}")
+    failed = sum(1 for record in records if not record.get('ok', True))
+    print(f"\nPosts: {len(records)}, failed: {failed}, published by stub: {published}")
+    print(f"Elapsed: {elapsed:.1f}s, throughput: {len(records) / elapsed * 60:.1f} posts/min")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure posting latency against the local editor stub")
+    parser.add_argument('--csv', default='new/seoul_job.csv', help='CSV file used for sample posts')
+    parser.add_argument('--content-type', default='job')
+    parser.add_argument('--posts', type=int, default=5)
+    parser.add_argument('--layer-delay', type=int, default=0, help='ms before the publish layer opens')
+    parser.add_argument('--show-browser', action='store_true', help='do not run Chrome headless')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='posting_benchmark_')
+    stub = StubEditorServer(layer_delay=args.layer_delay).start()
+    poster = stub_poster_class(stub, work_dir)(
+        naver_id='benchmark', naver_pw='benchmark', blog_id='benchmark',
+        headless=not args.show_browser,
+    )
+
+    items = sample_items(args.csv, args.posts, args.content_type)
+    print(f"Posting {len(items)} items to {stub.editor_url('benchmark')}")
+    started = time.perf_counter()
+    try:
+        for item_data in items:
+            title, content, tags = poster.format_post(item_data)
+            ok = poster.post_to_naver_blog(title, content, tags, args.content_type)
+            poster.timer.records[-1]['ok'] = ok
+        elapsed = time.perf_counter() - started
+        print_report(poster.timer.records, elapsed, len(stub.posts))
+    finally:
+        poster.close()
+        stub.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,175 @@
+import glob
+import heapq
+import itertools
+import os
+
+import pandas as pd
+
+from job_normalize import parse_job_dates, parse_period_end
+
+# 게시 대상 소스 (glob 패턴, 콘텐츠 타입)
+DEFAULT_SOURCES = [
+    ('new/*.csv', 'job'),
+    ('update/*.csv', 'job'),
+    ('*_education.csv', 'culture'),
+    ('*_lecture*.csv', 'culture'),
+    ('cultural_lectures.csv', 'culture'),
+    ('suwon_lecutre.csv', 'culture'),
+    ('hospital.csv', 'facility'),
+]
+
+# 마감일이 없는 항목(채용시까지, 시설 정보)은 마감일이 있는 항목 뒤에 들어온 순서대로
+NO_DEADLINE = 1
+WITH_DEADLINE = 0
+
+
+def deadlines_for(items):
+    """새로 큐에 들어온 항목들의 마감일을 한 번에 파싱 (없으면 NaT)"""
+    frame = pd.DataFrame([item_data for _, item_data in items])
+    if 'Deadline' in frame.columns:
+        registration = frame.get('DateOfRegistration', pd.Series('', index=frame.index))
+        return parse_job_dates(registration, frame['Deadline'])['DeadlineDate']
+    if 'Recruitment_period' in frame.columns:
+        return parse_period_end(frame['Recruitment_period'])
+    return pd.Series(pd.NaT, index=frame.index)
+
+
+class PostingQueue:
+    """
+    One priority queue of unposted items across every configured CSV source
+
+    Sources are refreshed through the NewItemDetector, so each refresh only
+    parses appended rows. Items are kept in a heap ordered by nearest deadline
+    first (items without a deadline follow in arrival order), and pull(n)
+    pops the next n items in O(log n) each. Each content type has its own
+    heap so a worker can pull only the types its blog posts. Heap entries
+    are removed lazily: posted, rewritten or expired rows are skipped when
+    they reach the top.
+    """
+
+    def __init__(self, detector, sources=DEFAULT_SOURCES, skip_expired=True):
+        self.detector = detector
+        self.sources = sources
+        self.skip_expired = skip_expired
+        self.heaps = {}
+        self.entries = {}
+        self.counter = itertools.count()
+
+    def source_files(self):
+        """(csv file, content type) for every file matched by the sources"""
+        seen = set()
+        for pattern, content_type in self.sources:
+            for path in sorted(glob.glob(pattern)):
+                path = os.path.normpath(path)
+                # 엑셀이 열어 둔 잠금 파일(~$...) 제외
+                if os.path.basename(path).startswith('~$'):
+                    continue
+                if path not in seen:
+                    seen.add(path)
+                    yield path, content_type
+
+    def watch_dirs(self):
+        """Directories the sources live in (for the file-change trigger)"""
+        return sorted({os.path.dirname(pattern) or '.' for pattern, _ in self.sources})
+
+    def refresh(self, exclude=()):
+        """
+        Pick up new rows from every source; returns the number of items added
+
+        Item IDs in exclude (e.g. pulled and still being posted) are not
+        queued again when a rewritten file is reloaded.
+        """
+        added_count = 0
+        for path, content_type in self.source_files():
+            try:
+                added = [(item_id, item_data) for item_id, item_data in self.detector.check_added(path)
+                         if item_id not in exclude and not self._is_queued(item_id, item_data)]
+            except Exception as e:
+                print(f"Error reading {path}: {e}")
+                continue
+            if not added:
+                continue
+
+            deadlines = deadlines_for(added)
+            for (item_id, item_data), deadline in zip(added, deadlines):
+                item_data['ContentType'] = content_type
+                self.push(item_id, item_data, deadline)
+            added_count += len(added)
+
+        if added_count:
+            print(f"Posting queue: {added_count} new items, {len(self)} pending")
+        return added_count
+
+    def push(self, item_id, item_data, deadline=pd.NaT):
+        if pd.isna(deadline):
+            key = (NO_DEADLINE, 0)
+        else:
+            key = (WITH_DEADLINE, pd.Timestamp(deadline).toordinal())
+        # 같은 항목이 다시 들어오면 이전 힙 항목은 seq 가 달라져 무효가 됨
+        seq = next(self.counter)
+        self.entries[item_id] = (key, seq, item_data)
+        heap = self.heaps.setdefault(item_data.get('ContentType', 'general'), [])
+        heapq.heappush(heap, (key, seq, item_id))
+
+    def _is_queued(self, item_id, item_data):
+        """Already queued from the same file row (a full reload re-adds every row)"""
+        entry = self.entries.get(item_id)
+        return (entry is not None and entry[2]['FileName'] == item_data['FileName']
+                and entry[2]['RowIndex'] == item_data['RowIndex'])
+
+    def _is_valid(self, item_id, seq):
+        entry = self.entries.get(item_id)
+        if entry is None or entry[1] != seq:
+            return False
+        item_data = entry[2]
+        if self.detector.is_pending(item_data['FileName'], item_data['RowIndex'], item_id):
+            return True
+        # 게시되었거나 파일이 다시 쓰이며 사라진 행
+        del self.entries[item_id]
+        return False
+
+    def _next_heap(self, content_types):
+        """Heap whose top item comes first among the requested content types"""
+        heaps = [heap for content_type, heap in self.heaps.items()
+                 if heap and (content_types is None or content_type in content_types)]
+        return min(heaps, key=lambda heap: heap[0], default=None)
+
+    def pull(self, n=1, today=None, content_types=None, exclude=()):
+        """
+        Pop the next n items (nearest deadline first), optionally only some content types
+
+        Items whose ID is in exclude are dropped instead of returned.
+        """
+        today = (today or pd.Timestamp.now()).toordinal()
+        items = []
+        expired = 0
+        while len(items) < n:
+            heap = self._next_heap(content_types)
+            if heap is None:
+                break
+            key, seq, item_id = heapq.heappop(heap)
+            if not self._is_valid(item_id, seq):
+                continue
+            _, _, item_data = self.entries.pop(item_id)
+            # 다른 워커가 게시 중인 항목 - 실패하면 그쪽에서 다시 큐에 넣음
+            if item_id in exclude:
+                continue
+            if self.skip_expired and key[0] == WITH_DEADLINE and key[1] < today:
+                expired += 1
+                continue
+            items.append((item_id, item_data))
+        if expired:
+            print(f"Skipped {expired} items past their deadline")
+        return items
+
+    def requeue(self, item_id, item_data):
+        """Put a pulled item back (e.g. after a failed post), keeping its priority"""
+        deadline = deadlines_for([(item_id, item_data)]).iloc[0]
+        self.push(item_id, item_data, deadline)
+
+    def pending_items(self):
+        """Snapshot of the queued items (unordered)"""
+        return [(item_id, item_data) for item_id, (_, _, item_data) in self.entries.items()]
+
+    def __len__(self):
+        return len(self.entries)
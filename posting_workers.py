@@ -0,0 +1,236 @@
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from file_trigger import ChangeTrigger, DEFAULT_DEBOUNCE
+from posting2 import NaverBlogPoster
+
+load_dotenv()
+
+DEFAULT_CONFIG_FILE = "posting_workers.json"
+# 설정 파일이 없을 때 - 콘텐츠 타입별 블로그 (BLOG_ID_JOB 등 환경 변수)
+DEFAULT_WORKERS = [
+    {'name': 'job', 'content_types': ['job']},
+    {'name': 'facility', 'content_types': ['facility']},
+    {'name': 'culture', 'content_types': ['culture', 'general']},
+]
+# 실패한 항목은 이 횟수까지만 다시 큐에 넣음
+MAX_ATTEMPTS = 3
+
+
+class RateLimiter:
+    """Minimum interval between posts plus a rolling per-hour cap"""
+
+    def __init__(self, min_interval=60, max_per_hour=None):
+        self.min_interval = min_interval
+        self.max_per_hour = max_per_hour
+        self.history = deque()
+
+    def delay(self, now=None):
+        """Seconds to wait before the next post is allowed"""
+        now = now or time.monotonic()
+        while self.history and now - self.history[0] >= 3600:
+            self.history.popleft()
+        wait = 0.0
+        if self.history:
+            wait = self.min_interval - (now - self.history[-1])
+        if self.max_per_hour and len(self.history) >= self.max_per_hour:
+            wait = max(wait, 3600 - (now - self.history[0]))
+        return max(wait, 0.0)
+
+    def record(self):
+        self.history.append(time.monotonic())
+
+
+class PostingCoordinator:
+    """
+    Shared posting queue for several blog workers
+
+    claim() hands out the next item for a worker's content types and ack()
+    reports the result: on success the item is recorded in the posted store
+    and dropped from the detector, on failure it goes back to the queue (up to
+    MAX_ATTEMPTS). Both run under one lock, and items still in flight are
+    neither handed out again nor re-queued by refresh(), so an item is never
+    posted by two workers at once.
+    """
+
+    def __init__(self, posted_store, detector, queue):
+        self.posted_store = posted_store
+        self.detector = detector
+        self.queue = queue
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.attempts = {}
+        self.stats = {'posted': 0, 'failed': 0, 'dropped': 0}
+
+    def refresh(self):
+        with self.lock:
+            return self.queue.refresh(exclude=self.in_flight)
+
+    def claim(self, worker_name, content_types):
+        """Next item for the worker, or None if nothing is queued for its types"""
+        with self.lock:
+            items = self.queue.pull(1, content_types=content_types, exclude=self.in_flight)
+            if not items:
+                return None
+            item_id, item_data = items[0]
+            self.in_flight[item_id] = worker_name
+            return item_id, item_data
+
+    def ack(self, item_id, item_data, success):
+        """Report a claimed item as posted or failed"""
+        with self.lock:
+            worker_name = self.in_flight.pop(item_id, None)
+            if success:
+                self.posted_store.mark_posted(
+                    item_id,
+                    file_name=item_data['FileName'],
+                    row_index=item_data['RowIndex'],
+                    title=item_data.get('Title'),
+                )
+                self.detector.discard(item_data['FileName'], item_data['RowIndex'])
+                self.attempts.pop(item_id, None)
+                self.stats['posted'] += 1
+                return
+
+            self.stats['failed'] += 1
+            attempts = self.attempts.get(item_id, 0) + 1
+            self.attempts[item_id] = attempts
+            if attempts < MAX_ATTEMPTS:
+                self.queue.requeue(item_id, item_data)
+            else:
+                print(f"[{worker_name}] Giving up on {item_id} after {attempts} attempts")
+                self.stats['dropped'] += 1
+
+    def pending(self):
+        with self.lock:
+            return len(self.queue)
+
+
+class BlogWorker(threading.Thread):
+    """
+    One blog account with its own browser profile, posting items of its content types
+
+    Every worker has an isolated Chrome profile and cookie file, so the
+    logins of different accounts never mix.
+    """
+
+    def __init__(self, coordinator, name, blog_id, naver_id, naver_pw, content_types,
+                 min_interval=60, max_per_hour=None, headless=True, idle_wait=30):
+        super().__init__(name=f"blog-worker-{name}", daemon=True)
+        self.coordinator = coordinator
+        self.worker_name = name
+        self.content_types = set(content_types)
+        self.limiter = RateLimiter(min_interval, max_per_hour)
+        self.idle_wait = idle_wait
+        self.stop_event = threading.Event()
+
+        poster_class = type(f"{name.title()}BlogPoster", (NaverBlogPoster,), {
+            'PROFILE_DIR': f"chrome_profile_{name}",
+            'COOKIE_FILE': f"naver_cookies_{name}.json",
+        })
+        self.poster = poster_class(naver_id=naver_id, naver_pw=naver_pw, blog_id=blog_id, headless=headless)
+
+    def log(self, message):
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] [{self.worker_name}] {message}")
+
+    def run(self):
+        self.log(f"Started for {self.poster.blog_id} ({', '.join(sorted(self.content_types))})")
+        try:
+            while not self.stop_event.is_set():
+                delay = self.limiter.delay()
+                if delay > 0:
+                    self.stop_event.wait(delay)
+                    continue
+
+                claimed = self.coordinator.claim(self.worker_name, self.content_types)
+                if claimed is None:
+                    self.stop_event.wait(self.idle_wait)
+                    continue
+
+                item_id, item_data = claimed
+                success = False
+                try:
+                    title, content, tags = self.poster.format_post(item_data)
+                    self.log(f"Posting: {title}")
+                    success = self.poster.post_to_naver_blog(title, content, tags, item_data['ContentType'])
+                except Exception as e:
+                    self.log(f"Error posting {item_id}: {e}")
+                self.coordinator.ack(item_id, item_data, success)
+                self.limiter.record()
+                self.log("✅ Posted" if success else "❌ Failed")
+        finally:
+            self.poster.close()
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def load_worker_config(config_file=DEFAULT_CONFIG_FILE):
+    """
+    Worker settings from posting_workers.json, e.g.
+        [{"name": "job", "blog_id": "myjobs", "content_types": ["job"],
+          "min_interval": 300, "max_per_hour": 6}]
+    Credentials come from NAVER_ID_<NAME>/NAVER_PW_<NAME> (or NAVER_ID/NAVER_PW).
+    """
+    if os.path.exists(config_file):
+        with open(config_file, 'r', encoding='utf-8') as f:
+            workers = json.load(f)
+    else:
+        workers = [dict(w, blog_id=os.getenv(f"BLOG_ID_{w['name'].upper()}")) for w in DEFAULT_WORKERS]
+
+    configured = []
+    for worker in workers:
+        suffix = worker['name'].upper()
+        worker.setdefault('naver_id', os.getenv(f"NAVER_ID_{suffix}", os.getenv('NAVER_ID')))
+        worker.setdefault('naver_pw', os.getenv(f"NAVER_PW_{suffix}", os.getenv('NAVER_PW')))
+        if not all([worker.get('blog_id'), worker['naver_id'], worker['naver_pw']]):
+            print(f"Skipping worker {worker['name']}: missing blog ID or credentials")
+            continue
+        configured.append(worker)
+    return configured
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Post to several Naver blogs in parallel from one queue")
+    parser.add_argument('--config', default=DEFAULT_CONFIG_FILE)
+    parser.add_argument('--check-interval', type=int, default=3600, help='fallback queue refresh interval')
+    parser.add_argument('--debounce', type=int, default=DEFAULT_DEBOUNCE)
+    parser.add_argument('--show-browser', action='store_true')
+    args = parser.parse_args()
+
+    configs = load_worker_config(args.config)
+    if not configs:
+        print("No workers configured")
+        exit(1)
+
+    # 큐/감지기/게시 기록은 브라우저를 띄우지 않는 poster 하나의 것을 공유
+    source = NaverBlogPoster()
+    coordinator = PostingCoordinator(source.posted_store, source.detector, source.queue)
+    coordinator.refresh()
+    print(f"{coordinator.pending()} items in the posting queue")
+
+    workers = [BlogWorker(coordinator, headless=not args.show_browser, **config) for config in configs]
+    for worker in workers:
+        worker.start()
+
+    trigger = ChangeTrigger(coordinator.queue.watch_dirs(), debounce=args.debounce)
+    try:
+        while True:
+            trigger.wait(args.check_interval)
+            coordinator.refresh()
+            print(f"Queue: {coordinator.pending()} pending, stats: {coordinator.stats}")
+    except KeyboardInterrupt:
+        print("\nStopping workers...")
+        trigger.stop()
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join()
+        coordinator.posted_store.close()
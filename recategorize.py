@@ -0,0 +1,112 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+import pandas as pd
+
+from jobcategory2 import compile_keyword_rules, recategorize_frame
+from job_normalize import add_salary_columns, add_date_columns
+from region_index import add_region_columns
+from csv_encoding import detect_encoding
+
+# 워커 프로세스마다 한 번만 받아두는 컴파일된 규칙
+_worker_rules = None
+
+
+def _init_worker(rules):
+    """워커 초기화 - 컴파일된 규칙을 프로세스당 한 번만 전달받음"""
+    global _worker_rules
+    _worker_rules = rules
+
+
+def _process_chunk(chunk_index, chunk):
+    """워커에서 청크 하나를 재분류/정규화하고 처리 시간을 함께 반환"""
+    started = time.perf_counter()
+    result = recategorize_frame(chunk, _worker_rules)
+    result = add_salary_columns(result)
+    result = add_date_columns(result)
+    result = add_region_columns(result)
+    elapsed = time.perf_counter() - started
+    return chunk_index, result, os.getpid(), len(chunk), elapsed
+
+
+def recategorize_csv(input_file, output_file, workers=None, chunksize=2000):
+    """CSV를 청크로 나눠 프로세스 풀에서 재분류하고 원래 순서대로 저장"""
+    workers = workers or os.cpu_count() or 1
+    rules = compile_keyword_rules()
+
+    print(f"Recategorizing {input_file} with {workers} workers (chunksize={chunksize})")
+    wall_started = time.perf_counter()
+
+    results = {}
+    worker_stats = {}
+    total_rows = 0
+
+    reader = pd.read_csv(input_file, encoding=detect_encoding(input_file), chunksize=chunksize)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rules,)) as executor:
+        pending = set()
+        for chunk_index, chunk in enumerate(reader):
+            # 메모리 사용을 제한하기 위해 워커 수의 2배까지만 미리 제출
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    total_rows += _collect(future, results, worker_stats)
+            pending.add(executor.submit(_process_chunk, chunk_index, chunk))
+
+        for future in pending:
+            total_rows += _collect(future, results, worker_stats)
+
+    if not results:
+        print("No rows to recategorize.")
+        return None
+
+    # 청크 순서대로 재조립
+    df = pd.concat([results[i] for i in sorted(results)], ignore_index=True)
+    df.to_csv(output_file, index=False, encoding='utf-8-sig', lineterminator='\n')
+
+    wall_elapsed = time.perf_counter() - wall_started
+    print_throughput(total_rows, wall_elapsed, worker_stats)
+    print(f"Saved {len(df)} rows to {output_file}")
+    return df
+
+
+def _collect(future, results, worker_stats):
+    """완료된 청크 결과를 모으고 워커별 통계를 누적"""
+    chunk_index, result, pid, rows, elapsed = future.result()
+    results[chunk_index] = result
+    stats = worker_stats.setdefault(pid, {"rows": 0, "seconds": 0.0, "chunks": 0})
+    stats["rows"] += rows
+    stats["seconds"] += elapsed
+    stats["chunks"] += 1
+    return rows
+
+
+def print_throughput(total_rows, wall_elapsed, worker_stats):
+    """워커별 처리량(rows/s)과 전체 처리량 출력"""
+    print("\n=== Throughput ===")
+    busy_total = 0.0
+    for pid, stats in sorted(worker_stats.items()):
+        busy_total += stats["seconds"]
+        rate = stats["rows"] / stats["seconds"] if stats["seconds"] > 0 else 0
+        print(f"Worker {pid}: {stats['rows']} rows in {stats['chunks']} chunks, {rate:,.0f} rows/s")
+
+    overall = total_rows / wall_elapsed if wall_elapsed > 0 else 0
+    print(f"Total: {total_rows} rows in {wall_elapsed:.2f}s, {overall:,.0f} rows/s")
+    if wall_elapsed > 0 and worker_stats:
+        # 실제로 병렬 처리된 정도 (워커 busy 시간 합 / 경과 시간)
+        print(f"Effective parallelism: {busy_total / wall_elapsed:.2f} / {len(worker_stats)} workers")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recategorize merged job data in parallel")
+    parser.add_argument('--input', default='job_data.csv', help='input CSV file')
+    parser.add_argument('--output', default=None, help='output CSV file')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (default: CPU count)')
+    parser.add_argument('--chunksize', type=int, default=2000, help='rows per chunk')
+    args = parser.parse_args()
+
+    output = args.output or f"job_data_recategorized_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    recategorize_csv(args.input, output, workers=args.workers, chunksize=args.chunksize)
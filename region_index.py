@@ -0,0 +1,266 @@
+import re
+from collections import namedtuple
+
+import pandas as pd
+
+# 시/도 → 시/군/구 → (일반구) 행정구역 테이블
+# (시도 코드, 정식 명칭, 별칭, 시군구 목록)
+# 시군구 항목이 튜플이면 (시 이름, [일반구 목록]) 이다.
+# 시도 코드는 행정표준코드 앞 두 자리를 따르고, 시군구/일반구 번호는 목록 순서(1부터)이다.
+# 번호가 바뀌지 않도록 새 항목은 목록 끝에만 추가할 것.
+REGION_TABLE = [
+    (11, '서울특별시', ['서울시', '서울'], [
+        '종로구', '중구', '용산구', '성동구', '광진구', '동대문구', '중랑구', '성북구', '강북구',
+        '도봉구', '노원구', '은평구', '서대문구', '마포구', '양천구', '강서구', '구로구', '금천구',
+        '영등포구', '동작구', '관악구', '서초구', '강남구', '송파구', '강동구',
+    ]),
+    (26, '부산광역시', ['부산시', '부산'], [
+        '중구', '서구', '동구', '영도구', '부산진구', '동래구', '남구', '북구', '해운대구',
+        '사하구', '금정구', '강서구', '연제구', '수영구', '사상구', '기장군',
+    ]),
+    (27, '대구광역시', ['대구시', '대구'], [
+        '중구', '동구', '서구', '남구', '북구', '수성구', '달서구', '달성군', '군위군',
+    ]),
+    (28, '인천광역시', ['인천시', '인천'], [
+        '중구', '동구', '미추홀구', '연수구', '남동구', '부평구', '계양구', '서구', '강화군', '옹진군',
+    ]),
+    (29, '광주광역시', ['광주'], [
+        '동구', '서구', '남구', '북구', '광산구',
+    ]),
+    (30, '대전광역시', ['대전시', '대전'], [
+        '동구', '중구', '서구', '유성구', '대덕구',
+    ]),
+    (31, '울산광역시', ['울산시', '울산'], [
+        '중구', '남구', '동구', '북구', '울주군',
+    ]),
+    (36, '세종특별자치시', ['세종시', '세종'], []),
+    (41, '경기도', ['경기'], [
+        ('수원시', ['장안구', '권선구', '팔달구', '영통구']),
+        ('성남시', ['수정구', '중원구', '분당구']),
+        '의정부시',
+        ('안양시', ['만안구', '동안구']),
+        ('부천시', ['원미구', '소사구', '오정구']),
+        '광명시', '평택시', '동두천시',
+        ('안산시', ['상록구', '단원구']),
+        ('고양시', ['덕양구', '일산동구', '일산서구']),
+        '과천시', '구리시', '남양주시', '오산시', '시흥시', '군포시', '의왕시', '하남시',
+        ('용인시', ['처인구', '기흥구', '수지구']),
+        '파주시', '이천시', '안성시', '김포시', '화성시', '광주시', '양주시', '포천시', '여주시',
+        '연천군', '가평군', '양평군',
+    ]),
+    (51, '강원특별자치도', ['강원도', '강원'], [
+        '춘천시', '원주시', '강릉시', '동해시', '태백시', '속초시', '삼척시', '홍천군', '횡성군',
+        '영월군', '평창군', '정선군', '철원군', '화천군', '양구군', '인제군', '고성군', '양양군',
+    ]),
+    (43, '충청북도', ['충북'], [
+        ('청주시', ['상당구', '서원구', '흥덕구', '청원구']),
+        '충주시', '제천시', '보은군', '옥천군', '영동군', '증평군', '진천군', '괴산군', '음성군', '단양군',
+    ]),
+    (44, '충청남도', ['충남'], [
+        ('천안시', ['동남구', '서북구']),
+        '공주시', '보령시', '아산시', '서산시', '논산시', '계룡시', '당진시', '금산군', '부여군',
+        '서천군', '청양군', '홍성군', '예산군', '태안군',
+    ]),
+    (52, '전북특별자치도', ['전라북도', '전북'], [
+        ('전주시', ['완산구', '덕진구']),
+        '군산시', '익산시', '정읍시', '남원시', '김제시', '완주군', '진안군', '무주군', '장수군',
+        '임실군', '순창군', '고창군', '부안군',
+    ]),
+    (46, '전라남도', ['전남'], [
+        '목포시', '여수시', '순천시', '나주시', '광양시', '담양군', '곡성군', '구례군', '고흥군',
+        '보성군', '화순군', '장흥군', '강진군', '해남군', '영암군', '무안군', '함평군', '영광군',
+        '장성군', '완도군', '진도군', '신안군',
+    ]),
+    (47, '경상북도', ['경북'], [
+        ('포항시', ['남구', '북구']),
+        '경주시', '김천시', '안동시', '구미시', '영주시', '영천시', '상주시', '문경시', '경산시',
+        '의성군', '청송군', '영양군', '영덕군', '청도군', '고령군', '성주군', '칠곡군', '예천군',
+        '봉화군', '울진군', '울릉군',
+    ]),
+    (48, '경상남도', ['경남'], [
+        ('창원시', ['의창구', '성산구', '마산합포구', '마산회원구', '진해구']),
+        '진주시', '통영시', '사천시', '김해시', '밀양시', '거제시', '양산시', '의령군', '함안군',
+        '창녕군', '고성군', '남해군', '하동군', '산청군', '함양군', '거창군', '합천군',
+    ]),
+    (50, '제주특별자치도', ['제주도', '제주'], [
+        '제주시', '서귀포시',
+    ]),
+]
+
+# 다른 시도의 시군구와 이름이 같은 시도 별칭 (광주시 = 경기도 광주시 또는 광주광역시)
+# 바로 뒤 토큰이 그 시도의 시군구일 때만 시도로 인정하고, 아니면 시군구로 해석
+CONTEXTUAL_SIDO_ALIASES = {'광주시': '광주광역시'}
+
+# 읍/면/동(법정동의 '1가' 포함) 토큰
+DONG_PATTERN = re.compile(r'^[가-힣][가-힣0-9·]*(?:읍|면|동|동\d*가|\d+가)$')
+# 주소 토큰 구분자 (공백, 쉼표, 괄호)
+TOKEN_SPLIT_PATTERN = re.compile(r'[\s,()]+')
+SPAN_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+Region = namedtuple('Region', ['sido', 'sigungu', 'district', 'dong', 'code'])
+EMPTY_REGION = Region('', '', '', '', 0)
+
+# 일괄 변환 결과 컬럼
+REGION_COLUMNS = ['Sido', 'Sigungu', 'District', 'Dong', 'RegionCode']
+
+
+class RegionNode:
+    """행정구역 트라이의 노드 (시/도, 시/군/구, 일반구)"""
+
+    def __init__(self, name, code, parent=None):
+        self.name = name
+        self.code = code
+        self.parent = parent
+        self.children = {}
+
+    def add(self, name, code, aliases=()):
+        node = RegionNode(name, code, self)
+        for key in (name, *aliases):
+            self.children[key] = node
+        return node
+
+
+class RegionIndex:
+    """시/도 → 시/군/구 → 일반구 트라이로 주소를 지역 코드로 변환
+
+    지역 코드는 시도(2자리) * 100000 + 시군구 번호 * 100 + 일반구 번호 이므로
+    code // 100000 은 시도, code // 100 은 시군구 단위 비교에 쓸 수 있다.
+    읍/면/동은 이름만 추출하고 코드에는 포함하지 않는다.
+    """
+
+    def __init__(self, table=REGION_TABLE):
+        self.root = RegionNode('', 0)
+        # 시도 없이 시군구부터 시작하는 주소용 역인덱스 (이름 → 노드 목록)
+        self.sigungu_by_name = {}
+
+        for sido_code, sido_name, aliases, sigungu_list in table:
+            sido = self.root.add(sido_name, sido_code * 100000, aliases)
+            for number, entry in enumerate(sigungu_list, start=1):
+                if isinstance(entry, tuple):
+                    name, districts = entry
+                else:
+                    name, districts = entry, []
+                sigungu = sido.add(name, sido.code + number * 100)
+                self.sigungu_by_name.setdefault(name, []).append(sigungu)
+                for district_number, district in enumerate(districts, start=1):
+                    sigungu.add(district, sigungu.code + district_number)
+
+        self._cache = {}
+
+    def resolve(self, address, default_sido=None):
+        """주소 문자열 하나를 Region으로 변환 (해석 불가 시 EMPTY_REGION)
+
+        default_sido 를 주면 시도가 생략된 주소를 그 시도 안에서 해석한다.
+        """
+        if not isinstance(address, str) or not address.strip():
+            return EMPTY_REGION
+        cache_key = (address, default_sido)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        tokens = [t for t in TOKEN_SPLIT_PATTERN.split(SPAN_TAG_PATTERN.sub(' ', address)) if t]
+        position = 0
+        sido = sigungu = district = None
+
+        contextual = self.root.children.get(CONTEXTUAL_SIDO_ALIASES.get(tokens[0])) if tokens else None
+        if tokens and tokens[0] in self.root.children:
+            sido = self.root.children[tokens[0]]
+            position = 1
+        elif contextual is not None and len(tokens) > 1 and tokens[1] in contextual.children:
+            sido = contextual
+            position = 1
+        elif default_sido:
+            sido = self.root.children.get(default_sido)
+
+        if position < len(tokens):
+            token = tokens[position]
+            if sido is not None:
+                sigungu = sido.children.get(token)
+            else:
+                # 시도가 생략된 주소는 시군구 이름이 전국에서 유일할 때만 인정
+                candidates = self.sigungu_by_name.get(token, [])
+                if len(candidates) == 1:
+                    sigungu = candidates[0]
+                    sido = sigungu.parent
+            if sigungu is not None:
+                position += 1
+
+        if sigungu is not None and position < len(tokens) and tokens[position] in sigungu.children:
+            district = sigungu.children[tokens[position]]
+            position += 1
+
+        dong = ''
+        if sido is not None:
+            # 도로명 뒤에 괄호로 붙는 동 이름까지 살펴봄
+            for token in tokens[position:position + 4]:
+                if DONG_PATTERN.match(token):
+                    dong = token
+                    break
+
+        deepest = district or sigungu or sido
+        if deepest is None:
+            region = EMPTY_REGION
+        else:
+            region = Region(
+                sido.name,
+                sigungu.name if sigungu else '',
+                district.name if district else '',
+                dong,
+                deepest.code,
+            )
+        self._cache[cache_key] = region
+        return region
+
+    def resolve_column(self, addresses, default_sido=None):
+        """주소 Series 전체를 한 번에 변환 - 고유 주소만 해석한 뒤 다시 펼침"""
+        addresses = addresses.fillna('').astype(str)
+        codes, uniques = pd.factorize(addresses)
+        resolved = [self.resolve(address, default_sido) for address in uniques]
+        frame = pd.DataFrame(resolved, columns=REGION_COLUMNS)
+        result = frame.iloc[codes].reset_index(drop=True)
+        result.index = addresses.index
+        result['RegionCode'] = result['RegionCode'].astype('int64')
+        return result
+
+
+_region_index = None
+
+
+def get_region_index():
+    """모듈 전체에서 한 번만 만드는 RegionIndex"""
+    global _region_index
+    if _region_index is None:
+        _region_index = RegionIndex()
+    return _region_index
+
+
+def resolve_address(address, default_sido=None):
+    """주소 하나를 Region으로 변환"""
+    return get_region_index().resolve(address, default_sido)
+
+
+def category_from_address(address, default="Not found", default_sido=None):
+    """주소에서 Category(시/군/구 이름)를 추출
+
+    행정구역 테이블로 해석되지 않으면 기존처럼 두 번째 토큰을 사용한다.
+    """
+    region = resolve_address(address, default_sido)
+    if region.sigungu:
+        return region.sigungu
+    if region.sido:
+        return region.sido
+    parts = SPAN_TAG_PATTERN.sub(' ', address).split() if isinstance(address, str) else []
+    if len(parts) >= 2:
+        return parts[1]
+    return default
+
+
+def add_region_columns(df, column='Address', default_sido=None):
+    """주소 컬럼을 일괄 변환해 Sido/Sigungu/District/Dong/RegionCode 컬럼 추가"""
+    if column not in df.columns:
+        return df
+    df = df.copy()
+    regions = get_region_index().resolve_column(df[column], default_sido)
+    for name in REGION_COLUMNS:
+        df[name] = regions[name]
+    return df
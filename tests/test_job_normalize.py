@@ -0,0 +1,21 @@
+import pandas as pd
+
+from job_normalize import parse_period_end, parse_period_start
+
+
+def test_period_start_and_end():
+    values = pd.Series(['2025-04-28 ~ 2025-05-17', '2025.06.05\n~2025.06.08'])
+    assert list(parse_period_start(values).dt.strftime('%Y-%m-%d')) == ['2025-04-28', '2025-06-05']
+    assert list(parse_period_end(values).dt.strftime('%Y-%m-%d')) == ['2025-05-17', '2025-06-08']
+
+
+def test_period_korean_dates():
+    values = pd.Series(['2025년 06월 10일 10시 00분 ~ 2025년 06월 13일'])
+    assert parse_period_start(values).iloc[0] == pd.Timestamp('2025-06-10')
+    assert parse_period_end(values).iloc[0] == pd.Timestamp('2025-06-13')
+
+
+def test_period_missing_values():
+    values = pd.Series(['', None, '상시모집'])
+    assert parse_period_start(values).isna().all()
+    assert parse_period_end(values).isna().all()
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import pytest
+
+from kb_sj_lecture import SangjuEducationCrawler
+
+LIST_URL = 'https://www.sangju.go.kr/reserve/list.tc?mn=1234&pageIndex=1'
+VIEW_URL = 'https://www.sangju.go.kr/reserve/view.tc'
+
+
+@pytest.fixture
+def sangju():
+    crawler = SangjuEducationCrawler.__new__(SangjuEducationCrawler)
+    crawler.detail_template = None
+    crawler.detail_sample = None
+    crawler.driver = SimpleNamespace(current_url=LIST_URL)
+    return crawler
+
+
+def link(script):
+    return {'href': script, 'onclick': None, 'data': {}}
+
+
+def test_call_arguments(sangju):
+    assert sangju.call_arguments("javascript:fnView('A12', \"7\", 3, -1);") == ['A12', '7', '3', '-1']
+    assert sangju.call_arguments("fnView('', 5)") == ['', '5']
+    assert sangju.call_arguments('javascript:;') == []
+    assert sangju.call_arguments(None) == []
+
+
+def test_detail_template_builds_urls_for_other_sections(sangju):
+    sangju.learn_detail_template(link("javascript:fnDetail('101', 'E')"),
+                                 f'{VIEW_URL}?mn=1234&mode=view&lectureNo=101&type=E')
+    # 한 번 클릭으로는 고정 파라미터를 구별할 수 없음
+    assert sangju.detail_template is None
+
+    sangju.learn_detail_template(link("javascript:fnDetail('102', 'S')"),
+                                 f'{VIEW_URL}?mn=1234&mode=view&lectureNo=102&type=S')
+    assert sangju.detail_template[1] == {'lectureNo': 'href0', 'type': 'href1'}
+
+    other = link("javascript:fnDetail('205', 'E')")
+    assert sangju.resolve_detail_url(other) == f'{VIEW_URL}?mn=1234&mode=view&lectureNo=205&type=E'
+
+
+def test_detail_template_refuses_untraceable_parameters(sangju):
+    sangju.learn_detail_template(link("javascript:fnDetail('101')"), f'{VIEW_URL}?lectureNo=101&seq=9')
+    # seq 는 강좌마다 다른데 링크 값으로 설명되지 않음
+    sangju.learn_detail_template(link("javascript:fnDetail('102')"), f'{VIEW_URL}?lectureNo=102&seq=4')
+    assert sangju.detail_template is None
@@ -0,0 +1,32 @@
+import pytest
+
+from kk_sn_lecture import SeongnamEducationCrawler, find_row_list, learn_template
+
+
+@pytest.fixture
+def seongnam():
+    return SeongnamEducationCrawler.__new__(SeongnamEducationCrawler)
+
+
+def test_learn_template():
+    row = {'title': '요가교실', 'begin': '2024.03.01', 'end': '2024.05.31', 'fee': 0, 'seq': 1}
+    assert learn_template('요가교실', row) == '{title}'
+    assert learn_template('2024.03.01 ~ 2024.05.31', row) == '{begin} ~ {end}'
+    assert learn_template('https://www.seongnam.go.kr/view.do?title=요가교실', row) \
+        == 'https://www.seongnam.go.kr/view.do?title={title}'
+    assert learn_template('접수중', row) is None
+    assert learn_template('', row) is None
+
+
+def test_find_row_list():
+    payload = {'meta': {'tags': [{'a': 1}]}, 'data': {'list': [{'title': 'A'}, {'title': 'B'}], 'total': 2}}
+    assert find_row_list(payload) == (('data', 'list'), [{'title': 'A'}, {'title': 'B'}])
+    assert find_row_list({'total': 0}) == (None, [])
+
+
+def test_detail_url_needs_an_http_template(seongnam):
+    request = {'rows': [{'id': '7', 'title': '요가교실'}]}
+    assert seongnam.detail_url_usable(request, {'Detail': 'https://www.seongnam.go.kr/view.do?id={id}'})
+    assert not seongnam.detail_url_usable(request, {'Detail': 'javascript:fnView({id})'})
+    assert not seongnam.detail_url_usable(request, {'Detail': 'https://www.seongnam.go.kr/list.do#{id}'})
+    assert not seongnam.detail_url_usable(request, {'Title': '{title}'})
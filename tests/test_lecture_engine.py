@@ -0,0 +1,110 @@
+import json
+import time
+
+import pytest
+
+from lecture_engine import LISTING_MAX_AGE, NOT_FOUND, Field, ListingIndex, LectureCrawler, SiteSpec, \
+    UrlPagination, save_lectures
+
+
+class FakeDetail:
+    fields = {'Address': Field('#address'), 'Fee': Field('#fee')}
+
+
+def make_spec(tmp_path, detail=None):
+    return SiteSpec(
+        name='test', start_url='https://example.com/list?page=1', row_selector='tr',
+        fields={'Title': Field('a'), 'Detail': Field('a', attr='href'), 'State': Field('td')},
+        columns=['Title', 'State', 'Address', 'Fee', 'Detail'], output=str(tmp_path / 'test_education.csv'),
+        pagination=UrlPagination('page'), dedupe_on=['Title', 'Education_period'], detail=detail,
+    )
+
+
+def row(title='요가', state='접수중', detail='https://example.com/view?id=1'):
+    return {'Title': title, 'State': state, 'Detail': detail}
+
+
+def test_signature_key_and_list_hash(tmp_path):
+    listing = ListingIndex(str(tmp_path / 'listing.json'), make_spec(tmp_path))
+    key, list_hash = listing.signature(row())
+    # 키는 목록에 있는 dedupe 열 + Detail, 해시는 모든 목록 열
+    assert listing.signature(row(state='마감'))[0] == key
+    assert listing.signature(row(state='마감'))[1] != list_hash
+    assert listing.signature(row(detail='https://example.com/view?id=2'))[0] != key
+    # 공백 차이와 상세 페이지에서 읽은 열은 무시
+    assert listing.signature(dict(row(title=' 요가 '), Address='주민센터')) == (key, list_hash)
+
+
+def test_unchanged_after_remember_and_save(tmp_path):
+    spec = make_spec(tmp_path)
+    filename = str(tmp_path / 'listing.json')
+    listing = ListingIndex(filename, spec)
+    signature = listing.signature(row())
+    assert not listing.unchanged(signature)
+
+    listing.remember(1, 'fingerprint', [signature])
+    listing.save()
+    assert listing.unchanged(signature)
+    assert not listing.unchanged(listing.signature(row(state='마감')))
+
+    reloaded = ListingIndex(filename, spec)
+    assert reloaded.unchanged(signature)
+    assert reloaded.page_unchanged(1, 'fingerprint')
+    assert not ListingIndex(filename, spec, reset=True).unchanged(signature)
+
+
+def test_entries_expire(tmp_path):
+    listing = ListingIndex(str(tmp_path / 'listing.json'), make_spec(tmp_path))
+    signature = listing.signature(row())
+    listing.remember(1, 'fingerprint', [signature])
+    listing.rows[signature[0]]['time'] = time.time() - LISTING_MAX_AGE - 1
+    assert not listing.unchanged(signature)
+
+
+def test_reset_is_shared_with_other_shards(tmp_path):
+    spec = make_spec(tmp_path)
+    filename = str(tmp_path / 'listing.json')
+    first = ListingIndex(filename, spec)
+    first.remember(1, 'a', [first.signature(row())])
+    first.save()
+
+    second = ListingIndex(filename, spec)
+    second.reset()
+    assert not second.unchanged(second.signature(row()))
+
+    # 다른 분할 크롤은 다음 저장 때 초기화를 알게 됨
+    first.save()
+    assert not first.unchanged(first.signature(row()))
+    with open(filename, encoding='utf-8') as f:
+        assert json.load(f)['rows'] == {}
+
+
+def test_only_rows_with_a_completed_detail_page_count(tmp_path):
+    crawler = LectureCrawler.__new__(LectureCrawler)
+    crawler.spec = make_spec(tmp_path, detail=FakeDetail())
+    complete = {'Title': '요가', 'Address': '주민센터', 'Fee': '무료'}
+    assert crawler.is_complete({'_detail_read': True}, complete)
+    assert not crawler.is_complete({}, complete)
+    assert crawler.is_complete({'_detail_read': True}, dict(complete, Fee=NOT_FOUND))
+
+    crawler.spec = make_spec(tmp_path)
+    assert crawler.is_complete({}, {'Title': '요가'})
+
+
+def test_save_lectures_reports_an_overwrite(tmp_path):
+    filename = str(tmp_path / 'test_education.csv')
+    calls = []
+    assert save_lectures(filename, [row()], ['Detail'], lambda: calls.append(1)) == 1
+    assert save_lectures(filename, [row(detail='https://example.com/view?id=2')], ['Detail'],
+                         lambda: calls.append(1)) == 2
+    assert calls == []
+
+    with open(filename, 'wb') as f:
+        f.write(b'\xff\xfe\x00broken')
+    assert save_lectures(filename, [row()], ['Detail'], lambda: calls.append(1)) == 1
+    assert calls == [1]
+
+
+@pytest.mark.parametrize('rows', [[], None])
+def test_save_lectures_nothing_to_save(tmp_path, rows):
+    assert save_lectures(str(tmp_path / 'x.csv'), rows, ['Detail']) == 0
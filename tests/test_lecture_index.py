@@ -0,0 +1,84 @@
+import pandas as pd
+
+from lecture_index import LectureIndex, normalize_key_text, normalize_lectures
+
+
+def lectures(**columns):
+    size = max(len(values) for values in columns.values() if isinstance(values, list))
+    return pd.DataFrame({name: values if isinstance(values, list) else [values] * size
+                         for name, values in columns.items()})
+
+
+def test_key_text_strips_status_tags_only():
+    assert normalize_key_text('[모집중] 밤빛정원') == normalize_key_text('밤빛정원 [마감]')
+    assert normalize_key_text('【접수중】 ＡＢＣ 요가') == normalize_key_text('abc요가')
+    assert normalize_key_text('<b>밤빛정원</b>') == '밤빛정원'
+    assert normalize_key_text('[일월수목원] 목요식물교실') != normalize_key_text('[영흥수목원] 목요식물교실')
+    assert normalize_key_text('[오전반] 글쓰기') != normalize_key_text('[오후반] 글쓰기')
+
+
+def test_session_prefixes_keep_separate_keys():
+    df = lectures(
+        City='경기도 수원시',
+        Title=['[일월수목원] 수수자연학교 - 목요식물교실', '[영흥수목원] 수수자연학교 - 목요식물교실',
+               '[오전반] 문학아카데미', '[오후반] 문학아카데미'],
+        Education_period='2025-04-10 ~ 2025-05-22',
+        Address=['일월수목원', '영흥수목원', '수원시글로벌평생학습관', '수원시글로벌평생학습관'],
+        Detail=[f'https://www.suwon.go.kr/view.do?eduMstSeq={i}' for i in range(4)],
+    )
+    assert len(normalize_lectures(df, 'suwon_lecutre.csv')) == 4
+
+
+def test_same_key_in_one_file_is_split_by_detail():
+    df = lectures(Title='요가교실', Institution='주민센터', Education_period='2025-05-01 ~ 2025-06-30',
+                  Detail=['https://example.com/view?id=1', 'https://example.com/view?id=2'])
+    assert normalize_lectures(df, 'incheon_seogu_education.csv')['LectureKey'].nunique() == 2
+
+
+def test_same_lecture_on_two_sites_shares_a_key():
+    first = lectures(Title=['[모집중] 요가교실'], Institution=['주민센터'], Education_period=['2025-05-01 ~ 2025-06-30'],
+                     Detail=['https://a.example.com/1'])
+    second = lectures(Title=['요가교실'], Institution=['주민센터'], Education_period=['2025.05.01~2025.06.30'],
+                      Detail=['https://b.example.com/9'])
+    assert (normalize_lectures(first, 'a_education.csv')['LectureKey'].iloc[0]
+            == normalize_lectures(second, 'b_education.csv')['LectureKey'].iloc[0])
+
+
+def test_regions_are_canonical():
+    seogu = normalize_lectures(lectures(City='인천 서구', Title=['요가', '탁구'],
+                                        Address=['가정1동 행정복지센터', '서구 가정로 1']),
+                               'incheon_seogu_education.csv')
+    assert list(seogu['City']) == ['인천광역시 서구'] * 2
+    assert list(seogu['Sido']) == ['인천광역시'] * 2
+
+    # City 열이 없으면 출처의 지역, 주소가 해석되면 주소의 지역
+    donggu = normalize_lectures(lectures(Title=['요가', '탁구'], Address=['주민행복센터 3층', '경북 상주시 남문1길 5']),
+                                'incheon_donggu_education.csv')
+    assert list(donggu['City']) == ['인천광역시 동구', '경상북도 상주시']
+
+    fifty = normalize_lectures(lectures(Title=['인지강화 교육'], Institution=['노원센터']), 'cultural_lectures.csv')
+    assert (fifty['City'].iloc[0], fifty['Sido'].iloc[0]) == ('서울특별시', '서울특별시')
+
+
+def test_missing_values_and_empty_titles():
+    df = lectures(Title=['요가', 'Not found'], Fees=['무료', '5000'], Lecture_Category=['건강', '취미'])
+    result = normalize_lectures(df, 'anyang_lectures.csv')
+    assert len(result) == 1
+    assert (result['Fee'].iloc[0], result['Category'].iloc[0]) == ('무료', '건강')
+
+
+def test_find_by_any_region_spelling(tmp_path):
+    csv_file = tmp_path / 'yeonsu_education.csv'
+    lectures(City='인천시 연수구', Title=['요가', '탁구'], Recruitment_period='2025-05-01 ~ 2025-05-20',
+             Category=['글로벌', '행복']).to_csv(csv_file, index=False, encoding='utf-8-sig')
+    index = LectureIndex(str(tmp_path / 'index.db'))
+    assert index.ingest_file(str(csv_file)) == 2
+    assert index.ingest_file(str(csv_file)) == 0
+
+    for city in ['인천광역시', '인천', '연수구', '인천 연수구', '인천광역시 연수구']:
+        assert len(index.find(city=city)) == 2
+    assert len(index.find(city='서구')) == 0
+    assert len(index.find(category='행복')) == 1
+    assert len(index.find(recruiting_on='2025-05-10')) == 2
+    assert len(index.find(recruiting_on='2025-05-21')) == 0
+    index.close()
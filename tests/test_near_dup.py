@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from near_dup import NearDuplicateIndex
+
+
+def jobs(*titles):
+    return pd.DataFrame({
+        'Title': list(titles),
+        'JobDescription': ['요양보호사 주5일 근무'] * len(titles),
+        'CompanyName': ['행복요양원'] * len(titles),
+        'Detail': [f'https://www.work.go.kr/detail?no={i}' for i in range(len(titles))],
+    })
+
+
+def test_signature_similarity():
+    index = NearDuplicateIndex()
+    a = index.signature('[수지 풍덕천동] 요양보호사 구인')
+    b = index.signature('[수지 풍덕천동] 요양보호사 구인합니다')
+    c = index.signature('물류센터 상하차 아르바이트')
+    assert index.similarity(a, a) == 1.0
+    assert index.similarity(a, b) > index.similarity(a, c)
+
+
+def test_check_new_flags_without_dropping():
+    index = NearDuplicateIndex()
+    checked = index.check_new(jobs('요양보호사 구인 (주5일)', '요양보호사 구인 (주 5일)', '조리원 모집'))
+    assert len(checked) == 3
+    assert checked['DuplicateOf'].iloc[0] == ''
+    assert checked['DuplicateOf'].iloc[1] == 'https://www.work.go.kr/detail?no=0'
+    assert checked['Similarity'].iloc[1] >= index.threshold
+    assert len(index) == 3
+
+
+def test_save_and_load_round_trip(tmp_path):
+    filename = str(tmp_path / 'index.npz')
+    index = NearDuplicateIndex(threshold=0.8)
+    index.check_new(jobs('요양보호사 구인', '요양보호사 구인합니다', '조리원 모집'))
+    index.save(filename)
+
+    loaded = NearDuplicateIndex.load(filename)
+    assert loaded.threshold == 0.8
+    assert set(loaded.signatures) == set(index.signatures)
+    for key, signature in index.signatures.items():
+        assert np.array_equal(loaded.signatures[key], signature)
+    assert sorted(map(sorted, loaded.clusters())) == sorted(map(sorted, index.clusters()))
+    # 저장 파일은 pickle 이 아닌 배열만 담음
+    with np.load(filename, allow_pickle=False) as data:
+        assert set(data.files) == {'params', 'threshold', 'keys', 'signatures'}
+
+
+def test_load_missing_or_broken_file(tmp_path):
+    broken = tmp_path / 'broken.npz'
+    broken.write_bytes(b'not an index')
+    assert len(NearDuplicateIndex.load(str(broken))) == 0
+    assert len(NearDuplicateIndex.load(str(tmp_path / 'missing.npz'))) == 0
+
+
+def test_same_posting_at_another_list_position_is_not_a_duplicate(tmp_path):
+    url = ('https://www.work.go.kr/empInfo/empInfoSrch/detail/empDetailAuthView.do'
+           '?searchInfoType=VALIDATION&callPage=detail&wantedAuthNo=KJAE002505280002&rtnTarget=list{}')
+    first = jobs('요양보호사 구인', '조리원 모집')
+    first['Detail'] = [url.format(3), 'https://example.com/detail?no=1&rtnTarget=list4']
+    index = NearDuplicateIndex()
+    index.check_new(first)
+
+    # 다음 크롤링에서 같은 공고가 목록의 다른 위치에 나옴
+    again = first.copy()
+    again['Detail'] = [url.format(7), 'https://example.com/detail?no=1&rtnTarget=list9']
+    checked = index.check_new(again)
+    assert list(checked['DuplicateOf']) == ['', '']
+    assert len(index) == 2
+
+
+def test_old_url_keys_are_merged_on_load(tmp_path):
+    filename = str(tmp_path / 'index.npz')
+    index = NearDuplicateIndex()
+    signature = index.signature('요양보호사 구인')
+    for position in (1, 2):
+        index.add(f'https://www.work.go.kr/detail?wantedAuthNo=KJAE0001&rtnTarget=list{position}', signature)
+    index.save(filename)
+    assert list(NearDuplicateIndex.load(filename).signatures) == ['wantedAuthNo=KJAE0001']
@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+import pytest
+
+from incremental_csv import NewItemDetector
+from posted_store import PostedStore
+from posting_queue import PostingQueue
+from posting_workers import PostingCoordinator
+
+
+def write_jobs(path, titles):
+    pd.DataFrame({'Title': titles, 'Deadline': ['2099-12-31'] * len(titles)}).to_csv(
+        path, index=False, encoding='utf-8-sig')
+
+
+@pytest.fixture
+def setup(tmp_path):
+    csv_file = str(tmp_path / 'seoul_job.csv')
+    write_jobs(csv_file, ['요양보호사', '조리원'])
+    store = PostedStore(str(tmp_path / 'posted.db'), legacy_json=None)
+
+    def make_item(row, path, row_index):
+        item = row.to_dict()
+        item.update(FileName=path, RowIndex=row_index)
+        return f"{os.path.basename(path)}_{row['Title']}", item
+
+    detector = NewItemDetector(make_item, lambda item_id, row: store.is_posted(item_id))
+    queue = PostingQueue(detector, sources=[(csv_file, 'job')])
+    coordinator = PostingCoordinator(store, detector, queue)
+    yield coordinator, csv_file
+    store.close()
+
+
+def test_claim_hands_each_item_to_one_worker(setup):
+    coordinator, _ = setup
+    assert coordinator.refresh() == 2
+    first = coordinator.claim('a', {'job'})
+    second = coordinator.claim('b', {'job'})
+    assert {first[0], second[0]} == {'seoul_job.csv_요양보호사', 'seoul_job.csv_조리원'}
+    assert coordinator.claim('c', {'job'}) is None
+    assert coordinator.claim('d', {'culture'}) is None
+
+
+def test_rewrite_does_not_requeue_items_in_flight(setup):
+    coordinator, csv_file = setup
+    coordinator.refresh()
+    item_id, item_data = coordinator.claim('a', {'job'})
+
+    # 크롤러가 파일을 다시 씀 → 전체 다시 읽기
+    write_jobs(csv_file, ['요양보호사', '조리원', '경비원'])
+    coordinator.refresh()
+    claimed = [coordinator.claim('b', {'job'}) for _ in range(3)]
+    assert item_id not in [claimed_item[0] for claimed_item in claimed if claimed_item]
+    assert claimed[-1] is None
+
+    coordinator.ack(item_id, item_data, success=True)
+    assert coordinator.posted_store.is_posted(item_id)
+    assert coordinator.stats['posted'] == 1
+
+
+def test_failed_items_are_retried_then_dropped(setup):
+    coordinator, csv_file = setup
+    write_jobs(csv_file, ['요양보호사'])
+    coordinator.refresh()
+    item_id, item_data = coordinator.claim('a', {'job'})
+    for _ in range(2):
+        coordinator.ack(item_id, item_data, success=False)
+        assert coordinator.claim('a', {'job'})[0] == item_id
+    coordinator.ack(item_id, item_data, success=False)
+    assert coordinator.stats == {'posted': 0, 'failed': 3, 'dropped': 1}
+    assert not coordinator.posted_store.is_posted(item_id)
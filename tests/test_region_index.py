@@ -0,0 +1,37 @@
+import pytest
+
+from region_index import EMPTY_REGION, RegionIndex
+
+
+@pytest.fixture(scope='module')
+def index():
+    return RegionIndex()
+
+
+def test_full_address(index):
+    region = index.resolve('경기도 수원시 장안구 정자동 123')
+    assert (region.sido, region.sigungu, region.district, region.dong) == ('경기도', '수원시', '장안구', '정자동')
+
+
+def test_aliases_and_default_sido(index):
+    assert index.resolve('인천 서구 가정로 1')[:2] == ('인천광역시', '서구')
+    assert index.resolve('인천시 연수구')[:2] == ('인천광역시', '연수구')
+    assert index.resolve('서구 가정로 1', default_sido='인천광역시')[:2] == ('인천광역시', '서구')
+
+
+def test_sigungu_without_sido_must_be_unique(index):
+    assert index.resolve('평택시 비전동')[:2] == ('경기도', '평택시')
+    # 서구는 여러 광역시에 있음
+    assert index.resolve('서구 가정로 1') == EMPTY_REGION
+
+
+def test_gwangju_si_is_gyeonggi_unless_a_gwangju_district_follows(index):
+    assert index.resolve('광주시 오포읍 신현로 1')[:2] == ('경기도', '광주시')
+    assert index.resolve('광주시 서구 상무대로 1')[:2] == ('광주광역시', '서구')
+    assert index.resolve('광주 북구 용봉동')[:2] == ('광주광역시', '북구')
+
+
+def test_unresolvable(index):
+    assert index.resolve('주민행복센터 3층 대강당') == EMPTY_REGION
+    assert index.resolve('') == EMPTY_REGION
+    assert index.resolve(None) == EMPTY_REGION